@@ -0,0 +1 @@
+"""Benchmarks for typstpy, runnable offline with the standard library only."""
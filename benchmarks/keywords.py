@@ -0,0 +1,124 @@
+"""Compare compiled keyword prefixes with per-call kebab-case spelling.
+
+The generic path filters defaults against ``__kwdefaults__`` and spells every
+key with ``str.replace`` on each call, as the protocols did before keywords
+were compiled at decoration time.
+
+Run with ``python -m benchmarks.keywords [--number N] [--repeat R]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / 'src'
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from benchmarks.micro import non_default  # noqa: E402
+from typstpy import subpar  # noqa: E402
+from typstpy._core import Implement  # noqa: E402
+from typstpy._core.render import render_value  # noqa: E402
+from typstpy.std import page, par, text  # noqa: E402
+
+
+def generic_keywords(func: Callable[..., object], kwargs: dict[str, object]) -> str:
+    """Render keywords the way the protocols did before compilation."""
+    defaults = func.__kwdefaults__ or {}
+    return ', '.join(
+        f'{key.replace("_", "-")}: {render_value(value)}'
+        for key, value in kwargs.items()
+        if value != defaults[key]
+    )
+
+
+def compiled_keywords(func: Callable[..., object], kwargs: dict[str, object]) -> str:
+    """Render keywords through the prefixes compiled by `implement`."""
+    return ', '.join(Implement.permanent[func].compiled.render_keywords(kwargs))  # type: ignore[union-attr]
+
+
+def build_workloads() -> dict[str, tuple[Callable[..., object], dict[str, object]]]:
+    """Return functions with many keywords, each with every keyword set to a non-default value.
+
+    Keywords with declared choices get another allowed value, so the compiled
+    path validates them as it does for real calls.
+    """
+    workloads = {}
+    for func in (text, page, par, subpar.grid):
+        choices = Implement.permanent[func].choices
+        workloads[func.__name__ if func is not subpar.grid else 'subpar.grid'] = (
+            func,
+            {
+                key: non_default(default, choices.get(key))
+                for key, default in (func.__kwdefaults__ or {}).items()
+            },
+        )
+    return workloads
+
+
+def peak_bytes_per_call(
+    render: Callable[..., str], func: Callable[..., object], kwargs: dict[str, object]
+) -> int:
+    """Return the peak of memory allocated while rendering once, in bytes."""
+    render(func, kwargs)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        render(func, kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - baseline
+
+
+def time_ns_per_call(
+    render: Callable[..., str],
+    func: Callable[..., object],
+    kwargs: dict[str, object],
+    number: int,
+    repeat: int,
+) -> float:
+    """Return the best observed time per call, in nanoseconds."""
+    best = min(
+        timeit.repeat(lambda: render(func, kwargs), number=number, repeat=repeat)
+    )
+    return best * 1e9 / number
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=20_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(
+        f'{"function":<12} {"keys":>4} {"compiled ns":>12} {"generic ns":>11} '
+        f'{"compiled B":>11} {"generic B":>10}'
+    )
+    for name, (func, kwargs) in build_workloads().items():
+        if compiled_keywords(func, kwargs) != generic_keywords(func, kwargs):
+            raise AssertionError(f'compiled keywords differ for {name}')
+        fast, slow = (
+            time_ns_per_call(render, func, kwargs, args.number, args.repeat)
+            for render in (compiled_keywords, generic_keywords)
+        )
+        fast_bytes, slow_bytes = (
+            peak_bytes_per_call(render, func, kwargs)
+            for render in (compiled_keywords, generic_keywords)
+        )
+        print(
+            f'{name:<12} {len(kwargs):>4} {fast:>12.0f} {slow:>11.0f} '
+            f'{fast_bytes:>11} {slow_bytes:>10}'
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
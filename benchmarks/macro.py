@@ -0,0 +1,207 @@
+"""Build and render large documents shaped like production reports.
+
+Every scenario runs in a fresh interpreter, so its peak RSS is not inflated by
+earlier ones. Each scenario is measured at every ``--scale``; comparing the
+time per unit across scales shows whether it grows linearly.
+
+Run with ``python -m benchmarks.macro [--scenario NAME ...] [--scale S ...]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import NamedTuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / 'src'
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from typstpy import Document, deferred, subpar  # noqa: E402
+from typstpy.std import block, figure, heading, image, pad, par, table  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+
+class Scenario(NamedTuple):
+    units: int
+    """The number of cells, figures, levels or paragraphs at scale 1."""
+    build: Callable[[int], Document]
+
+
+class Result(NamedTuple):
+    units: int
+    seconds: float
+    peak_rss: int
+    """Peak resident set size of the process in bytes, or the traced peak where `resource` is unavailable."""
+    output_bytes: int
+
+
+def _table(units: int) -> Document:
+    document = Document()
+    document.add_content(
+        table(*(f'[{i}]' for i in range(units)), columns=8, stroke='0.5pt')
+    )
+    return document
+
+
+def _figures(units: int) -> Document:
+    document = Document()
+    for i in range(units):
+        document.add_content(
+            figure(
+                image(f'"images/{i}.png"', width='80%'),
+                caption=f'[Measurement {i}]',
+            )
+        )
+    return document
+
+
+def _nesting(units: int) -> Document:
+    body = '[Innermost]'
+    for i in range(units):
+        body = block(body, inset='2pt') if i % 2 else pad(body, x='1em')
+    document = Document()
+    document.add_content(body)
+    return document
+
+
+def _nesting_deferred(units: int) -> Document:
+    with deferred():
+        return _nesting(units)
+
+
+def _paragraphs(units: int) -> Document:
+    document = Document()
+    for i in range(units):
+        if i % 10 == 0:
+            document.add_content(heading(f'[Section {i // 10}]', level=2))
+        document.add_content(par(f'[Paragraph {i} of the report.]', justify=True))
+    return document
+
+
+def _gallery(units: int) -> Document:
+    document = Document()
+    document.add_content(
+        subpar.grid(
+            *(
+                figure(image(f'"gallery/{i}.png"'), caption=f'[View {i}]')
+                for i in range(units)
+            ),
+            columns=4,
+            caption='[Gallery]',
+        )
+    )
+    return document
+
+
+SCENARIOS: dict[str, Scenario] = {
+    'table': Scenario(200_000, _table),
+    'figures': Scenario(5_000, _figures),
+    'nesting': Scenario(2_000, _nesting),
+    'nesting-deferred': Scenario(2_000, _nesting_deferred),
+    'paragraphs': Scenario(100_000, _paragraphs),
+    'gallery': Scenario(1_000, _gallery),
+}
+
+
+class _ByteCounter:
+    """Text stream that only counts the UTF-8 bytes written to it."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def write(self, text: str, /) -> int:
+        self.count += len(text.encode())
+        return len(text)
+
+
+def _peak_rss() -> int:
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+    return usage if sys.platform == 'darwin' else usage * 1024
+
+
+def run_scenario(name: str, scale: float = 1.0) -> Result:
+    """Build and render a scenario in the current process.
+
+    Args:
+        name: The key of the scenario in `SCENARIOS`.
+        scale: The multiplier applied to the scenario's units. Defaults to 1.0.
+
+    Returns:
+        The measurements of the run.
+    """
+    scenario = SCENARIOS[name]
+    units = max(1, round(scenario.units * scale))
+    if resource is None:
+        tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        counter = _ByteCounter()
+        scenario.build(units).render_into(counter)
+        seconds = time.perf_counter() - start
+        peak = (
+            _peak_rss() if resource is not None else tracemalloc.get_traced_memory()[1]
+        )
+    finally:
+        if resource is None:
+            tracemalloc.stop()
+    return Result(units, seconds, peak, counter.count)
+
+
+def run_isolated(name: str, scale: float = 1.0) -> Result:
+    """Run a scenario in a fresh interpreter and return its measurements."""
+    output = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.macro', '--child', name, str(scale)],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return Result(*json.loads(output))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--scenario', nargs='+', choices=SCENARIOS, default=list(SCENARIOS)
+    )
+    parser.add_argument('--scale', nargs='+', type=float, default=[1.0])
+    parser.add_argument(
+        '--child', nargs=2, metavar=('NAME', 'SCALE'), help=argparse.SUPPRESS
+    )
+    args = parser.parse_args(argv)
+
+    if args.child is not None:
+        name, scale = args.child
+        print(json.dumps(run_scenario(name, float(scale))))
+        return 0
+
+    print(
+        f'{"scenario":<17} {"units":>8} {"seconds":>8} {"us/unit":>8} '
+        f'{"peak MiB":>9} {"output MiB":>11}'
+    )
+    for name in args.scenario:
+        for scale in args.scale:
+            result = run_isolated(name, scale)
+            print(
+                f'{name:<17} {result.units:>8} {result.seconds:>8.3f} '
+                f'{result.seconds * 1e6 / result.units:>8.2f} '
+                f'{result.peak_rss / 2**20:>9.1f} {result.output_bytes / 2**20:>11.2f}'
+            )
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,264 @@
+"""Time every registered std and subpar function with three argument sets.
+
+Each function is called with its required arguments only (``defaults``), with
+a few keywords set (``typical``) and with every keyword it accepts set to a
+non-default value (``worst``). The suite records ns/call and the peak bytes
+allocated per call, saves them as a JSON baseline and compares a later run
+against it.
+
+Run with ``python -m benchmarks.micro [--filter TEXT] [--save PATH]
+[--compare PATH] [--threshold RATIO]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import Any, NamedTuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / 'src'
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from typstpy._core import Implement  # noqa: E402
+from typstpy._docs import function_qualname, iter_registered_functions  # noqa: E402
+
+CASES = ('defaults', 'typical', 'worst')
+
+_PLACEHOLDER = '[x]'
+
+_REQUIRED_ARGUMENTS: dict[str, tuple[object, ...]] = {
+    'std.color.map': ('turbo',),
+    'std.rgb': ('"#ffffff"',),
+}
+"""Required arguments of functions that reject the generic placeholder."""
+
+_TYPICAL_KEYWORDS = 3
+_TYPICAL_CHILDREN = 4
+_WORST_CHILDREN = 16
+
+
+class Case(NamedTuple):
+    args: tuple[object, ...]
+    kwargs: dict[str, object]
+
+
+class Measurement(NamedTuple):
+    ns: float
+    bytes: int
+
+
+def _required_arguments(func: Callable[..., Any], qualname: str) -> tuple[object, ...]:
+    if qualname in _REQUIRED_ARGUMENTS:
+        return _REQUIRED_ARGUMENTS[qualname]
+    return tuple(
+        _PLACEHOLDER
+        for parameter in inspect.signature(func).parameters.values()
+        if parameter.kind
+        in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+        and parameter.default is parameter.empty
+    )
+
+
+def _accepts_children(func: Callable[..., Any]) -> bool:
+    return any(
+        parameter.kind is parameter.VAR_POSITIONAL
+        for parameter in inspect.signature(func).parameters.values()
+    )
+
+
+def non_default(default: object, allowed: Iterable[object] | None) -> object:
+    """Return a value different from *default*, taken from its declared choices when there are some."""
+    if allowed is not None:
+        others = sorted((value for value in allowed if value != default), key=repr)
+        if others:
+            return others[0]
+    if type(default) is bool:
+        return not default
+    return '1pt'
+
+
+def _succeeds(func: Callable[..., Any], args: tuple[object, ...], kwargs: dict) -> bool:
+    try:
+        func(*args, **kwargs)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def build_cases(func: Callable[..., Any]) -> dict[str, Case]:
+    """Return the `defaults`, `typical` and `worst` argument sets of a registered function.
+
+    Keywords whose non-default value is rejected, for instance because it
+    excludes another keyword, are left out of the `worst` case.
+    """
+    qualname = function_qualname(func)
+    required = _required_arguments(func, qualname)
+    choices: Mapping[str, Any] = Implement.permanent[func].choices
+    children = _accepts_children(func) and not required
+
+    worst: dict[str, object] = {}
+    for key, default in (func.__kwdefaults__ or {}).items():
+        candidate = {**worst, key: non_default(default, choices.get(key))}
+        if _succeeds(func, required, candidate):
+            worst = candidate
+
+    def with_children(count: int) -> tuple[object, ...]:
+        if not children:
+            return required
+        return tuple(f'[{i}]' for i in range(count))
+
+    return {
+        'defaults': Case(required, {}),
+        'typical': Case(
+            with_children(_TYPICAL_CHILDREN),
+            dict(list(worst.items())[:_TYPICAL_KEYWORDS]),
+        ),
+        'worst': Case(with_children(_WORST_CHILDREN), worst),
+    }
+
+
+def measure(
+    func: Callable[..., Any], case: Case, *, min_time: float = 0.05, repeat: int = 3
+) -> Measurement:
+    """Return the best ns/call and the peak bytes allocated by one call."""
+    args, kwargs = case
+
+    def call() -> object:
+        return func(*args, **kwargs)
+
+    timer = timeit.Timer(call)
+    number = 1
+    while (elapsed := timer.timeit(number)) < min_time / 10:
+        number *= 10
+    number = max(1, int(number * min_time / elapsed))
+    best = min(timer.repeat(repeat=repeat, number=number))
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Measurement(best * 1e9 / number, peak - baseline)
+
+
+def run(
+    functions: Iterable[Callable[..., Any]] | None = None,
+    *,
+    min_time: float = 0.05,
+    repeat: int = 3,
+) -> dict[str, dict[str, Measurement]]:
+    """Measure every case of *functions*, all registered functions by default."""
+    if functions is None:
+        functions = iter_registered_functions()
+    results = {}
+    for func in functions:
+        cases = build_cases(func)
+        results[function_qualname(func)] = {
+            name: measure(func, cases[name], min_time=min_time, repeat=repeat)
+            for name in CASES
+        }
+    return dict(sorted(results.items()))
+
+
+def to_json(results: Mapping[str, Mapping[str, Measurement]]) -> dict[str, Any]:
+    """Return a JSON-serializable baseline, tagged with the interpreter it was measured on."""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'results': {
+            qualname: {name: m._asdict() for name, m in cases.items()}
+            for qualname, cases in results.items()
+        },
+    }
+
+
+def from_json(data: Mapping[str, Any]) -> dict[str, dict[str, Measurement]]:
+    """Load results saved by `to_json`."""
+    return {
+        qualname: {name: Measurement(**m) for name, m in cases.items()}
+        for qualname, cases in data['results'].items()
+    }
+
+
+def compare(
+    baseline: Mapping[str, Mapping[str, Measurement]],
+    current: Mapping[str, Mapping[str, Measurement]],
+    threshold: float,
+) -> list[str]:
+    """Return a description of every case slower or allocating more than `1 + threshold` times its baseline.
+
+    Cases missing from either side are ignored.
+    """
+    regressions = []
+    for qualname, cases in current.items():
+        for name, now in cases.items():
+            before = baseline.get(qualname, {}).get(name)
+            if before is None:
+                continue
+            for metric in Measurement._fields:
+                old, new = getattr(before, metric), getattr(now, metric)
+                if old > 0 and new > old * (1 + threshold):
+                    regressions.append(
+                        f'{qualname} [{name}] {metric}: {old:.0f} -> {new:.0f} '
+                        f'({new / old - 1:+.0%})'
+                    )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--filter', default='', help='only run qualnames containing TEXT'
+    )
+    parser.add_argument('--min-time', type=float, default=0.05)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument(
+        '--save', type=Path, help='write the results as a JSON baseline'
+    )
+    parser.add_argument('--compare', type=Path, help='compare against a JSON baseline')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.25,
+        help='tolerated relative increase before a case counts as a regression',
+    )
+    args = parser.parse_args(argv)
+
+    functions = [
+        func
+        for func in iter_registered_functions()
+        if args.filter in function_qualname(func)
+    ]
+    results = run(functions, min_time=args.min_time, repeat=args.repeat)
+
+    print(f'{"function":<32} {"case":<8} {"ns/call":>10} {"bytes":>8}')
+    for qualname, cases in results.items():
+        for name, m in cases.items():
+            print(f'{qualname:<32} {name:<8} {m.ns:>10.0f} {m.bytes:>8}')
+
+    if args.save is not None:
+        args.save.write_text(json.dumps(to_json(results), indent=2) + '\n')
+    if args.compare is not None:
+        baseline = from_json(json.loads(args.compare.read_text()))
+        regressions = compare(baseline, results, args.threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,63 @@
+"""Compare the exact-type fast path of `render_value` with the IR fallback.
+
+Run with ``python -m benchmarks.render [--size N] [--repeat R]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / 'src'
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from typstpy._core.render import _to_expr, render_value  # noqa: E402
+
+
+def _ir_render(obj: object) -> str:
+    return _to_expr(obj).render()
+
+
+def build_workloads(size: int) -> dict[str, tuple[object, ...]]:
+    """Return the tuples to render, keyed by workload name."""
+    return {
+        'int': tuple(range(size)),
+        'float': tuple(i / 7 for i in range(size)),
+        'str': tuple(f'{i}pt' for i in range(size)),
+        'mixed': tuple(
+            (i, i / 7, f'{i}pt', None, i % 2 == 0)[i % 5] for i in range(size)
+        ),
+    }
+
+
+def time_ns_per_value(
+    render: Callable[[object], str], value: tuple[object, ...], repeat: int
+) -> float:
+    """Return the best observed time per element, in nanoseconds."""
+    best = min(timeit.repeat(lambda: render(value), number=1, repeat=repeat))
+    return best * 1e9 / len(value)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f'{"workload":<8} {"fast ns/value":>14} {"IR ns/value":>12} {"speedup":>8}')
+    for name, value in build_workloads(args.size).items():
+        if render_value(value) != _ir_render(value):
+            raise AssertionError(f'fast path output differs for {name}')
+        fast = time_ns_per_value(render_value, value, args.repeat)
+        slow = time_ns_per_value(_ir_render, value, args.repeat)
+        print(f'{name:<8} {fast:>14.1f} {slow:>12.1f} {slow / fast:>7.2f}x')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,81 @@
+"""Render independent document sections in a thread pool.
+
+On free-threaded builds (``python3.13t`` and later, with the GIL disabled)
+the throughput should grow almost linearly with the number of workers, since
+rendering only reads the function registry. With the GIL it stays flat.
+
+Run with ``python -m benchmarks.threads [--sections N] [--workers W ...]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / 'src'
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from typstpy import Document  # noqa: E402
+from typstpy.std import figure, heading, image, par, table, text  # noqa: E402
+
+
+def render_section(index: int, paragraphs: int = 200) -> int:
+    """Build and render one independent section, returning its length."""
+    document = Document()
+    document.add_content(heading(f'[Section {index}]', level=2))
+    for i in range(paragraphs):
+        document.add_content(
+            par(text(f'[Paragraph {i}]', fill='blue', weight=700), justify=True)
+        )
+    document.add_content(
+        figure(image(f'"plots/{index}.png"', width='80%'), caption='[Plot]')
+    )
+    document.add_content(table(*(f'[{i}]' for i in range(64)), columns=8))
+    return len(str(document))
+
+
+def time_sections(sections: int, workers: int) -> tuple[float, list[int]]:
+    """Render *sections* sections with *workers* threads, returning the wall time and their lengths."""
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        start = time.perf_counter()
+        sizes = list(pool.map(render_section, range(sections)))
+        return time.perf_counter() - start, sizes
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sections', type=int, default=64)
+    parser.add_argument(
+        '--workers', nargs='+', type=int, default=[1, 2, 4, os.cpu_count() or 8]
+    )
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'GIL enabled: {gil}')
+    print(f'{"workers":>7} {"seconds":>8} {"sections/s":>11} {"speedup":>8}')
+    expected = [render_section(index) for index in range(args.sections)]
+    baseline = None
+    for workers in sorted(set(args.workers)):
+        best = float('inf')
+        for _ in range(args.repeat):
+            elapsed, sizes = time_sections(args.sections, workers)
+            if sizes != expected:
+                raise AssertionError(f'output differs with {workers} workers')
+            best = min(best, elapsed)
+        baseline = baseline or best
+        print(
+            f'{workers:>7} {best:>8.3f} {args.sections / best:>11.1f} '
+            f'{baseline / best:>7.2f}x'
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
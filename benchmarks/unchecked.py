@@ -0,0 +1,80 @@
+"""Compare validated calls with calls inside `typstpy.unchecked()`.
+
+Only functions with declared choices, such as `text`, or with imperative
+`validate_value` calls save time. The unknown-field check reuses the keyword
+lookup every call does anyway, so `table` and `rect`, which declare no choices,
+run at the same speed in both modes, within measurement noise.
+
+Run with ``python -m benchmarks.unchecked [--number N] [--repeat R]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / 'src'
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from typstpy import unchecked  # noqa: E402
+from typstpy.std import rect, table, text  # noqa: E402
+
+
+def build_workloads() -> dict[str, Callable[[], object]]:
+    """Return calls that exercise field checks and value validation, keyed by name."""
+    cells = tuple(f'[{i}]' for i in range(8))
+    return {
+        'text': lambda: text(
+            '[Hello]', weight=700, style='"italic"', dir='rtl', top_edge='"bounds"'
+        ),
+        'table': lambda: table(*cells, columns=4, stroke='none', inset='2pt'),
+        'rect': lambda: rect('[Hi]', width='2cm', fill='red', radius='2pt'),
+    }
+
+
+def _run_unchecked(call: Callable[[], object], number: int) -> float:
+    with unchecked():
+        return timeit.timeit(call, number=number)
+
+
+def time_ns_per_call(
+    call: Callable[[], object], number: int, repeat: int
+) -> tuple[float, float]:
+    """Return the best observed time per call with and without validation, in nanoseconds.
+
+    Both modes are timed alternately, so that drifting machine load affects them alike.
+    """
+    checked = unchecked_ = float('inf')
+    for _ in range(repeat):
+        checked = min(checked, timeit.timeit(call, number=number))
+        unchecked_ = min(unchecked_, _run_unchecked(call, number))
+    return checked * 1e9 / number, unchecked_ * 1e9 / number
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=20_000)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    print(f'{"call":<6} {"checked ns":>11} {"unchecked ns":>13} {"saved":>7}')
+    for name, call in build_workloads().items():
+        expected = call()
+        with unchecked():
+            if call() != expected:
+                raise AssertionError(f'unchecked output differs for {name}')
+        checked, fast = time_ns_per_call(call, args.number, args.repeat)
+        print(
+            f'{name:<6} {checked:>11.0f} {fast:>13.0f} '
+            f'{(checked - fast) / checked:>6.1%}'
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
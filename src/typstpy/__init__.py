@@ -1,4 +1,40 @@
-from . import std, subpar
+import importlib
+from types import ModuleType
+
+from ._core import (
+    Content,
+    NumberFormat,
+    deferred,
+    number_format,
+    profile,
+    set_unchecked,
+    unchecked,
+)
 from .document import Document
 
-__all__ = ['std', 'subpar', 'Document']
+_SUBMODULES = frozenset({'std', 'subpar'})
+"""Submodules imported on first attribute access (PEP 562), keeping `import typstpy` cheap."""
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name not in _SUBMODULES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    return importlib.import_module(f'{__name__}.{name}')
+
+
+def __dir__() -> list[str]:
+    return sorted(globals().keys() | _SUBMODULES)
+
+
+__all__ = [
+    'std',
+    'subpar',
+    'Content',
+    'Document',
+    'NumberFormat',
+    'deferred',
+    'number_format',
+    'profile',
+    'set_unchecked',
+    'unchecked',
+]
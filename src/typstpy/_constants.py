@@ -202,5 +202,91 @@ VALID_CITATION_STYLES = frozenset(
         '"ieee"',
     }
 )
+VALID_CITATION_FORMS = frozenset(
+    {None, 'none', '"normal"', '"prose"', '"full"', '"author"', '"year"'}
+)
+VALID_COLOR_MAPS = frozenset(
+    {
+        'turbo',
+        'cividis',
+        'rainbow',
+        'spectral',
+        'viridis',
+        'inferno',
+        'magma',
+        'plasma',
+        'rocket',
+        'mako',
+        'vlag',
+        'icefire',
+        'flare',
+        'crest',
+    }
+)
+VALID_FONT_WEIGHTS = frozenset(
+    {
+        '"thin"',
+        '"extralight"',
+        '"light"',
+        '"regular"',
+        '"medium"',
+        '"semibold"',
+        '"bold"',
+        '"extrabold"',
+        '"black"',
+    }
+)
+VALID_TEXT_STYLES = frozenset({'"normal"', '"italic"', '"oblique"'})
+VALID_TOP_EDGES = frozenset(
+    {'"ascender"', '"cap-height"', '"x-height"', '"baseline"', '"bounds"'}
+)
+VALID_BOTTOM_EDGES = frozenset({'"baseline"', '"descender"', '"bounds"'})
+VALID_NUMBER_TYPES = frozenset({'auto', '"lining"', '"old-style"'})
+VALID_NUMBER_WIDTHS = frozenset({'auto', '"proportional"', '"tabular"'})
+VALID_CJK_LATIN_SPACINGS = frozenset({None, 'auto', 'none'})
+VALID_TEXT_DIRECTIONS = frozenset({'auto', 'ltr', 'rtl'})
+VALID_STACK_DIRECTIONS = frozenset({'ltr', 'rtl', 'ttb', 'btt'})
+VALID_LINEBREAKS = frozenset({'auto', '"simple"', '"optimized"'})
+VALID_NUMBERING_SCOPES = frozenset({'"document"', '"page"'})
+VALID_REF_FORMS = frozenset({'"normal"', '"page"'})
+VALID_SCOPES = frozenset({'"column"', '"parent"'})
+VALID_RELATIVE_TO = frozenset({'auto', '"self"', '"parent"'})
+VALID_FILL_RULES = frozenset({'"non-zero"', '"even-odd"'})
+VALID_CURVE_CLOSE_MODES = frozenset({'"smooth"', '"straight"'})
+VALID_HLINE_POSITIONS = frozenset({'top', 'bottom'})
+VALID_VLINE_POSITIONS = frozenset({'start', 'end', 'left', 'right'})
+VALID_PAGE_BINDINGS = frozenset({'auto', 'left', 'right'})
+VALID_PAGEBREAK_TARGETS = frozenset({None, '"even"', '"odd"'})
+VALID_IMAGE_FORMATS = frozenset({'"png"', '"jpg"', '"gif"', '"svg"', '"pdf"', '"webp"'})
+VALID_IMAGE_FITS = frozenset({'"cover"', '"contain"', '"stretch"'})
+VALID_IMAGE_SCALINGS = frozenset({'auto', '"smooth"', '"pixelated"'})
 
-__all__ = ['VALID_PAPER_SIZES', 'VALID_CITATION_STYLES']
+__all__ = [
+    'VALID_PAPER_SIZES',
+    'VALID_CITATION_STYLES',
+    'VALID_CITATION_FORMS',
+    'VALID_COLOR_MAPS',
+    'VALID_FONT_WEIGHTS',
+    'VALID_TEXT_STYLES',
+    'VALID_TOP_EDGES',
+    'VALID_BOTTOM_EDGES',
+    'VALID_NUMBER_TYPES',
+    'VALID_NUMBER_WIDTHS',
+    'VALID_CJK_LATIN_SPACINGS',
+    'VALID_TEXT_DIRECTIONS',
+    'VALID_STACK_DIRECTIONS',
+    'VALID_LINEBREAKS',
+    'VALID_NUMBERING_SCOPES',
+    'VALID_REF_FORMS',
+    'VALID_SCOPES',
+    'VALID_RELATIVE_TO',
+    'VALID_FILL_RULES',
+    'VALID_CURVE_CLOSE_MODES',
+    'VALID_HLINE_POSITIONS',
+    'VALID_VLINE_POSITIONS',
+    'VALID_PAGE_BINDINGS',
+    'VALID_PAGEBREAK_TARGETS',
+    'VALID_IMAGE_FORMATS',
+    'VALID_IMAGE_FITS',
+    'VALID_IMAGE_SCALINGS',
+]
@@ -1,4 +1,9 @@
+from .columns import render_columns
+from .content import Content, deferred
 from .decorators import attach_func, implement, temporary
+from .formatting import NumberFormat, number_format
+from .markup import escape_markup, escape_markup_many, escaped
+from .profiling import FunctionStats, ProfileStats, profile
 from .protocols import (
     call_,
     import_,
@@ -10,15 +15,34 @@ from .protocols import (
     set_,
     show_,
 )
-from .registry import Implement, validate_value
+from .registry import (
+    Implement,
+    is_checked,
+    set_unchecked,
+    unchecked,
+    validate_value,
+)
 
 __all__ = [
     'attach_func',
     'call_',
+    'Content',
+    'deferred',
+    'escape_markup',
+    'escape_markup_many',
+    'escaped',
     'Implement',
+    'NumberFormat',
+    'number_format',
+    'FunctionStats',
+    'ProfileStats',
+    'profile',
     'implement',
     'temporary',
     'validate_value',
+    'is_checked',
+    'set_unchecked',
+    'unchecked',
     'set_',
     'show_',
     'import_',
@@ -27,4 +51,5 @@ __all__ = [
     'instance',
     'pre_series',
     'post_series',
+    'render_columns',
 ]
@@ -0,0 +1,103 @@
+"""Rendering of NumPy arrays and scalars.
+
+NumPy is an optional dependency: nothing here imports it. `register_numpy` is
+called by the renderer the first time it meets an object whose type comes from
+NumPy, which guarantees the module is already loaded.
+"""
+
+from types import ModuleType
+from typing import Any
+
+from .formatting import current_number_format
+
+
+def is_numpy_object(obj: object) -> bool:
+    """Return True if the type of *obj* is defined by NumPy."""
+    module = type(obj).__module__
+    return module == 'numpy' or module.startswith('numpy.')
+
+
+def is_numpy_array(obj: object) -> bool:
+    """Return True if *obj* is a NumPy array with at least one dimension."""
+    return is_numpy_object(obj) and getattr(obj, 'ndim', 0) >= 1
+
+
+def _render_scalar(obj: Any) -> str:
+    """Render a NumPy scalar the way the matching Python scalar would be rendered."""
+    kind = obj.dtype.kind
+    if kind == 'b':
+        return 'true' if obj else 'false'
+    if kind == 'f':
+        policy = current_number_format()
+        if policy is not None:
+            return policy.format(float(obj))
+    return str(obj)
+
+
+def _render_items(np: ModuleType, array: Any, *, markup: bool = False) -> list[str]:
+    """Render every element of *array* in C order, vectorized for numeric dtypes.
+
+    Floats follow the active `NumberFormat`; *markup* enables its grouping.
+    """
+    from .render import render_value
+
+    flat = array.ravel()
+    kind = array.dtype.kind
+    if kind == 'b':
+        return np.where(flat, 'true', 'false').tolist()
+    if kind in 'iu':
+        return list(map(int.__repr__, flat.tolist()))
+    if kind == 'f':
+        policy = current_number_format()
+        if policy is not None:
+            return policy.format_many(flat.tolist(), markup=markup)
+        if array.dtype.itemsize == 8:
+            return list(map(float.__repr__, flat.tolist()))
+        return flat.astype(str).tolist()
+    return [render_value(item) for item in flat.tolist()]
+
+
+def _render_array_content(np: ModuleType, array: Any) -> str:
+    from .render import _render_sequence_content
+
+    if array.ndim == 0:
+        return _render_scalar(array[()])
+    if array.size == 0:
+        return _render_sequence_content(list(array))
+    items = _render_items(np, array)
+    for size in reversed(array.shape[1:]):
+        items = [
+            f'({", ".join(items[start : start + size])})'
+            for start in range(0, len(items), size)
+        ]
+    return ', '.join(items)
+
+
+def register_numpy(np: ModuleType) -> None:
+    """Register the NumPy array and scalar types with the renderer.
+
+    Args:
+        np: The imported `numpy` module.
+    """
+    from .ir import RawExpr
+    from .render import _CONTENT_RENDERERS, _VALUE_RENDERERS, _to_expr
+
+    def render_array(array: Any) -> str:
+        if array.ndim == 0:
+            return _render_scalar(array[()])
+        return f'({_render_array_content(np, array)})'
+
+    def render_array_content(array: Any) -> str:
+        return _render_array_content(np, array)
+
+    _to_expr.register(np.ndarray, lambda array: RawExpr(render_array(array)))
+    _to_expr.register(np.generic, lambda scalar: RawExpr(_render_scalar(scalar)))
+    _VALUE_RENDERERS[np.ndarray] = render_array
+    _CONTENT_RENDERERS[np.ndarray] = render_array_content
+    for cls in set(np.sctypeDict.values()):
+        if issubclass(cls, np.number | np.bool_):
+            _VALUE_RENDERERS[cls] = _render_scalar
+            _CONTENT_RENDERERS[cls] = _render_scalar
+
+
+__all__ = ['is_numpy_array', 'is_numpy_object', 'register_numpy']
@@ -0,0 +1,111 @@
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+from .arrays import _render_items, is_numpy_object
+from .formatting import current_number_format
+from .markup import escape_markup_many, escaped
+from .render import render_value
+
+CellFormatter = Callable[[Any], str]
+"""Function returning the typst source of one cell from one column value."""
+
+
+def default_cell(value: object) -> str:
+    """Render a value as a content block, e.g. ``1.5`` as ``'[1.5]'``.
+
+    Strings are escaped with `escape_markup`. Floats follow the active
+    `NumberFormat`, including its grouping.
+    """
+    if type(value) is str:
+        return escaped(value)
+    if type(value) is float:
+        policy = current_number_format()
+        if policy is not None:
+            return f'[{policy.format(value, markup=True)}]'
+    return f'[{render_value(value)}]'
+
+
+def _as_array(column: object) -> Any | None:
+    """Convert array-like columns to a NumPy array, or return None if NumPy cannot be used."""
+    if is_numpy_object(column):
+        return column
+    if not hasattr(column, '__array__'):
+        return None
+    np = sys.modules.get('numpy')
+    if np is None:
+        try:
+            import numpy as np
+        except ImportError:  # pragma: no cover - `__array__` implies numpy.
+            return None
+    return np.asarray(column)
+
+
+def _column_values(column: object) -> list[Any]:
+    """Return the values of a column given as a sequence, buffer or array-like object."""
+    array = _as_array(column)
+    if array is not None:
+        return array.tolist()
+    if isinstance(column, Iterable) and not isinstance(column, str):
+        return list(column)
+    try:
+        with memoryview(column) as view:  # type: ignore[arg-type]
+            return view.tolist()
+    except TypeError:
+        raise TypeError(
+            f'Column values must be a sequence, buffer or array-like, not {type(column).__name__}'
+        ) from None
+
+
+def _render_column(column: object, formatter: CellFormatter | None) -> list[str]:
+    """Render one column to cell sources in a single pass."""
+    if formatter is not None:
+        return list(map(formatter, _column_values(column)))
+    array = _as_array(column)
+    if array is not None and array.ndim == 1 and array.dtype.kind in 'biuf':
+        items = _render_items(sys.modules['numpy'], array, markup=True)
+        return [f'[{item}]' for item in items]
+    values = _column_values(column)
+    if values and all(type(value) is str for value in values):
+        return [f'[{text}]' for text in escape_markup_many(values)]
+    return list(map(default_cell, values))
+
+
+def render_columns(
+    data: Mapping[str, object],
+    formatters: Mapping[str, CellFormatter] | None = None,
+) -> tuple[list[str], list[str]]:
+    """Render columnar data into header cells and row-major body cells.
+
+    Args:
+        data: Mapping of column name to column values. Names and string values are escaped with `escape_markup`. Values may be sequences, buffers or objects implementing `__array__`, such as pandas or polars series.
+        formatters: Mapping of column name to a function returning the typst source of one cell. Defaults to None.
+
+    Raises:
+        ValueError: If there are no columns, the columns have different lengths or a formatter names an unknown column.
+
+    Returns:
+        The header cells and the body cells.
+    """
+    if not data:
+        raise ValueError('At least one column is required')
+    formatters = formatters or {}
+    unknown = sorted(set(formatters) - set(data))
+    if unknown:
+        raise ValueError(
+            f'Formatters given for unknown column(s): {", ".join(unknown)}'
+        )
+
+    header = [escaped(name) for name in data]
+    columns = [
+        _render_column(values, formatters.get(name)) for name, values in data.items()
+    ]
+    lengths = {len(column) for column in columns}
+    if len(lengths) > 1:
+        raise ValueError(f'Columns must have the same length, got {sorted(lengths)}')
+    if len(columns) == 1:
+        return header, columns[0]
+    return header, [cell for row in zip(*columns) for cell in row]
+
+
+__all__ = ['CellFormatter', 'default_cell', 'render_columns']
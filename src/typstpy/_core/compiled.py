@@ -0,0 +1,198 @@
+from collections.abc import Callable, Iterable, Mapping
+from operator import is_
+from types import MappingProxyType, NoneType
+from typing import Any, TypeAlias
+
+import attrs
+
+from .content import prefixed
+from .registry import invalid_value_error, keyword_defaults, unknown_fields_error
+from .render import _render_key, render_value
+
+
+def _matches_default(value: object, default: object) -> bool:
+    """Return True if *value* equals *default*, treating non-bool comparison results such as arrays as a mismatch."""
+    return value is default or (value == default) is True
+
+
+def _matches_str(value: object, default: object) -> bool:
+    return type(value) is str and value == default
+
+
+def _matches_number(value: object, default: object) -> bool:
+    return (type(value) is int or type(value) is float) and value == default
+
+
+_Matcher: TypeAlias = Callable[[object, object], bool]
+
+_MATCHERS: dict[type, _Matcher | None] = {
+    NoneType: None,
+    bool: None,
+    str: _matches_str,
+    int: _matches_number,
+    float: _matches_number,
+}
+"""Comparison used for defaults of each exact type after the identity check fails.
+
+None means identity is enough, since the type only has singletons. Other types
+fall back to `_matches_default`. Values of another kind are never elided, even
+when `==` holds: `True` does not match a default of `1`, nor a NumPy scalar or
+`str` subclass an equal builtin default, while `int` and `float` match each other.
+"""
+
+
+def _default_matcher(default: object) -> _Matcher | None:
+    """Return the cheapest comparison that decides whether a value equals *default*."""
+    return _MATCHERS.get(type(default), _matches_default)
+
+
+@attrs.frozen
+class CompiledCall:
+    """Rendering state precomputed once per registered function.
+
+    Holds the function's default table and the kebab-case ``'key: '`` prefix
+    of every keyword-only parameter, so that protocols can filter defaults
+    and render keywords in a single pass without re-reading ``__kwdefaults__``.
+    Each default is compared by identity first, then with the comparison
+    chosen for its type at compile time.
+    """
+
+    name: str
+    head: str
+    defaults: Mapping[str, object]
+    prefixes: Mapping[str, str]
+    spread_single: bool = False
+    keywords: Mapping[
+        str, tuple[str, object, _Matcher | None, frozenset[object] | None]
+    ] = attrs.field(factory=dict, eq=False, repr=False)
+    """The prefix, default, default comparison and allowed values of every keyword, merged so a call does one lookup per argument."""
+    choices: Mapping[str, frozenset[object]] = attrs.field(
+        factory=dict, eq=False, repr=False
+    )
+    order: tuple[str, ...] = attrs.field(default=(), eq=False, repr=False)
+    default_values: tuple[object, ...] = attrs.field(default=(), eq=False, repr=False)
+
+    def _all_defaults(self, kwargs: Mapping[str, object]) -> bool:
+        """Return True if *kwargs* passes every default object in declaration order, as the std functions do when called without keywords."""
+        return (
+            len(kwargs) == len(self.order)
+            and tuple(kwargs) == self.order
+            and all(map(is_, kwargs.values(), self.default_values))
+        )
+
+    def render_keywords(
+        self,
+        kwargs: Mapping[str, object],
+        *,
+        checked: bool = True,
+        render: Callable[[object], Any] = render_value,
+        keep_defaults: bool = False,
+    ) -> list[Any]:
+        """Render non-default keyword arguments as ``'key: value'`` strings.
+
+        Args:
+            kwargs: The keyword arguments passed to the protocol.
+            checked: Whether unknown fields should be rejected. Defaults to True.
+            render: The value renderer. Defaults to `render_value`.
+            keep_defaults: Whether arguments equal to their default are kept, as set rules and selectors require. Defaults to False.
+
+        Raises:
+            TypeError: If `checked` is set and there are unknown fields.
+            ValueError: If `checked` is set and a value is not one of the declared choices.
+
+        Returns:
+            The rendered keyword arguments in call order.
+        """
+        if not kwargs or (not keep_defaults and self._all_defaults(kwargs)):
+            return []
+        keywords = self.keywords
+        rendered = []
+        append = rendered.append
+        for key, value in kwargs.items():
+            entry = keywords.get(key)
+            if entry is None:
+                if checked:
+                    raise unknown_fields_error(
+                        self.name, sorted(set(kwargs) - keywords.keys())
+                    )
+                prefix = f'{_render_key(key)}: '
+            else:
+                prefix, default, matcher, allowed = entry
+                if not keep_defaults and (
+                    value is default
+                    or (matcher is not None and matcher(value, default))
+                ):
+                    continue
+                if checked and allowed is not None and value not in allowed:
+                    raise invalid_value_error(self.name, key, value, allowed)
+            fragment = render(value)
+            if type(fragment) is str:
+                append(prefix + fragment)
+            else:
+                append(prefixed(prefix, fragment))
+        return rendered
+
+
+def _compile_choices(
+    name: str,
+    defaults: Mapping[str, object],
+    choices: Mapping[str, Iterable[object]],
+) -> dict[str, frozenset[object]]:
+    """Freeze declared choices, rejecting unknown parameters and defaults outside their choices."""
+    unknown = sorted(set(choices) - defaults.keys())
+    if unknown:
+        raise ValueError(
+            f'{name} declares choices for unknown field(s): {", ".join(unknown)}'
+        )
+    compiled = {key: frozenset(values) for key, values in choices.items()}
+    for key, allowed in compiled.items():
+        if defaults[key] not in allowed:
+            raise ValueError(
+                f'{name} default {key}={defaults[key]!r} is not one of its choices'
+            )
+    return compiled
+
+
+def compile_call(
+    func: Callable[..., object],
+    name: str,
+    *,
+    spread_single: bool = False,
+    choices: Mapping[str, Iterable[object]] | None = None,
+) -> CompiledCall:
+    """Build the `CompiledCall` of a function.
+
+    Args:
+        func: The function to be compiled.
+        name: The original function name in typst.
+        spread_single: Whether a single list/tuple child should be spread. Defaults to False.
+        choices: Mapping of keyword-only parameter name to its allowed values. Defaults to None.
+
+    Raises:
+        ValueError: If `choices` names an unknown parameter or excludes a parameter's default.
+
+    Returns:
+        The compiled rendering state.
+    """
+    defaults = dict(keyword_defaults(func))
+    prefixes = {key: f'{_render_key(key)}: ' for key in defaults}
+    allowed = _compile_choices(name, defaults, choices or {})
+    return CompiledCall(
+        name,
+        f'#{name}(',
+        MappingProxyType(defaults),
+        MappingProxyType(prefixes),
+        spread_single,
+        {
+            key: (
+                prefixes[key],
+                default,
+                _default_matcher(default),
+                allowed.get(key),
+            )
+            for key, default in defaults.items()
+        },
+        MappingProxyType(allowed),
+        tuple(defaults),
+        tuple(defaults.values()),
+    )
@@ -0,0 +1,291 @@
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from io import StringIO
+from typing import TypeAlias, final
+
+from .ir import RawExpr, SupportsWrite, TypstExpr
+from .render import _SCALAR_RENDERERS, _to_expr
+
+_DEFERRED: ContextVar[bool] = ContextVar('typstpy_deferred', default=False)
+
+Fragment: TypeAlias = 'str | Content | TypstExpr | ChildStream'
+
+
+class _Mismatch(Exception):
+    pass
+
+
+class _Comparer:
+    """Writer that compares written pieces against a string and stops at the first mismatch."""
+
+    __slots__ = ('_target', '_position')
+
+    def __init__(self, target: str) -> None:
+        self._target = target
+        self._position = 0
+
+    def write(self, s: str, /) -> None:
+        end = self._position + len(s)
+        if self._target[self._position : end] != s:
+            raise _Mismatch
+        self._position = end
+
+    def matched(self) -> bool:
+        return self._position == len(self._target)
+
+
+@final
+class Content:
+    """Typst source held as a tree of fragments and flattened only on demand.
+
+    A `Content` keeps its children by reference, so nesting calls inside
+    `deferred` costs a few fragments per level instead of copying the whole
+    inner source every time. Values that are not strings stay as IR nodes and
+    are rendered while writing. It stands in for the `str` returned by the
+    protocols through `__str__`, `__add__` and `__eq__`.
+    """
+
+    __slots__ = ('_parts', '_code')
+
+    def __init__(self, *parts: Fragment) -> None:
+        self._parts = parts
+        self._code = False
+
+    def as_code(self) -> 'Content':
+        """Return a view without the leading `#`, as `render_value` does for strings.
+
+        The view shares the fragments of this content, so it is created in constant time.
+        """
+        if self._code:
+            return self
+        view = Content.__new__(Content)
+        view._parts = self._parts
+        view._code = True
+        return view
+
+    def render_into(self, writer: SupportsWrite, /, *, buffer: bool = False) -> None:
+        """Write the source into *writer* piece by piece, without building the full string.
+
+        Args:
+            writer: Any object with a `write` method accepting strings, such as an opened text file.
+            buffer: Whether children drawn from an iterator are kept once rendered, so this content can be written again. Defaults to False.
+
+        Raises:
+            RuntimeError: If children drawn from an iterator were already written without `buffer`.
+        """
+        write = writer.write
+        strip = self._code
+        stack: list[Iterator[Fragment]] = [iter(self._parts)]
+        while stack:
+            for part in stack[-1]:
+                if isinstance(part, Content):
+                    strip = strip or part._code
+                    stack.append(iter(part._parts))
+                    break
+                if not isinstance(part, str):
+                    strip = False
+                    if isinstance(part, ChildStream):
+                        part.render_into(writer, buffer=buffer)
+                    else:
+                        part.render_into(writer)
+                    continue
+                if not part:
+                    continue
+                if strip:
+                    strip = False
+                    if part.startswith('#'):
+                        part = part[1:]
+                        if not part:
+                            continue
+                write(part)
+            else:
+                stack.pop()
+
+    def __str__(self) -> str:
+        with StringIO() as stream:
+            self.render_into(stream, buffer=True)
+            return stream.getvalue()
+
+    def __repr__(self) -> str:
+        return f'Content({str(self)!r})'
+
+    def __bool__(self) -> bool:
+        return not self == ''
+
+    def __add__(self, other: object) -> 'Content':
+        if isinstance(other, str | Content):
+            return Content(self, other)
+        return NotImplemented
+
+    def __radd__(self, other: object) -> 'Content':
+        if isinstance(other, str):
+            return Content(other, self)
+        return NotImplemented
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Content):
+            other = str(other)
+        if not isinstance(other, str):
+            return NotImplemented
+        comparer = _Comparer(other)
+        try:
+            self.render_into(comparer, buffer=True)
+        except _Mismatch:
+            return False
+        return comparer.matched()
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+
+def is_deferred() -> bool:
+    """Return True if the protocols currently build `Content` instead of `str`."""
+    return _DEFERRED.get()
+
+
+@contextmanager
+def deferred() -> Iterator[None]:
+    """Make the protocols return `Content` instead of `str` inside this scope.
+
+    Examples:
+        >>> from typstpy.std import block, pad
+        >>> with deferred():
+        ...     source = pad(block('[Hello]'), x='1em')
+        >>> type(source).__name__
+        'Content'
+        >>> str(source)
+        '#pad(block([Hello]), x: 1em)'
+    """
+    token = _DEFERRED.set(True)
+    try:
+        yield
+    finally:
+        _DEFERRED.reset(token)
+
+
+def render_fragment(obj: object) -> Fragment:
+    """Render an argument lazily, keeping `Content` by reference and other values as IR."""
+    if isinstance(obj, Content):
+        return obj.as_code()
+    render = _SCALAR_RENDERERS.get(type(obj))
+    if render is not None:
+        return render(obj)
+    return _to_expr(obj)
+
+
+def prefixed(prefix: str, fragment: Fragment) -> Fragment:
+    """Prepend *prefix* to a fragment, concatenating eagerly only for strings."""
+    if isinstance(fragment, str):
+        return prefix + fragment
+    return Content(prefix, fragment)
+
+
+@final
+class ChildStream:
+    """Children of a series call drawn from an iterator only while the call is written.
+
+    Each child is rendered and written before the next one is requested, so
+    writing a call through `Content.render_into` holds a single child at a time.
+    The iterator can only be drawn once. Writing with ``buffer=True``, as `str`,
+    `==`, `hash` and `repr` of `Content` do, keeps the rendered children so
+    later writes replay them; writing a stream again after an unbuffered write raises.
+    """
+
+    __slots__ = ('_children', '_leading', '_trailing', '_consumed', '_rendered')
+
+    def __init__(self, children: Iterator[object]) -> None:
+        self._children = children
+        self._leading = False
+        self._trailing = False
+        self._consumed = False
+        self._rendered: str | None = None
+
+    def render_into(self, writer: SupportsWrite, /, *, buffer: bool = False) -> None:
+        """Write the children separated by `', '`.
+
+        Args:
+            writer: Any object with a `write` method accepting strings.
+            buffer: Whether the rendered children are kept for later writes. Defaults to False.
+
+        Raises:
+            RuntimeError: If the children have already been written without `buffer`.
+        """
+        if self._rendered is not None:
+            writer.write(self._rendered)
+            return
+        if self._consumed:
+            raise RuntimeError(
+                'The children iterator has already been consumed by an unbuffered '
+                'render_into; call str() or render_into(..., buffer=True) first '
+                'to write it more than once'
+            )
+        self._consumed = True
+        if not buffer:
+            self._write_children(writer)
+            return
+        # Render completely before writing, so a writer that stops early, such
+        # as the comparison in `Content.__eq__`, still leaves the stream replayable.
+        with StringIO() as stream:
+            self._write_children(stream, buffer=True)
+            self._rendered = stream.getvalue()
+        self._children = iter(())
+        writer.write(self._rendered)
+
+    def _write_children(self, writer: SupportsWrite, *, buffer: bool = False) -> None:
+        write = writer.write
+        separate = self._leading
+        for child in self._children:
+            if separate:
+                write(', ')
+            separate = True
+            fragment = render_fragment(child)
+            if isinstance(fragment, str):
+                write(fragment)
+            elif isinstance(fragment, Content):
+                fragment.render_into(writer, buffer=buffer)
+            else:
+                fragment.render_into(writer)
+        if self._trailing and separate:
+            write(', ')
+
+
+def join_fragments(head: str, params: Iterable[Fragment], tail: str = ')') -> Content:
+    """Assemble a call as `Content`, separating parameters with `', '`.
+
+    A `ChildStream` writes its own separators, since whether it is empty is
+    only known once it has been written.
+    """
+    params = list(params)
+    last = len(params) - 1
+    parts: list[Fragment] = [head]
+    after_stream = False
+    for index, param in enumerate(params):
+        if isinstance(param, ChildStream):
+            param._leading = index > 0
+            param._trailing = index < last
+            after_stream = True
+        else:
+            if index and not after_stream:
+                parts.append(', ')
+            after_stream = False
+        parts.append(param)
+    parts.append(tail)
+    return Content(*parts)
+
+
+@_to_expr.register
+def _(obj: Content) -> TypstExpr:
+    return RawExpr(str(obj.as_code()))
+
+
+__all__ = [
+    'ChildStream',
+    'Content',
+    'Fragment',
+    'deferred',
+    'is_deferred',
+    'join_fragments',
+    'prefixed',
+    'render_fragment',
+]
@@ -1,7 +1,8 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Mapping
 from typing import Any
 
-from .registry import Implement, raise_unknown_fields
+from .compiled import CompiledCall, compile_call
+from .registry import _IMPLEMENT_ATTR, _TEMPORARY_ATTR, Implement, mark, should_check
 from .render import render_content
 
 
@@ -32,27 +33,31 @@ def attach_func(
 
 
 def _make_where_func(
-    func: Callable[..., Any], original_name: str
+    func: Callable[..., Any], compiled: CompiledCall
 ) -> Callable[..., str]:
+    head = f'#{compiled.name}.where('
+
     def where(**kwargs: Any) -> str:
-        if func not in Implement.temporary:
-            raise_unknown_fields(func, kwargs)
-        params = render_content(kwargs) if kwargs else ''
-        return f'#{original_name}.where({params})'
+        params = compiled.render_keywords(
+            kwargs, checked=should_check(func), keep_defaults=True
+        )
+        return head + ', '.join(params) + ')'
 
     return where
 
 
-def _make_with_func(func: Callable[..., Any], original_name: str) -> Callable[..., str]:
+def _make_with_func(
+    func: Callable[..., Any], compiled: CompiledCall
+) -> Callable[..., str]:
+    head = f'#{compiled.name}.with('
+
     def with_(*args: Any, **kwargs: Any) -> str:
-        if func not in Implement.temporary:
-            raise_unknown_fields(func, kwargs)
-        params = []
+        params = compiled.render_keywords(
+            kwargs, checked=should_check(func), keep_defaults=True
+        )
         if args:
-            params.append(render_content(args))
-        if kwargs:
-            params.append(render_content(kwargs))
-        return f'#{original_name}.with({", ".join(params)})'
+            params.insert(0, render_content(args))
+        return head + ', '.join(params) + ')'
 
     return with_
 
@@ -63,30 +68,49 @@ def implement(
     hyperlink: str | None = None,
     version: str | None = None,
     spread_single: bool = False,
+    choices: Mapping[str, Iterable[object]] | None = None,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Register a typst function and attach it with `where` and `with_` functions.
 
+    The function's default table and ``'key: '`` prefixes are compiled once here,
+    so that the protocols, `where` and `with_` render keywords without
+    re-inspecting the function or re-spelling its parameter names.
+
     Args:
         original_name: The original function name in typst.
         hyperlink: The hyperlink of the documentation in typst. Defaults to None.
         version: The current supported version. Defaults to None.
         spread_single: Whether a single list/tuple child should be spread. Defaults to False.
+        choices: Mapping of keyword-only parameter name to its allowed values, checked whenever a non-default value is rendered. Defaults to None.
+
+    Raises:
+        ValueError: If `choices` names an unknown parameter or excludes a parameter's default.
 
     Returns:
         The decorator function.
     """
 
     def wrapper(func: Callable[..., Any]) -> Callable[..., Any]:
-        Implement.permanent[func] = Implement(
-            original_name, hyperlink, version, spread_single
+        compiled = compile_call(
+            func, original_name, spread_single=spread_single, choices=choices
+        )
+        record = Implement(
+            original_name,
+            hyperlink,
+            version,
+            spread_single,
+            compiled,
+            compiled.choices,
         )
+        Implement.permanent[func] = record
+        mark(func, _IMPLEMENT_ATTR, record)
 
-        where = _make_where_func(func, original_name)
+        where = _make_where_func(func, compiled)
         where.__doc__ = (
             'Returns a selector that filters for elements belonging to this '
             'function whose fields have the values of the given arguments.'
         )
-        with_ = _make_with_func(func, original_name)
+        with_ = _make_with_func(func, compiled)
         with_.__doc__ = (
             'Returns a new function that has the given arguments pre-applied.'
         )
@@ -108,4 +132,5 @@ def temporary(func: Callable[..., Any]) -> Callable[..., Any]:
         The marked function.
     """
     Implement.temporary.add(func)
+    mark(func, _TEMPORARY_ATTR)
     return func
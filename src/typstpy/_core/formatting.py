@@ -0,0 +1,172 @@
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from decimal import Decimal
+from math import isfinite
+from typing import Literal, TypeAlias
+
+import attrs
+
+Notation: TypeAlias = Literal['auto', 'fixed', 'scientific']
+
+_NOTATIONS = frozenset({'auto', 'fixed', 'scientific'})
+
+
+def _typst_exponent(source: str) -> str:
+    """Rewrite a Python exponent such as ``'1.5e+03'`` into the typst literal ``'1.5e3'``."""
+    mantissa, _, exponent = source.partition('e')
+    sign = '-' if exponent.startswith('-') else ''
+    return f'{mantissa}e{sign}{exponent.lstrip("+-").lstrip("0") or "0"}'
+
+
+@attrs.frozen
+class NumberFormat:
+    """Policy for rendering floats, replacing the shortest round-trip `repr`.
+
+    Grouping is only applied to markup, such as the cells written by
+    `render_columns`, since typst code does not accept grouped literals.
+    With ``decimals=0``, numbers are written as typst integers.
+
+    Examples:
+        >>> NumberFormat(decimals=2).format(3.14159)
+        '3.14'
+        >>> NumberFormat(decimals=0).format(3.0)
+        '3'
+        >>> NumberFormat(significant=3).format(1234.5)
+        '1.23e3'
+        >>> NumberFormat(significant=3, notation='fixed').format(1234.5)
+        '1230.0'
+        >>> NumberFormat(decimals=1, grouping=',').format(1234567.89, markup=True)
+        '1,234,567.9'
+    """
+
+    decimals: int | None = None
+    significant: int | None = None
+    grouping: str = ''
+    notation: Notation = 'auto'
+
+    def __attrs_post_init__(self) -> None:
+        if self.decimals is not None and self.significant is not None:
+            raise ValueError('decimals and significant cannot be set together')
+        if self.decimals is not None and self.decimals < 0:
+            raise ValueError(f'decimals must not be negative, got {self.decimals}')
+        if self.significant is not None and self.significant < 1:
+            raise ValueError(f'significant must be positive, got {self.significant}')
+        if self.notation not in _NOTATIONS:
+            choices = ', '.join(repr(choice) for choice in sorted(_NOTATIONS))
+            raise ValueError(
+                f'Invalid notation={self.notation!r}; expected one of: {choices}'
+            )
+
+    @property
+    def _fixed_spec(self) -> str | None:
+        """Return a `format` spec whose output never needs post-processing, if there is one."""
+        if self.decimals is not None and self.notation != 'scientific':
+            return f'.{self.decimals}f'
+        return None
+
+    def _format_digits(self, value: float) -> str:
+        decimals, significant, notation = self.decimals, self.significant, self.notation
+        if notation == 'scientific':
+            if decimals is not None:
+                return _typst_exponent(format(value, f'.{decimals}e'))
+            if significant is not None:
+                return _typst_exponent(format(value, f'.{significant - 1}e'))
+            return _typst_exponent(format(Decimal(repr(value)), 'e'))
+        if decimals is not None:
+            return format(value, f'.{decimals}f')
+        if significant is not None:
+            source = format(value, f'.{significant}g')
+        else:
+            source = repr(value)
+        if 'e' not in source:
+            return source
+        if notation == 'fixed':
+            return format(Decimal(source), 'f')
+        return _typst_exponent(source)
+
+    def format(self, value: float, *, markup: bool = False) -> str:
+        """Format one float.
+
+        Args:
+            value: The number to be formatted.
+            markup: Whether the result is written as markup, which enables grouping and keeps integral results without a fractional part. Defaults to False.
+
+        Returns:
+            The typst source of the number. In code, integral results get a ``.0`` suffix to stay floats, unless `decimals` is 0.
+        """
+        if not isfinite(value):
+            return float.__repr__(value)
+        source = self._format_digits(value)
+        if markup:
+            if self.grouping and 'e' not in source:
+                sign, digits = ('-', source[1:]) if source[0] == '-' else ('', source)
+                whole, dot, fraction = digits.partition('.')
+                whole = f'{int(whole):,}'.replace(',', self.grouping)
+                source = f'{sign}{whole}{dot}{fraction}'
+            return source
+        if '.' in source or 'e' in source or self.decimals == 0:
+            return source
+        return f'{source}.0'
+
+    def format_many(
+        self, values: Iterable[float], *, markup: bool = False
+    ) -> list[str]:
+        """Format many floats, in a single C-level pass when the policy allows it.
+
+        Args:
+            values: The numbers to be formatted.
+            markup: See `format`. Defaults to False.
+
+        Returns:
+            The typst source of every number.
+        """
+        spec = self._fixed_spec
+        if spec is not None and not (markup and self.grouping):
+            return list(map(f'{{:{spec}}}'.format, values))
+        return [self.format(value, markup=markup) for value in values]
+
+
+_NUMBER_FORMAT: ContextVar[NumberFormat | None] = ContextVar(
+    'typstpy_number_format', default=None
+)
+
+
+def current_number_format() -> NumberFormat | None:
+    """Return the policy activated by `number_format`, or None for the shortest `repr`."""
+    return _NUMBER_FORMAT.get()
+
+
+@contextmanager
+def number_format(
+    policy: NumberFormat | None = None, /, **options: object
+) -> Iterator[NumberFormat | None]:
+    """Render floats with *policy*, or a `NumberFormat` built from *options*, inside this scope.
+
+    Floats are formatted when a call is built, so wrapping a single call in
+    this scope sets the policy for that call only.
+
+    Args:
+        policy: The policy to be used. None with no options restores the shortest `repr`. Defaults to None.
+
+    Raises:
+        TypeError: If both a policy and options are given.
+
+    Examples:
+        >>> from typstpy._core.render import render_value
+        >>> with number_format(decimals=2):
+        ...     render_value((0.1 + 0.2, 1.0))
+        '(0.30, 1.00)'
+    """
+    if options:
+        if policy is not None:
+            raise TypeError('Pass either a NumberFormat or its options, not both')
+        policy = NumberFormat(**options)  # type: ignore[arg-type]
+    token = _NUMBER_FORMAT.set(policy)
+    try:
+        yield policy
+    finally:
+        _NUMBER_FORMAT.reset(token)
+
+
+__all__ = ['NumberFormat', 'current_number_format', 'number_format']
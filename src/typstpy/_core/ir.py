@@ -3,6 +3,10 @@ from typing import Protocol
 import attrs
 
 
+class SupportsWrite(Protocol):
+    def write(self, s: str, /) -> object: ...
+
+
 class TypstExpr(Protocol):
     def render(self) -> str: ...
 
@@ -10,6 +14,14 @@ class TypstExpr(Protocol):
         """Render without outer parentheses, for use as inline function arguments."""
         ...
 
+    def render_into(self, writer: SupportsWrite) -> None:
+        """Write the rendered source piece by piece instead of returning it."""
+        ...
+
+    def render_content_into(self, writer: SupportsWrite) -> None:
+        """Write the source without outer parentheses piece by piece."""
+        ...
+
 
 @attrs.frozen
 class RawExpr:
@@ -21,6 +33,12 @@ class RawExpr:
     def render_content(self) -> str:
         return self.source
 
+    def render_into(self, writer: SupportsWrite) -> None:
+        writer.write(self.source)
+
+    def render_content_into(self, writer: SupportsWrite) -> None:
+        writer.write(self.source)
+
 
 @attrs.frozen
 class SequenceExpr:
@@ -32,6 +50,17 @@ class SequenceExpr:
     def render_content(self) -> str:
         return ', '.join(item.render() for item in self.items)
 
+    def render_into(self, writer: SupportsWrite) -> None:
+        writer.write('(')
+        self.render_content_into(writer)
+        writer.write(')')
+
+    def render_content_into(self, writer: SupportsWrite) -> None:
+        for index, item in enumerate(self.items):
+            if index:
+                writer.write(', ')
+            item.render_into(writer)
+
 
 @attrs.frozen
 class MappingExpr:
@@ -50,3 +79,16 @@ class MappingExpr:
         if not self.entries:
             return ':'
         return ', '.join(f'{key}: {value.render()}' for key, value in self.entries)
+
+    def render_into(self, writer: SupportsWrite) -> None:
+        writer.write('(')
+        self.render_content_into(writer)
+        writer.write(')')
+
+    def render_content_into(self, writer: SupportsWrite) -> None:
+        if not self.entries:
+            writer.write(':')
+            return
+        for index, (key, value) in enumerate(self.entries):
+            writer.write(f', {key}: ' if index else f'{key}: ')
+            value.render_into(writer)
@@ -0,0 +1,69 @@
+from collections.abc import Iterable
+
+MARKUP_SPECIALS = '\\#*_$@<>[]`~/=-+"'
+"""Characters escaped by `escape_markup`.
+
+Besides the characters that always have a meaning in markup, this includes the
+ones that only start structures at the beginning of a line (``=``, ``-``, ``+``
+and ``/``), since escaping them elsewhere does not change the output, and ``"``,
+which markup turns into a smart quote. Apostrophes are left as they are, so
+words such as "don't" keep their typographic apostrophe.
+"""
+
+_ESCAPES = str.maketrans({char: f'\\{char}' for char in MARKUP_SPECIALS})
+
+_SEPARATOR = '\x00'
+
+
+def escape_markup(text: str, /) -> str:
+    """Escape typst markup characters, so *text* is displayed verbatim inside a content block.
+
+    Args:
+        text: The raw text.
+
+    Returns:
+        The escaped text.
+
+    Examples:
+        >>> print(escape_markup('#1 *sale* @ $5'))
+        \\#1 \\*sale\\* \\@ \\$5
+    """
+    return text.translate(_ESCAPES)
+
+
+def escape_markup_many(texts: Iterable[str], /) -> list[str]:
+    """Escape many texts with a single `str.translate` pass over their concatenation.
+
+    Args:
+        texts: The raw texts.
+
+    Returns:
+        The escaped texts, in order.
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+    joined = _SEPARATOR.join(texts)
+    if joined.count(_SEPARATOR) != len(texts) - 1:
+        return [text.translate(_ESCAPES) for text in texts]
+    return joined.translate(_ESCAPES).split(_SEPARATOR)
+
+
+def escaped(text: str, /) -> str:
+    """Wrap raw text in a content block, escaping its markup characters.
+
+    Args:
+        text: The raw text.
+
+    Returns:
+        The content block.
+
+    Examples:
+        >>> from typstpy.std import text
+        >>> print(text(escaped('50% off_sale <today>'), fill='red'))
+        #text([50% off\\_sale \\<today\\>], fill: red)
+    """
+    return f'[{text.translate(_ESCAPES)}]'
+
+
+__all__ = ['MARKUP_SPECIALS', 'escaped', 'escape_markup', 'escape_markup_many']
@@ -0,0 +1,161 @@
+import sys
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from time import perf_counter
+from types import CodeType, FrameType
+from typing import Any, Literal, TypeAlias, final
+
+import attrs
+
+from .registry import Implement, implementation
+
+SortKey: TypeAlias = Literal['calls', 'cumulative', 'self', 'bytes']
+
+
+@attrs.define
+class FunctionStats:
+    """Counters of one registered function, collected by `profile`.
+
+    Times are in seconds. The self time excludes the time spent in other
+    registered functions called from this one.
+    """
+
+    calls: int = 0
+    cumulative: float = 0.0
+    self_time: float = 0.0
+    output_bytes: int = 0
+
+
+_SORT_FIELDS: dict[str, str] = {
+    'calls': 'calls',
+    'cumulative': 'cumulative',
+    'self': 'self_time',
+    'bytes': 'output_bytes',
+}
+
+
+@final
+class ProfileStats:
+    """Per-function counters keyed by `Implement.original_name`."""
+
+    def __init__(self) -> None:
+        self.functions: dict[str, FunctionStats] = {}
+
+    def to_json(self) -> dict[str, dict[str, Any]]:
+        """Return the counters as JSON-serializable dictionaries, keyed by typst name."""
+        return {
+            name: attrs.asdict(stats) for name, stats in sorted(self.functions.items())
+        }
+
+    def table(self, *, sort_by: SortKey = 'cumulative') -> str:
+        """Format the counters as a text table, in descending order.
+
+        Args:
+            sort_by: The column to sort by. Defaults to 'cumulative'.
+
+        Raises:
+            ValueError: If `sort_by` is not one of 'calls', 'cumulative', 'self' and 'bytes'.
+
+        Returns:
+            The table, one line per function.
+        """
+        field = _SORT_FIELDS.get(sort_by)
+        if field is None:
+            choices = ', '.join(repr(choice) for choice in _SORT_FIELDS)
+            raise ValueError(f'Invalid sort_by={sort_by!r}; expected one of: {choices}')
+        rows = sorted(
+            self.functions.items(),
+            key=lambda item: (-getattr(item[1], field), item[0]),
+        )
+        lines = [
+            f'{"function":<24} {"calls":>8} {"cumulative ms":>14} {"self ms":>10} {"bytes":>12}'
+        ]
+        lines.extend(
+            f'{name:<24} {stats.calls:>8} {stats.cumulative * 1e3:>14.3f} '
+            f'{stats.self_time * 1e3:>10.3f} {stats.output_bytes:>12}'
+            for name, stats in rows
+        )
+        return '\n'.join(lines)
+
+
+_BOUND = ''
+"""Name of a shared `__call__` code, such as the one of factory-made functions, whose typst name depends on `self`."""
+
+
+def _registered_codes() -> dict[CodeType, str]:
+    codes = {}
+    for func, implement in list(Implement.permanent.items()):
+        code = getattr(func, '__code__', None)
+        if code is not None:
+            codes[code] = implement.original_name
+            continue
+        code = getattr(type(func).__call__, '__code__', None)
+        if code is not None:
+            codes[code] = _BOUND
+    return codes
+
+
+def _make_hook(
+    functions: dict[str, FunctionStats],
+) -> Callable[[FrameType, str, Any], None]:
+    """Return a `sys.setprofile` hook that times the frames of registered functions."""
+    codes: dict[CodeType, str] = {}
+    registered = -1
+    # Each entry holds the frame, its typst name, the time spent in registered callees and its start time.
+    stack: list[list[Any]] = []
+
+    def hook(frame: FrameType, event: str, arg: Any) -> None:
+        nonlocal codes, registered
+        if event == 'call':
+            # Functions may be registered inside the scope, for example by a lazy std import.
+            if len(Implement.permanent) != registered:
+                codes, registered = _registered_codes(), len(Implement.permanent)
+            name = codes.get(frame.f_code)
+            if name == _BOUND:
+                implement = implementation(frame.f_locals.get('self'))
+                name = implement.original_name if implement is not None else None
+            if name is not None:
+                stack.append([frame, name, 0.0, perf_counter()])
+        elif event == 'return' and stack and stack[-1][0] is frame:
+            elapsed = perf_counter() - stack[-1][3]
+            _, name, callees, _ = stack.pop()
+            stats = functions.get(name)
+            if stats is None:
+                stats = functions[name] = FunctionStats()
+            stats.calls += 1
+            stats.cumulative += elapsed
+            stats.self_time += elapsed - callees
+            if type(arg) is str:
+                stats.output_bytes += len(arg) if arg.isascii() else len(arg.encode())
+            if stack:
+                stack[-1][2] += elapsed
+
+    return hook
+
+
+@contextmanager
+def profile() -> Iterator[ProfileStats]:
+    """Count calls, render time and output bytes of registered functions inside this scope.
+
+    Profiling uses `sys.setprofile`, so nothing is recorded, and nothing is
+    paid, outside the scope. Only calls made by the current thread are
+    counted, and output bytes only include functions returning `str`, not
+    `Content` built inside `deferred`.
+
+    Examples:
+        >>> from typstpy.std import text
+        >>> with profile() as stats:
+        ...     _ = text('[Hi]', fill='red')
+        >>> stats.functions['text'].calls, stats.functions['text'].output_bytes
+        (1, 22)
+    """
+    stats = ProfileStats()
+    previous = sys.getprofile()
+    sys.setprofile(_make_hook(stats.functions))
+    try:
+        yield stats
+    finally:
+        sys.setprofile(previous)
+
+
+__all__ = ['FunctionStats', 'ProfileStats', 'profile']
@@ -1,12 +1,21 @@
-from collections.abc import Callable
-
-from .registry import (
-    Implement,
-    keyword_defaults,
-    raise_unknown_fields,
+from collections.abc import Callable, Iterator
+
+from .arrays import is_numpy_array
+from .compiled import CompiledCall, compile_call
+from .content import (
+    ChildStream,
+    Content,
+    Fragment,
+    is_deferred,
+    join_fragments,
+    prefixed,
+    render_fragment,
 )
+from .registry import implementation, should_check
 from .render import render_content, render_value
 
+_Render = Callable[[object], Fragment]
+
 _SPREADABLE_CODE_PREFIXES = ('#color.map.',)
 """Typst color-map values (e.g. ``'#color.map.turbo'``) carry a ``#`` prefix
 in raw Python form; ``render_value()`` strips the ``#`` during rendering,
@@ -14,20 +23,39 @@ so the spread output becomes ``..color.map.turbo`` as expected by Typst.
 """
 
 
-def _filter_default_kwargs(
-    func: Callable[..., object], kwargs: dict[str, object]
-) -> dict[str, object]:
-    """Drop keyword arguments whose value matches the function's own default."""
-    defaults = keyword_defaults(func)
-    if func not in Implement.temporary:
-        raise_unknown_fields(func, kwargs)
-    if not defaults:
-        return kwargs
-    return {
-        key: value
-        for key, value in kwargs.items()
-        if key not in defaults or value != defaults[key]
-    }
+def _compiled(func: Callable[..., object]) -> CompiledCall:
+    """Return the `CompiledCall` built by `implement`, compiling unregistered functions on the fly."""
+    implement = implementation(func)
+    if implement is not None and implement.compiled is not None:
+        return implement.compiled
+    return compile_call(func, render_value(func))
+
+
+def _render_keywords(
+    func: Callable[..., object],
+    compiled: CompiledCall,
+    kwargs: dict[str, object],
+    render: _Render,
+) -> list[Fragment]:
+    """Render keyword arguments, dropping those that match the function's own default."""
+    return compiled.render_keywords(kwargs, checked=should_check(func), render=render)
+
+
+def _select_render() -> _Render:
+    """Return the argument renderer for the current scope, see `deferred`."""
+    return render_fragment if is_deferred() else render_value
+
+
+def _join_call(head: str, params: list[Fragment]) -> str | Content:
+    """Join rendered parameters into a call, as `Content` inside `deferred`."""
+    if is_deferred():
+        return join_fragments(head, params)
+    return head + ', '.join(params) + ')'  # type: ignore[arg-type]
+
+
+def _is_omitted_body(body: object) -> bool:
+    """Return True if the `normal` body is the empty placeholder and must be omitted."""
+    return isinstance(body, str | Content) and body == ''
 
 
 def _should_spread_color_map(child: object) -> bool:
@@ -35,32 +63,42 @@ def _should_spread_color_map(child: object) -> bool:
     return isinstance(child, str) and child.startswith(_SPREADABLE_CODE_PREFIXES)
 
 
-def _should_spread_list_sequence(func: Callable[..., object], child: object) -> bool:
-    """Return True if a single list/tuple *child* should be spread per the function's config."""
-    if isinstance(child, list | tuple):
-        impl = Implement.permanent.get(func)
-        if impl is not None:
-            return impl.spread_single
-    return False
+def _should_spread_list_sequence(compiled: CompiledCall, child: object) -> bool:
+    """Return True if a single list/tuple/array *child* should be spread per the function's config."""
+    return compiled.spread_single and (
+        isinstance(child, list | tuple) or is_numpy_array(child)
+    )
 
 
-def _should_spread_single_child(func: Callable[..., object], child: object) -> bool:
+def _should_spread_single_child(compiled: CompiledCall, child: object) -> bool:
     """Return True if a single child value should be spread into multiple arguments."""
-    return _should_spread_color_map(child) or _should_spread_list_sequence(func, child)
+    return _should_spread_color_map(child) or _should_spread_list_sequence(
+        compiled, child
+    )
+
+
+def _is_child_stream(compiled: CompiledCall, child: object) -> bool:
+    """Return True if a single iterator *child* yields the children of a spreading function."""
+    return compiled.spread_single and isinstance(child, Iterator)
 
 
 def _render_series_children(
-    func: Callable[..., object], children: tuple[object, ...]
-) -> list[str]:
-    """Render variadic children for series protocols, applying spread when needed."""
-    if not children:
-        return []
+    compiled: CompiledCall, children: tuple[object, ...], render: _Render
+) -> list[Fragment]:
+    """Render variadic children for series protocols, applying spread when needed.
+
+    A single iterator child supplies the children one by one. Inside `deferred`
+    it is kept as a `ChildStream` and only consumed when the result is written.
+    """
     if len(children) == 1:
         child = children[0]
-        if _should_spread_single_child(func, child):
-            return [f'..{render_value(child)}']
-        return [render_value(child)]
-    return [render_content(children)]
+        if _is_child_stream(compiled, child):
+            if is_deferred():
+                return [ChildStream(child)]  # type: ignore[arg-type]
+            return list(map(render, child))  # type: ignore[call-overload]
+        if _should_spread_single_child(compiled, child):
+            return [prefixed('..', render(child))]
+    return [render(child) for child in children]
 
 
 def set_(func: Callable[..., object], /, **kwargs: object) -> str:
@@ -75,11 +113,11 @@ def set_(func: Callable[..., object], /, **kwargs: object) -> str:
     Returns:
         Executable typst code.
     """
-    if func not in Implement.temporary:
-        raise_unknown_fields(func, kwargs)
-
-    params = render_content(kwargs) if kwargs else ''
-    return f'#set {render_value(func)}({params})'
+    compiled = _compiled(func)
+    params = compiled.render_keywords(
+        kwargs, checked=should_check(func), keep_defaults=True
+    )
+    return f'#set {compiled.name}({", ".join(params)})'
 
 
 def show_(element: object, appearance: object, /) -> str:
@@ -127,7 +165,7 @@ def normal(
     /,
     *args: object,
     **kwargs: object,
-) -> str:
+) -> str | Content:
     """Represent the protocol of `normal`.
 
     Args:
@@ -137,20 +175,19 @@ def normal(
     Returns:
         Executable typst code.
     """
-    kwargs = _filter_default_kwargs(func, kwargs)
+    compiled = _compiled(func)
+    render = _select_render()
 
     params = []
-    if body != '':
-        params.append(render_value(body))
-    if args:
-        params.append(render_content(args))
-    if kwargs:
-        params.append(render_content(kwargs))
+    if not _is_omitted_body(body):
+        params.append(render(body))
+    params.extend(map(render, args))
+    params.extend(_render_keywords(func, compiled, kwargs, render))
 
-    return f'#{render_value(func)}(' + ', '.join(params) + ')'
+    return _join_call(compiled.head, params)
 
 
-def positional(func: Callable[..., object], *args: object) -> str:
+def positional(func: Callable[..., object], *args: object) -> str | Content:
     """Represent the protocol of `positional`.
 
     Args:
@@ -159,25 +196,27 @@ def positional(func: Callable[..., object], *args: object) -> str:
     Returns:
         Executable typst code.
     """
+    if is_deferred():
+        return join_fragments(_compiled(func).head, map(render_fragment, args))
     return f'#{render_value(func)}{render_value(args)}'
 
 
-def call_(func: Callable[..., object], *args: object, **kwargs: object) -> str:
+def call_(
+    func: Callable[..., object], *args: object, **kwargs: object
+) -> str | Content:
     """Render a function call with explicit positional argument order."""
-    kwargs = _filter_default_kwargs(func, kwargs)
+    compiled = _compiled(func)
+    render = _select_render()
 
-    params = []
-    if args:
-        params.append(render_content(args))
-    if kwargs:
-        params.append(render_content(kwargs))
+    params = list(map(render, args))
+    params.extend(_render_keywords(func, compiled, kwargs, render))
 
-    return f'#{render_value(func)}(' + ', '.join(params) + ')'
+    return _join_call(compiled.head, params)
 
 
 def instance(
     func: Callable[..., object], instance: object, /, *args: object, **kwargs: object
-) -> str:
+) -> str | Content:
     """Represent the protocol of `pre_instance`.
 
     Args:
@@ -187,18 +226,20 @@ def instance(
     Returns:
         Executable typst code.
     """
-    kwargs = _filter_default_kwargs(func, kwargs)
+    compiled = _compiled(func)
+    render = _select_render()
 
-    params = []
-    if args:
-        params.append(render_content(args))
-    if kwargs:
-        params.append(render_content(kwargs))
+    params = list(map(render, args))
+    params.extend(_render_keywords(func, compiled, kwargs, render))
 
-    return f'{instance}.{render_value(func)}(' + ', '.join(params) + ')'
+    if is_deferred():
+        return Content(instance, join_fragments(f'.{compiled.name}(', params))  # type: ignore[arg-type]
+    return f'{instance}.{compiled.name}(' + ', '.join(params) + ')'  # type: ignore[arg-type]
 
 
-def pre_series(func: Callable[..., object], *children: object, **kwargs: object) -> str:
+def pre_series(
+    func: Callable[..., object], *children: object, **kwargs: object
+) -> str | Content:
     """Represent the protocol of `pre_series`, which means that `children` will be prepended.
 
     Args:
@@ -207,18 +248,18 @@ def pre_series(func: Callable[..., object], *children: object, **kwargs: object)
     Returns:
         Executable typst code.
     """
-    kwargs = _filter_default_kwargs(func, kwargs)
+    compiled = _compiled(func)
+    render = _select_render()
 
-    params = _render_series_children(func, children)
-    if kwargs:
-        params.append(render_content(kwargs))
+    params = _render_series_children(compiled, children, render)
+    params.extend(_render_keywords(func, compiled, kwargs, render))
 
-    return f'#{render_value(func)}(' + ', '.join(params) + ')'
+    return _join_call(compiled.head, params)
 
 
 def post_series(
     func: Callable[..., object], *children: object, **kwargs: object
-) -> str:
+) -> str | Content:
     """Represent the protocol of `post_series`, which means that `children` will be postfixed.
 
     Args:
@@ -227,11 +268,10 @@ def post_series(
     Returns:
         Executable typst code.
     """
-    kwargs = _filter_default_kwargs(func, kwargs)
+    compiled = _compiled(func)
+    render = _select_render()
 
-    params = []
-    if kwargs:
-        params.append(render_content(kwargs))
-    params.extend(_render_series_children(func, children))
+    params = _render_keywords(func, compiled, kwargs, render)
+    params.extend(_render_series_children(compiled, children, render))
 
-    return f'#{render_value(func)}(' + ', '.join(params) + ')'
+    return _join_call(compiled.head, params)
@@ -1,47 +1,247 @@
-from collections.abc import Callable, Iterable, Mapping
-from typing import ClassVar, Self
-from weakref import WeakKeyDictionary, WeakSet
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from types import MappingProxyType
+from typing import TYPE_CHECKING, ClassVar, Generic, TypeVar, final
+from weakref import ref
 
 import attrs
 
+if TYPE_CHECKING:
+    from .compiled import CompiledCall
+
+_V = TypeVar('_V')
+
+
+class _CopyOnWrite(Generic[_V]):
+    """Weakly keyed table of functions, published as a new dict on every write.
+
+    Readers look up the current dict without locking; it is never mutated once
+    published, so lookups and iteration stay safe while other threads register
+    functions, including on free-threaded builds. Writers copy the dict under a
+    lock. Functions that are garbage collected are queued by their weak
+    reference callback and dropped at the next write or `len`, so the callback
+    never takes the lock.
+    """
+
+    __slots__ = ('_entries', '_lock', '_dead', '__weakref__')
+
+    def __init__(self) -> None:
+        self._entries: dict[ref[Callable], _V] = {}
+        self._lock = Lock()
+        self._dead: list[ref[Callable]] = []
+
+    def _discard(self, key: ref[Callable]) -> None:
+        self._dead.append(key)
+
+    def _live_copy(self) -> dict[ref[Callable], _V]:
+        """Copy the entries without the collected functions, with the lock held."""
+        entries = dict(self._entries)
+        while self._dead:
+            entries.pop(self._dead.pop(), None)
+        return entries
+
+    def _store(self, func: Callable, value: _V) -> None:
+        with self._lock:
+            entries = self._live_copy()
+            entries[ref(func, self._discard)] = value
+            self._entries = entries
+
+    def _purge(self) -> None:
+        with self._lock:
+            self._entries = self._live_copy()
+
+    def _lookup(self, func: object) -> _V | None:
+        try:
+            return self._entries.get(ref(func))  # type: ignore[arg-type]
+        except TypeError:
+            return None
+
+    def __contains__(self, func: object, /) -> bool:
+        return self._lookup(func) is not None
+
+    def __iter__(self) -> Iterator[Callable]:
+        for key in self._entries:
+            func = key()
+            if func is not None:
+                yield func
+
+    def __len__(self) -> int:
+        if self._dead:
+            self._purge()
+        return len(self._entries)
+
+
+@final
+class FunctionRegistry(_CopyOnWrite[_V], Mapping[Callable, _V]):
+    """Mapping of registered functions, safe to read while other threads register."""
+
+    __slots__ = ()
+
+    def __getitem__(self, func: Callable, /) -> _V:
+        value = self._lookup(func)
+        if value is None:
+            raise KeyError(func)
+        return value
+
+    def __setitem__(self, func: Callable, value: _V, /) -> None:
+        self._store(func, value)
+
+    def get(self, func: object, default: object = None, /) -> _V | None:  # type: ignore[override]
+        value = self._lookup(func)
+        return default if value is None else value  # type: ignore[return-value]
+
+
+@final
+class FunctionSet(_CopyOnWrite[bool]):
+    """Set of functions, safe to read while other threads add to it."""
+
+    __slots__ = ()
+
+    def add(self, func: Callable, /) -> None:
+        self._store(func, True)
+
 
 @attrs.frozen
 class Implement:
-    permanent: ClassVar[WeakKeyDictionary[Callable, Self]] = WeakKeyDictionary()
-    temporary: ClassVar[WeakSet[Callable]] = WeakSet()
+    permanent: ClassVar[FunctionRegistry['Implement']] = FunctionRegistry()
+    temporary: ClassVar[FunctionSet] = FunctionSet()
 
     original_name: str
     hyperlink: str | None = None
     version: str | None = None
     spread_single: bool = False
+    compiled: 'CompiledCall | None' = attrs.field(default=None, eq=False, repr=False)
+    choices: Mapping[str, frozenset[object]] = attrs.field(
+        factory=lambda: MappingProxyType({}), eq=False
+    )
+
+
+_IMPLEMENT_ATTR = '__typstpy_implement__'
+_TEMPORARY_ATTR = '__typstpy_temporary__'
+
+
+def mark(func: Callable, attr: str, value: object = True) -> None:
+    """Attach *value* to *func*, together with a weak reference to *func*.
+
+    `functools.wraps` copies `__dict__` into the wrapper, so the reference
+    tells the marked function apart from wrappers that only inherited the
+    attribute.
+    """
+    setattr(func, attr, (ref(func), value))
+
+
+def _owns(func: object, marked: tuple[ref[Callable], object]) -> bool:
+    """Return True if *func* is the function *marked* was attached to.
+
+    Transparent proxies, such as the wrappers of `deprecated`, compare equal to
+    the function they wrap, as they did as keys of `Implement.permanent`.
+    """
+    owner = marked[0]()
+    return owner is func or (owner is not None and owner == func)
+
+
+def implementation(func: object) -> Implement | None:
+    """Return the `Implement` record that `implement` attached to *func*, if any.
+
+    The record is read from the function object itself, so the protocols never
+    hash a weak reference on every call; `Implement.permanent` is kept for
+    enumerating registered functions. Wrappers copying the attributes of a
+    registered function are not registered themselves.
+    """
+    marked = getattr(func, _IMPLEMENT_ATTR, None)
+    if marked is None or not _owns(func, marked):
+        return None
+    return marked[1]  # type: ignore[return-value]
+
+
+def is_temporary(func: object) -> bool:
+    """Return True if *func* was made by a factory of `customizations`, see `temporary`."""
+    marked = getattr(func, _TEMPORARY_ATTR, None)
+    return marked is not None and _owns(func, marked)
 
 
 def function_label(func: Callable[..., object]) -> str:
-    implement = Implement.permanent.get(func, None)
+    implement = implementation(func)
     if implement is not None:
         return implement.original_name
     return getattr(func, '__name__', repr(func))
 
 
 def keyword_defaults(func: Callable[..., object]) -> dict[str, object]:
-    return func.__kwdefaults__ or {}
+    return getattr(func, '__kwdefaults__', None) or {}
 
 
-def raise_unknown_fields(
-    func: Callable[..., object], kwargs: Mapping[str, object]
-) -> None:
-    defaults = keyword_defaults(func)
-    invalid = sorted(set(kwargs) - set(defaults))
-    if invalid:
-        fields = ', '.join(invalid)
-        raise TypeError(f'{function_label(func)} does not accept field(s): {fields}')
+def unknown_fields_error(label: str, invalid: Iterable[str]) -> TypeError:
+    fields = ', '.join(invalid)
+    return TypeError(f'{label} does not accept field(s): {fields}')
+
+
+def invalid_value_error(
+    label: str, name: str, value: object, allowed: Iterable[object]
+) -> ValueError:
+    choices = ', '.join(repr(choice) for choice in sorted(allowed, key=repr))
+    return ValueError(
+        f'{label} got invalid {name}={value!r}; expected one of: {choices}'
+    )
+
+
+_UNCHECKED: ContextVar[bool | None] = ContextVar('typstpy_unchecked', default=None)
+_process_unchecked = False
+
+
+def set_unchecked(enabled: bool, /) -> bool:
+    """Turn validation off process-wide, or back on.
+
+    A scope entered with `unchecked` takes precedence within its context.
+
+    Returns:
+        Whether validation was off before.
+    """
+    global _process_unchecked
+    previous, _process_unchecked = _process_unchecked, enabled
+    return previous
+
+
+def is_checked() -> bool:
+    """Return True if arguments are validated in the current context, see `unchecked`."""
+    unchecked = _UNCHECKED.get()
+    if unchecked is None:
+        return not _process_unchecked
+    return not unchecked
+
+
+@contextmanager
+def unchecked(enabled: bool = True, /) -> Iterator[None]:
+    """Skip unknown-field checks and value validation inside this scope.
+
+    The scope is bound to the current context, so other threads and asyncio
+    tasks keep validating. Invalid arguments are then rendered as given.
+
+    Args:
+        enabled: Whether validation is skipped. Pass False to re-enable it within an outer scope or after `set_unchecked`. Defaults to True.
+
+    Examples:
+        >>> from typstpy.std import stack
+        >>> with unchecked():
+        ...     stack('[a]', dir='diagonal')
+        '#stack(dir: diagonal, [a])'
+    """
+    token = _UNCHECKED.set(enabled)
+    try:
+        yield
+    finally:
+        _UNCHECKED.reset(token)
+
+
+def should_check(func: Callable[..., object]) -> bool:
+    """Return True if the fields of *func* are validated, which excludes factory-made functions."""
+    return is_checked() and not is_temporary(func)
 
 
 def validate_value(
     func: Callable[..., object], name: str, value: object, allowed: Iterable[object]
 ) -> None:
-    if value not in allowed:
-        choices = ', '.join(repr(choice) for choice in sorted(allowed, key=repr))
-        raise ValueError(
-            f'{function_label(func)} got invalid {name}={value!r}; expected one of: {choices}'
-        )
+    if is_checked() and value not in allowed:
+        raise invalid_value_error(function_label(func), name, value, allowed)
@@ -1,18 +1,47 @@
+import sys
 import warnings
-from collections.abc import Callable, Iterable, Mapping
-from functools import singledispatch
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache, singledispatch
+from threading import Lock
+from types import MappingProxyType, NoneType
+from typing import Any, NamedTuple
 
+from .arrays import is_numpy_object, register_numpy
+from .formatting import _NUMBER_FORMAT
 from .ir import MappingExpr, RawExpr, SequenceExpr, TypstExpr
-from .registry import Implement
+from .registry import implementation
 
 
+@lru_cache(maxsize=1024)
 def _render_key(key: str) -> str:
-    """Convert Python snake_case parameter names to Typst kebab-case."""
+    """Convert Python snake_case parameter names to Typst kebab-case.
+
+    Keyword parameters of registered functions use the prefixes compiled by
+    `compile_call`; the cache serves the keys of mapping values.
+    """
     return key.replace('_', '-')
 
 
+_numpy_registered = False
+
+
+def _register_numpy_for(obj: object) -> bool:
+    """Register NumPy types on first sight of a NumPy object, see `arrays.register_numpy`."""
+    global _numpy_registered
+    if _numpy_registered or not is_numpy_object(obj):
+        return False
+    register_numpy(sys.modules['numpy'])
+    _numpy_registered = True
+    return True
+
+
 @singledispatch
 def _to_expr(obj: object) -> TypstExpr:
+    if _register_numpy_for(obj):
+        return _to_expr(obj)
     return RawExpr(str(obj))
 
 
@@ -21,6 +50,11 @@ def _(obj: bool | None) -> TypstExpr:
     return RawExpr(str(obj).lower())
 
 
+@_to_expr.register
+def _(obj: float) -> TypstExpr:
+    return RawExpr(_render_float(obj))
+
+
 @_to_expr.register
 def _(obj: str) -> TypstExpr:
     if obj.startswith('#'):
@@ -44,6 +78,8 @@ def _(obj: Mapping) -> TypstExpr:
 
 @_to_expr.register
 def _(obj: Iterable) -> TypstExpr:
+    if _register_numpy_for(obj):
+        return _to_expr(obj)
     return SequenceExpr(tuple(_to_expr(v) for v in obj))
 
 
@@ -54,7 +90,7 @@ def _(obj: Callable) -> TypstExpr:
     Unregistered callables fall back to ``__name__`` with a warning,
     since the correct Typst name cannot be inferred automatically.
     """
-    implement = Implement.permanent.get(obj, None)
+    implement = implementation(obj)
     if implement is None:
         warnings.warn(
             f'The function {obj} has not been registered. '
@@ -65,8 +101,226 @@ def _(obj: Callable) -> TypstExpr:
     return RawExpr(implement.original_name)
 
 
+def _render_str(obj: str) -> str:
+    if obj.startswith('#'):
+        return obj[1:]
+    return obj
+
+
+def _render_float(obj: float) -> str:
+    policy = _NUMBER_FORMAT.get()
+    if policy is None:
+        return float.__repr__(obj)
+    return policy.format(obj)
+
+
+def _render_keyword(obj: bool | None) -> str:
+    return str(obj).lower()
+
+
+def _render_sequence_content(obj: tuple | list) -> str:
+    return ', '.join([render_value(item) for item in obj])
+
+
+def _render_sequence(obj: tuple | list) -> str:
+    return f'({_render_sequence_content(obj)})'
+
+
+def _render_mapping_content(obj: Mapping) -> str:
+    if not obj:
+        return ':'
+    return ', '.join(
+        [f'{_render_key(key)}: {render_value(value)}' for key, value in obj.items()]
+    )
+
+
+def _render_mapping(obj: Mapping) -> str:
+    return f'({_render_mapping_content(obj)})'
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+_HASHABLE_SCALARS = frozenset({str, int, bool, NoneType})
+
+
+def _cache_key(obj: object) -> Hashable | None:
+    """Return a type-aware key for *obj*, or None if it cannot be cached.
+
+    Keys carry the exact type of every element, since ``1``, ``1.0`` and ``True``
+    compare equal but render differently. `RenderCache` adds the active
+    `NumberFormat`, which changes how floats are rendered.
+    """
+    cls = type(obj)
+    if cls in _HASHABLE_SCALARS:
+        return (cls, obj)
+    if cls is float:
+        return (cls, repr(obj))
+    if cls is tuple:
+        keys = []
+        for item in obj:  # type: ignore[attr-defined]
+            key = _cache_key(item)
+            if key is None:
+                return None
+            keys.append(key)
+        return (cls, tuple(keys))
+    if cls is MappingProxyType:
+        entries = []
+        for name, value in obj.items():  # type: ignore[attr-defined]
+            key = _cache_key(value)
+            if key is None or type(name) is not str:
+                return None
+            entries.append((name, key))
+        return (cls, tuple(entries))
+    return None
+
+
+class RenderCache:
+    """Bounded LRU cache of rendered tuples and `MappingProxyType` values.
+
+    Scalars are not cached since the exact-type renderers are cheaper than a
+    lookup; lists and dicts are skipped since they are not hashable.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Create an empty cache.
+
+        Args:
+            maxsize: The maximum number of rendered values to keep. Defaults to 1024.
+
+        Raises:
+            ValueError: If `maxsize` is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError(f'maxsize must be positive, got {maxsize}')
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def render(self, obj: object, render: Callable[[Any], str]) -> str:
+        """Return the cached output of ``render(obj)``, rendering it on a miss."""
+        key = _cache_key(obj)
+        if key is None:
+            return render(obj)
+        key = (render, _NUMBER_FORMAT.get(), key)
+        with self._lock:
+            source = self._entries.get(key)
+            if source is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return source
+            self._misses += 1
+        source = render(obj)
+        with self._lock:
+            self._entries[key] = source
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return source
+
+    def info(self) -> CacheInfo:
+        """Return the hit and miss counters and the current size."""
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._maxsize, len(self._entries)
+            )
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_process_cache: RenderCache | None = None
+_context_cache: ContextVar[RenderCache | None] = ContextVar('typstpy_render_cache')
+
+
+def set_render_cache(cache: RenderCache | None, /) -> RenderCache | None:
+    """Enable *cache* process-wide, or disable caching with None.
+
+    A cache activated by `render_cache` takes precedence within its scope.
+
+    Returns:
+        The previous process-wide cache.
+    """
+    global _process_cache
+    previous, _process_cache = _process_cache, cache
+    return previous
+
+
+@contextmanager
+def render_cache(cache: RenderCache | None = None, /) -> Iterator[RenderCache]:
+    """Use *cache*, or a new `RenderCache`, within the current context.
+
+    Examples:
+        >>> with render_cache() as cache:
+        ...     _ = render_value(('1fr', '1fr')), render_value(('1fr', '1fr'))
+        >>> cache.info()
+        CacheInfo(hits=1, misses=1, maxsize=1024, currsize=1)
+    """
+    if cache is None:
+        cache = RenderCache()
+    token = _context_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _context_cache.reset(token)
+
+
+def _cached(render: Callable[[Any], str]) -> Callable[[Any], str]:
+    def wrapper(obj: Any) -> str:
+        cache = _context_cache.get(_process_cache)
+        if cache is None:
+            return render(obj)
+        return cache.render(obj, render)
+
+    return wrapper
+
+
+_SCALAR_RENDERERS: dict[type, Callable[[Any], str]] = {
+    str: _render_str,
+    int: int.__repr__,
+    float: _render_float,
+    bool: _render_keyword,
+    NoneType: _render_keyword,
+}
+"""Exact-type renderers for builtin scalars, which bypass `_to_expr` and its IR nodes."""
+
+_VALUE_RENDERERS: dict[type, Callable[[Any], str]] = {
+    **_SCALAR_RENDERERS,
+    tuple: _cached(_render_sequence),
+    list: _render_sequence,
+    dict: _render_mapping,
+    MappingProxyType: _cached(_render_mapping),
+}
+"""Exact-type renderers tried by `render_value` before falling back to `_to_expr`.
+
+Subclasses and other ABC matches still go through `singledispatch`, whose output
+these renderers reproduce exactly.
+"""
+
+_CONTENT_RENDERERS: dict[type, Callable[[Any], str]] = {
+    **_SCALAR_RENDERERS,
+    tuple: _cached(_render_sequence_content),
+    list: _render_sequence_content,
+    dict: _render_mapping_content,
+    MappingProxyType: _cached(_render_mapping_content),
+}
+"""Exact-type renderers tried by `render_content` before falling back to `_to_expr`."""
+
+
 def render_value(obj: object) -> str:
     """Render a Python object to its full Typst source representation."""
+    render = _VALUE_RENDERERS.get(type(obj))
+    if render is not None:
+        return render(obj)
     return _to_expr(obj).render()
 
 
@@ -76,4 +330,7 @@ def render_content(obj: object) -> str:
     Equivalent to ``strip_brace(render_value(obj))`` but implemented at the IR
     level to avoid fragile character-index assumptions.
     """
+    render = _CONTENT_RENDERERS.get(type(obj))
+    if render is not None:
+        return render(obj)
     return _to_expr(obj).render_content()
@@ -35,10 +35,15 @@ class ExampleBlock:
 
 
 def ensure_registry_loaded() -> None:
-    """Import modules whose decorators populate the implementation registry."""
-    import typstpy.std  # noqa: F401
+    """Import modules whose decorators populate the implementation registry.
+
+    `typstpy.std` loads its submodules lazily, so they are imported explicitly.
+    """
+    import typstpy.std
     import typstpy.subpar  # noqa: F401
 
+    typstpy.std._load_all()
+
 
 def _iter_public_function_paths() -> Iterable[tuple[Callable[..., Any], str]]:
     for module_name, prefix in (('typstpy.std', 'std'), ('typstpy.subpar', 'subpar')):
@@ -105,6 +110,26 @@ def collect_implement_records(
     return sorted(records, key=lambda record: record.qualname)
 
 
+def collect_choice_schemas(
+    functions: Iterable[Callable[..., Any]] | None = None,
+) -> dict[str, dict[str, list[Any]]]:
+    """Return the declared choices of registered functions, keyed by qualname and parameter.
+
+    Choices are sorted by `repr`, so the result can be serialized as stable JSON.
+    """
+    if functions is None:
+        functions = iter_registered_functions()
+
+    schemas: dict[str, dict[str, list[Any]]] = {}
+    for func in functions:
+        choices = Implement.permanent[func].choices
+        if choices:
+            schemas[function_qualname(func)] = {
+                name: sorted(allowed, key=repr) for name, allowed in choices.items()
+            }
+    return dict(sorted(schemas.items()))
+
+
 def _is_top_level_section_heading(line: str) -> bool:
     if not line or line[0].isspace():
         return False
@@ -155,6 +180,7 @@ def collect_example_blocks(
 __all__ = [
     'ExampleBlock',
     'ImplementRecord',
+    'collect_choice_schemas',
     'collect_example_blocks',
     'collect_implement_records',
     'ensure_registry_loaded',
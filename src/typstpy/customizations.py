@@ -1,4 +1,7 @@
-from collections.abc import Callable
+import inspect
+from collections.abc import Callable, Iterable, Mapping
+from functools import wraps
+from typing import Any, Literal, TypeAlias, final
 
 from typstpy._core import call_ as _call_
 from typstpy._core import implement, temporary
@@ -8,7 +11,103 @@ from typstpy._core import positional as _positional
 from typstpy._core import post_series as _post_series
 from typstpy._core import pre_series as _pre_series
 
+_Recipe: TypeAlias = tuple[Callable[..., Callable[..., str]], tuple[object, ...]]
 
+
+@final
+class _Binding:
+    """Function built by a factory of this module.
+
+    Pickling stores only the factory call that built it, so unpickling in
+    another process, such as a `ProcessPoolExecutor` worker, calls the factory
+    there and registers the function again.
+    """
+
+    def __init__(
+        self,
+        recipe: _Recipe,
+        call: str,
+        original_name: str,
+        protocol: Callable[..., Any],
+        keywords: Mapping[str, object] | None = None,
+    ) -> None:
+        self._recipe = recipe
+        self._call = call
+        self._protocol = protocol
+        self.__name__ = self.__qualname__ = original_name
+        self.__kwdefaults__ = dict(keywords) if keywords is not None else None
+        self.__doc__ = f'Interface of `{original_name}` in typst, made by `{call}`.'
+        parameters = list(inspect.signature(protocol).parameters.values())[1:]
+        if keywords is not None:
+            parameters = [
+                parameter
+                for parameter in parameters
+                if parameter.kind is not parameter.VAR_KEYWORD
+            ] + [
+                inspect.Parameter(key, inspect.Parameter.KEYWORD_ONLY, default=default)
+                for key, default in keywords.items()
+            ]
+        self.__signature__ = inspect.Signature(parameters)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> str:
+        defaults = self.__kwdefaults__
+        if defaults is not None:
+            # Pass every keyword in declaration order, as the std functions do, so calls
+            # without keywords take the compiled all-defaults path.
+            kwargs = {**defaults, **kwargs} if kwargs else defaults
+        return self._protocol(self, *args, **kwargs)
+
+    def __reduce__(self) -> _Recipe:
+        return self._recipe
+
+    def __repr__(self) -> str:
+        return self._call
+
+
+def _bind(
+    factory: Callable[[str], Callable[..., str]],
+    original_name: str,
+    protocol: Callable[..., Any],
+    *,
+    spread_single: bool = False,
+) -> Callable[..., str]:
+    """Build and register the function of a public factory, marked `temporary` so its keywords are not checked."""
+    binding = _Binding(
+        (factory, (original_name,)),
+        f'{factory.__name__}({original_name!r})',
+        original_name,
+        protocol,
+    )
+    return temporary(implement(original_name, spread_single=spread_single)(binding))
+
+
+_FACTORIES: dict[tuple[object, ...], Callable[..., str]] = {}
+"""Functions built by the factories, keyed by factory, original name and options."""
+
+
+def _interned(
+    factory: Callable[[str], Callable[..., str]],
+) -> Callable[[str], Callable[..., str]]:
+    """Make a factory build one function per original name and return that same function on later calls.
+
+    Repeated calls, such as ``normal('pad')`` inside a loop, then cost a dictionary
+    lookup instead of registering a new function each time.
+    """
+    protocol = factory.__name__
+
+    @wraps(factory)
+    def interned(original_name: str, /) -> Callable[..., str]:
+        key = (protocol, original_name)
+        func = _FACTORIES.get(key)
+        if func is None:
+            # Threads racing on the same key all get the function stored first.
+            func = _FACTORIES.setdefault(key, factory(original_name))
+        return func
+
+    return interned
+
+
+@_interned
 def call_(original_name: str, /) -> Callable[..., str]:
     """Function factory, create function that represent the protocol of `call_`.
 
@@ -16,22 +115,17 @@ def call_(original_name: str, /) -> Callable[..., str]:
         original_name: The original function name in typst.
 
     Returns:
-        A function that represent the protocol of `call_`.
+        A function that represent the protocol of `call_`, shared by every call with the same original name.
 
     Examples:
         >>> demo = call_('demo')
         >>> demo(1, 2, 3, fill='red')
         '#demo(1, 2, 3, fill: red)'
     """
-
-    @temporary
-    @implement(original_name)
-    def wrapped(*args, **kwargs) -> str:
-        return _call_(wrapped, *args, **kwargs)
-
-    return wrapped
+    return _bind(call_, original_name, _call_)
 
 
+@_interned
 def normal(original_name: str, /) -> Callable[..., str]:
     """Function factory, create function that represent the protocol of `normal`.
 
@@ -39,7 +133,7 @@ def normal(original_name: str, /) -> Callable[..., str]:
         original_name: The original function name in typst.
 
     Returns:
-        A function that represent the protocol of `normal`.
+        A function that represent the protocol of `normal`, shared by every call with the same original name.
 
     Examples:
         >>> pad = normal('pad')
@@ -55,15 +149,10 @@ def normal(original_name: str, /) -> Callable[..., str]:
         >>> pagebreak(weak=True)
         '#pagebreak(weak: true)'
     """
-
-    @temporary
-    @implement(original_name)
-    def wrapped(body='', /, *args, **kwargs) -> str:
-        return _normal(wrapped, body, *args, **kwargs)
-
-    return wrapped
+    return _bind(normal, original_name, _normal)
 
 
+@_interned
 def instance(original_name: str, /) -> Callable[..., str]:
     """Function factory, create function that represent the protocol of `instance`.
 
@@ -71,7 +160,7 @@ def instance(original_name: str, /) -> Callable[..., str]:
         original_name: The original function name in typst.
 
     Returns:
-        A function that represent the protocol of `instance`.
+        A function that represent the protocol of `instance`, shared by every call with the same original name.
 
     Examples:
         >>> rgb = positional('rgb')
@@ -79,15 +168,10 @@ def instance(original_name: str, /) -> Callable[..., str]:
         >>> color_lighten(rgb(255, 255, 255), '50%')
         '#rgb(255, 255, 255).lighten(50%)'
     """
-
-    @temporary
-    @implement(original_name)
-    def wrapped(instance, /, *args, **kwargs) -> str:
-        return _instance(wrapped, instance, *args, **kwargs)
-
-    return wrapped
+    return _bind(instance, original_name, _instance)
 
 
+@_interned
 def positional(original_name: str, /) -> Callable[..., str]:
     """Function factory, create function that represent the protocol of `positional`.
 
@@ -95,22 +179,17 @@ def positional(original_name: str, /) -> Callable[..., str]:
         original_name: The original function name in typst.
 
     Returns:
-        A function that represent the protocol of `positional`.
+        A function that represent the protocol of `positional`, shared by every call with the same original name.
 
     Examples:
         >>> rgb = positional('rgb')
         >>> rgb(255, 255, 255, '50%')
         '#rgb(255, 255, 255, 50%)'
     """
-
-    @temporary
-    @implement(original_name)
-    def wrapped(*args) -> str:
-        return _positional(wrapped, *args)
-
-    return wrapped
+    return _bind(positional, original_name, _positional)
 
 
+@_interned
 def post_series(original_name: str, /) -> Callable[..., str]:
     """Function factory, create function that represent the protocol of `Series`.
 
@@ -118,7 +197,7 @@ def post_series(original_name: str, /) -> Callable[..., str]:
         original_name: The original function name in typst.
 
     Returns:
-        A function that represent the protocol of `Series`.
+        A function that represent the protocol of `Series`, shared by every call with the same original name.
 
     Examples:
         >>> table = post_series('table')
@@ -138,15 +217,10 @@ def post_series(original_name: str, /) -> Callable[..., str]:
         ... )
         '#table(columns: (1fr, 2fr, 3fr), rows: (1fr, 2fr, 3fr), gutter: (1fr, 2fr, 3fr), column-gutter: (1fr, 2fr, 3fr), row-gutter: (1fr, 2fr, 3fr), fill: red, align: (center, center, center), [1], [2], [3])'
     """
-
-    @temporary
-    @implement(original_name, spread_single=True)
-    def wrapped(*children, **kwargs) -> str:
-        return _post_series(wrapped, *children, **kwargs)
-
-    return wrapped
+    return _bind(post_series, original_name, _post_series, spread_single=True)
 
 
+@_interned
 def pre_series(original_name: str, /) -> Callable[..., str]:
     """Function factory, create function that represent the protocol of `Series`.
 
@@ -154,7 +228,7 @@ def pre_series(original_name: str, /) -> Callable[..., str]:
         original_name: The original function name in typst.
 
     Returns:
-        A function that represent the protocol of `Series`.
+        A function that represent the protocol of `Series`, shared by every call with the same original name.
 
     Examples:
         >>> subpar_grid = pre_series('subpar.grid')
@@ -169,13 +243,122 @@ def pre_series(original_name: str, /) -> Callable[..., str]:
         ... )
         '#subpar.grid([], [], columns: (1fr, 1fr), caption: [A figure composed of two sub figures.], label: <full>)'
     """
+    return _bind(pre_series, original_name, _pre_series, spread_single=True)
+
+
+DeclaredProtocol: TypeAlias = Literal[
+    'call_', 'normal', 'instance', 'pre_series', 'post_series'
+]
+
+_DECLARED_PROTOCOLS: dict[str, tuple[Callable[..., Any], bool]] = {
+    'call_': (_call_, False),
+    'normal': (_normal, False),
+    'instance': (_instance, False),
+    'pre_series': (_pre_series, True),
+    'post_series': (_post_series, True),
+}
+"""The protocol function and `spread_single` flag behind each protocol name accepted by `declare`."""
+
+
+def _options_key(
+    keywords: Mapping[str, object], choices: Mapping[str, Iterable[object]]
+) -> tuple[object, ...]:
+    """Spell declared options as a hashable key, since defaults such as ``{}`` are not hashable."""
+    return (
+        tuple((key, repr(default)) for key, default in keywords.items()),
+        tuple(
+            sorted(
+                (key, tuple(sorted(map(repr, values))))
+                for key, values in choices.items()
+            )
+        ),
+    )
+
+
+def _declared(
+    original_name: str,
+    keywords: Mapping[str, object],
+    protocol: DeclaredProtocol,
+    choices: Mapping[str, Iterable[object]],
+) -> Callable[..., str]:
+    """Call `declare` with positional arguments only, as unpickling does."""
+    return declare(original_name, keywords, protocol=protocol, choices=choices)
+
+
+def declare(
+    original_name: str,
+    /,
+    keywords: Mapping[str, object],
+    *,
+    protocol: DeclaredProtocol = 'normal',
+    choices: Mapping[str, Iterable[object]] | None = None,
+) -> Callable[..., str]:
+    """Function factory, create function with declared keyword parameters that renders like the std functions.
+
+    Unlike the other factories, the function rejects undeclared keywords, checks
+    values against `choices` and leaves out arguments equal to their default,
+    all through the keyword table compiled by `implement`.
 
-    @temporary
-    @implement(original_name, spread_single=True)
-    def wrapped(*children, **kwargs) -> str:
-        return _pre_series(wrapped, *children, **kwargs)
+    Args:
+        original_name: The original function name in typst.
+        keywords: Mapping of keyword parameter name to its default, in typst's parameter order.
+        protocol: The protocol the function represents. Defaults to 'normal'.
+        choices: Mapping of keyword parameter name to its allowed values. Defaults to None.
 
-    return wrapped
+    Raises:
+        ValueError: If `protocol` is unknown, a keyword is not an identifier, or `choices` names an unknown keyword or excludes a default.
 
+    Returns:
+        A function that represent the protocol, shared by every call with the same arguments.
 
-__all__ = ['call_', 'normal', 'instance', 'positional', 'post_series', 'pre_series']
+    Examples:
+        >>> mitex = declare(
+        ...     'mitex',
+        ...     {'block': True, 'numbering': None},
+        ...     choices={'block': (True, False)},
+        ... )
+        >>> mitex('`x^2`')
+        '#mitex(`x^2`)'
+        >>> mitex('`x^2`', block=False, numbering='"(1)"')
+        '#mitex(`x^2`, block: false, numbering: "(1)")'
+        >>> mitex('`x^2`', size='2em')
+        Traceback (most recent call last):
+        ...
+        TypeError: mitex does not accept field(s): size
+    """
+    if protocol not in _DECLARED_PROTOCOLS:
+        choices_ = ', '.join(repr(name) for name in _DECLARED_PROTOCOLS)
+        raise ValueError(f'Invalid protocol={protocol!r}; expected one of: {choices_}')
+    invalid = [key for key in keywords if not key.isidentifier()]
+    if invalid:
+        raise ValueError(f'Invalid keyword name(s): {", ".join(map(repr, invalid))}')
+    choices = choices or {}
+    key = ('declare', protocol, original_name, _options_key(keywords, choices))
+    func = _FACTORIES.get(key)
+    if func is not None:
+        return func
+
+    render, spread_single = _DECLARED_PROTOCOLS[protocol]
+    options = f', protocol={protocol!r}' if protocol != 'normal' else ''
+    if choices:
+        options += f', choices={dict(choices)!r}'
+    binding = _Binding(
+        (_declared, (original_name, dict(keywords), protocol, dict(choices))),
+        f'declare({original_name!r}, {dict(keywords)!r}{options})',
+        original_name,
+        render,
+        keywords,
+    )
+    implement(original_name, spread_single=spread_single, choices=choices)(binding)
+    return _FACTORIES.setdefault(key, binding)
+
+
+__all__ = [
+    'call_',
+    'declare',
+    'normal',
+    'instance',
+    'positional',
+    'post_series',
+    'pre_series',
+]
@@ -1,24 +1,298 @@
+import re
+import sys
+from collections import Counter
+from collections.abc import Mapping
+from contextlib import AbstractContextManager, nullcontext
 from io import StringIO
-from typing import final
+from typing import TYPE_CHECKING, Any, Literal, TypeAlias, final
+
+import attrs
+
+from typstpy._core import Content, NumberFormat, number_format
+from typstpy._core.ir import SupportsWrite
+
+if TYPE_CHECKING:
+    from typstpy.memory import MemoryTracker
+
+Section: TypeAlias = Literal['imports', 'set_rules', 'show_rules', 'contents']
+
+_NAME = r'[A-Za-z_][\w-]*(?:\.[A-Za-z_][\w-]*)*'
+
+_HEAD_RE = re.compile(rf'#(?:(?:set|show) )?({_NAME})')
+
+_MARKUP_TOKENS = re.compile(rf'\\.|`+|#(?:(?:set|show) )?({_NAME})\(|\]', re.DOTALL)
+"""Escapes, raw text, calls and the end of a content block, in markup."""
+
+_CODE_TOKENS = re.compile(rf'"|`+|({_NAME})?\(|\)|\[|\]')
+"""Strings, raw text, calls, parentheses and content blocks, in code."""
+
+_STRING_TOKENS = re.compile(r'\\.|"', re.DOTALL)
+
+_TOKEN_CHARS = frozenset('_.#\\`-')
+
+_SCAN_BATCH = 1 << 16
+
+_MARKUP = '<markup>'
+_UNTRACKED = '<untracked>'
+
+_BLOCK = ''
+"""Stack entry of a content block, whose contents are markup; open parentheses are None."""
+
+
+def _partial_token(s: str) -> int:
+    """Return where the trailing characters that may continue as a token in the next piece start."""
+    index = len(s)
+    while index and (s[index - 1].isalnum() or s[index - 1] in _TOKEN_CHARS):
+        index -= 1
+    return index
+
+
+class _SizeCounter:
+    """Writer that charges every byte of an entry to the innermost typst call enclosing it.
+
+    The source is scanned as it is written, keeping a stack of open calls,
+    parentheses and content blocks, so nested calls are attributed to their own
+    function and the entry is never held as a single string. Bytes outside any
+    call go to the function named at the start of the entry, or `'<markup>'`.
+    """
+
+    __slots__ = (
+        'functions',
+        'size',
+        '_head',
+        '_stack',
+        '_string',
+        '_raw',
+        '_pending',
+        '_buffered',
+    )
+
+    def __init__(self, functions: Counter[str]) -> None:
+        self.functions = functions
+        self.size = 0
+        self._head: str | None = None
+        self._stack: list[str | None] = []
+        self._string = False
+        self._raw = ''
+        self._pending: list[str] = []
+        self._buffered = 0
+
+    def write(self, s: str, /) -> None:
+        if self._head is None:
+            if not s:
+                return
+            match = _HEAD_RE.match(s)
+            self._head = match.group(1) if match else _MARKUP
+        # Small pieces, such as the cells of a deferred table, are scanned in batches.
+        self._pending.append(s)
+        self._buffered += len(s)
+        if self._buffered >= _SCAN_BATCH:
+            s = ''.join(self._pending)
+            index = _partial_token(s)
+            self._pending, self._buffered = [s[index:]], len(s) - index
+            self._scan(s[:index])
+
+    def close(self) -> None:
+        """Charge the bytes still held back."""
+        s = ''.join(self._pending)
+        self._pending, self._buffered = [], 0
+        self._scan(s)
+
+    def _owner(self) -> str:
+        for name in reversed(self._stack):
+            if name:
+                return name
+        return self._head or _MARKUP
+
+    def _charge(self, text: str) -> None:
+        if text:
+            size = len(text) if text.isascii() else len(text.encode())
+            self.size += size
+            self.functions[self._owner()] += size
+
+    def _scan(self, s: str) -> None:
+        """Scan a piece, charging each span to its owner when a call opens or closes."""
+        position = mark = 0
+        stack = self._stack
+        while position < len(s):
+            if self._raw:
+                end = s.find(self._raw, position)
+                if end < 0:
+                    break
+                position = end + len(self._raw)
+                self._raw = ''
+                continue
+            if self._string:
+                match = _STRING_TOKENS.search(s, position)
+                if match is None:
+                    break
+                position = match.end()
+                self._string = match.group() != '"'
+                continue
+            code = bool(stack) and stack[-1] != _BLOCK
+            match = (_CODE_TOKENS if code else _MARKUP_TOKENS).search(s, position)
+            if match is None:
+                break
+            token = match.group()
+            position = match.end()
+            if token.endswith('('):
+                name = match.group(1)
+                if name:
+                    self._charge(s[mark : match.start()])
+                    mark = match.start()
+                stack.append(name)
+            elif token == ')':
+                if stack and stack[-1] != _BLOCK:
+                    if stack[-1]:
+                        self._charge(s[mark:position])
+                        mark = position
+                    stack.pop()
+            elif token == ']':
+                if stack and stack[-1] == _BLOCK:
+                    stack.pop()
+            elif token == '[':
+                stack.append(_BLOCK)
+            elif token == '"':
+                self._string = True
+            elif token.startswith('`') and len(token) != 2:
+                self._raw = token
+        self._charge(s[mark:])
+
+
+def _measure(entry: str | Content, functions: Counter[str]) -> int:
+    """Charge the bytes of an entry to the typst functions writing them and return its UTF-8 size.
+
+    Children drawn from an iterator are kept, so the document can still be rendered afterwards.
+    """
+    counter = _SizeCounter(functions)
+    if isinstance(entry, Content):
+        entry.render_into(counter, buffer=True)
+    else:
+        counter.write(entry)
+    counter.close()
+    return counter.size
+
+
+@attrs.frozen
+class SizeReport:
+    """Bytes of a rendered document attributed to sections, typst functions and call sites.
+
+    Section sizes include the line breaks between entries, so they add up to
+    `total`. Each typst function is charged the bytes it writes itself, so a
+    `table` nested in a `figure` counts towards `table`, and bytes outside any
+    call go to the function the entry starts with. Call sites are the Python
+    lines that added the entries, which are only known for documents created
+    with ``track_sources=True``.
+    """
+
+    total: int
+    sections: Mapping[str, int]
+    functions: Mapping[str, int]
+    sites: Mapping[str, int]
+
+    def to_json(self) -> dict[str, Any]:
+        """Return the report as JSON-serializable dictionaries, largest first."""
+        return {
+            'total': self.total,
+            'sections': dict(self.sections),
+            'functions': dict(self.functions),
+            'sites': dict(self.sites),
+        }
+
+    def summary(self, *, limit: int = 10) -> str:
+        """Format the largest entries of every breakdown as a text report.
+
+        Args:
+            limit: The number of rows kept per breakdown. Defaults to 10.
+
+        Returns:
+            The report.
+        """
+        lines = [f'total: {self.total} bytes']
+        for title, sizes in (
+            ('sections', self.sections),
+            ('functions', self.functions),
+            ('call sites', self.sites),
+        ):
+            lines.append(f'{title}:')
+            lines.extend(
+                f'  {size:>12} {size / (self.total or 1):>7.1%}  {key}'
+                for key, size in list(sizes.items())[:limit]
+            )
+        return '\n'.join(lines)
+
+
+def _largest_first(sizes: Counter[str]) -> dict[str, int]:
+    return dict(sorted(sizes.items(), key=lambda item: (-item[1], item[0])))
 
 
 @final
 class Document:
     """Mutable builder for Typst document source sections."""
 
-    def __init__(self) -> None:
-        self._contents: list[str] = []
+    def __init__(
+        self,
+        *,
+        number_format: NumberFormat | None = None,
+        track_sources: bool = False,
+    ) -> None:
+        """Create an empty document.
+
+        Args:
+            number_format: The float formatting policy activated by `formatting` and while the document is rendered. Floats are formatted when a call is built, so entries must be built inside `formatting` for it to apply; rendering only formats the children drawn from iterators inside `deferred`. Defaults to None.
+            track_sources: Whether the Python line adding each entry is recorded for `size_report`. Defaults to False.
+        """
+        self.number_format = number_format
+        self._contents: list[str | Content] = []
         self._import_statements: list[str] = []
         self._set_rules: list[str] = []
         self._show_rules: list[str] = []
+        self._sites: dict[Section, list[str]] | None = (
+            {'imports': [], 'set_rules': [], 'show_rules': [], 'contents': []}
+            if track_sources
+            else None
+        )
+
+    def _record_site(self, section: Section) -> None:
+        """Record the line that called the public `add_*` method."""
+        frame = sys._getframe(2)
+        self._sites[section].append(f'{frame.f_code.co_filename}:{frame.f_lineno}')  # type: ignore[index]
+
+    def track_memory(self, *, frames: int = 16) -> 'MemoryTracker':
+        """Create a `MemoryTracker` measuring allocations while this document is built and rendered.
+
+        Args:
+            frames: The number of frames stored per allocation. Defaults to 16.
+
+        Returns:
+            The tracker, which stops the tracing it started when closed or used as a context manager.
+        """
+        from typstpy.memory import MemoryTracker
+
+        return MemoryTracker(self, frames=frames)
 
-    def add_content(self, content: str, /) -> None:
+    def formatting(self) -> AbstractContextManager[NumberFormat | None]:
+        """Render floats with the document's `number_format` inside this scope.
+
+        Examples:
+            >>> from typstpy.std import table
+            >>> document = Document(number_format=NumberFormat(decimals=1))
+            >>> with document.formatting():
+            ...     document.add_content(table(1 / 3, 2.0))
+            >>> str(document)
+            '#table(0.3, 2.0)'
+        """
+        return number_format(self.number_format)
+
+    def add_content(self, content: str | Content, /) -> None:
         """Add a content to the document.
 
         Args:
-            content: The content to be added.
+            content: The content to be added. `Content` built inside `deferred` is kept by reference and flattened when the document is rendered.
         """
         self._contents.append(content)
+        if self._sites is not None:
+            self._record_site('contents')
 
     def add_import(self, statement: str, /) -> None:
         """Import names to the document.
@@ -30,6 +304,8 @@ class Document:
             `std.import_`
         """
         self._import_statements.append(statement)
+        if self._sites is not None:
+            self._record_site('imports')
 
     def add_set_rule(self, set_rule: str, /) -> None:
         """Add a set rule to the document.
@@ -41,6 +317,8 @@ class Document:
             `std.set_`
         """
         self._set_rules.append(set_rule)
+        if self._sites is not None:
+            self._record_site('set_rules')
 
     def add_show_rule(self, show_rule: str, /) -> None:
         """Add a show rule to the document.
@@ -52,6 +330,95 @@ class Document:
             `std.show_`
         """
         self._show_rules.append(show_rule)
+        if self._sites is not None:
+            self._record_site('show_rules')
+
+    def render_into(self, writer: SupportsWrite, /, *, buffer: bool = False) -> None:
+        """Write import statements, set rules, show rules and contents into a text stream.
+
+        Contents are written piece by piece, so `Content` built inside `deferred` is never flattened into one string.
+        Contents added as `str` are already complete strings and are written as they are, so streaming a large
+        call with bounded memory requires building it inside `deferred`.
+
+        Args:
+            writer: Any object with a `write` method accepting strings, such as an opened text file.
+            buffer: Whether children drawn from an iterator are kept once rendered, so the document can be written again. Defaults to False.
+
+        Raises:
+            RuntimeError: If children drawn from an iterator were already written without `buffer`.
+        """
+        with self._rendering():
+            self._write(writer, buffer)
+
+    def _rendering(self) -> AbstractContextManager[object]:
+        """Activate the document's `number_format` while rendering, leaving an outer scope in place if it has none."""
+        if self.number_format is None:
+            return nullcontext()
+        return self.formatting()
+
+    def _write(self, writer: SupportsWrite, buffer: bool) -> None:
+        if self._import_statements:
+            writer.write('\n'.join(self._import_statements))
+            writer.write('\n\n')
+        if self._set_rules:
+            writer.write('\n'.join(self._set_rules))
+            writer.write('\n\n')
+        if self._show_rules:
+            writer.write('\n'.join(self._show_rules))
+            writer.write('\n\n')
+        for index, content in enumerate(self._contents):
+            if index:
+                writer.write('\n\n')
+            if isinstance(content, Content):
+                content.render_into(writer, buffer=buffer)
+            else:
+                writer.write(content)
+
+    def size_report(self) -> SizeReport:
+        """Attribute the bytes of the rendered document to sections, typst functions and call sites.
+
+        Entries are rendered one at a time, so the document is never held as a single string.
+        Children drawn from an iterator are kept once rendered, so the document can still be rendered afterwards.
+
+        Returns:
+            The report, with every breakdown sorted largest first.
+
+        Examples:
+            >>> from typstpy.std import set_, table, text
+            >>> document = Document()
+            >>> document.add_set_rule(set_(text, size='9pt'))
+            >>> document.add_content(table('[a]', '[b]', columns=2))
+            >>> document.size_report().functions
+            {'table': 28, 'text': 20}
+        """
+        sections: Counter[str] = Counter()
+        functions: Counter[str] = Counter()
+        sites: Counter[str] = Counter()
+        for section, entries, separator in (
+            ('imports', self._import_statements, 1),
+            ('set_rules', self._set_rules, 1),
+            ('show_rules', self._show_rules, 1),
+            ('contents', self._contents, 2),
+        ):
+            if not entries:
+                continue
+            recorded = self._sites[section] if self._sites is not None else ()
+            # Entries are rendered as `render_into` would, since buffered children are reused by later renders.
+            with self._rendering():
+                for index, entry in enumerate(entries):
+                    size = _measure(entry, functions)
+                    sections[section] += size
+                    sites[recorded[index] if recorded else _UNTRACKED] += size
+            sections[section] += separator * (len(entries) - 1)
+            if section != 'contents':
+                # Header sections end with a blank line.
+                sections[section] += 2
+        return SizeReport(
+            sum(sections.values()),
+            _largest_first(sections),
+            _largest_first(functions),
+            _largest_first(sites),
+        )
 
     def __str__(self) -> str:
         """Incorporate import statements, set rules, show rules and contents into a single string.
@@ -60,17 +427,8 @@ class Document:
             The content of the document.
         """
         with StringIO() as stream:
-            if self._import_statements:
-                stream.write('\n'.join(self._import_statements))
-                stream.write('\n\n')
-            if self._set_rules:
-                stream.write('\n'.join(self._set_rules))
-                stream.write('\n\n')
-            if self._show_rules:
-                stream.write('\n'.join(self._show_rules))
-                stream.write('\n\n')
-            stream.write('\n\n'.join(self._contents))
+            self.render_into(stream, buffer=True)
             return stream.getvalue()
 
 
-__all__ = ['Document']
+__all__ = ['Document', 'SizeReport']
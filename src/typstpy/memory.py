@@ -0,0 +1,229 @@
+"""Memory accounting for `Document` builds, based on `tracemalloc` snapshots."""
+
+import tracemalloc
+import warnings
+from collections import Counter
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from types import TracebackType
+from typing import TYPE_CHECKING, Self, final
+
+import attrs
+
+from typstpy._core import Implement
+
+if TYPE_CHECKING:
+    from typstpy.document import Document
+
+
+@attrs.frozen
+class MemoryReport:
+    """Allocations measured by a `MemoryTracker`, in bytes.
+
+    `peak` is the highest traced memory above the level at the start of any
+    batch or render. `sections` holds the bytes still allocated at the end of
+    each batch, summed per label, and `functions` attributes them to the
+    innermost registered function on each allocation's traceback. Functions
+    built by the `customizations` factories are counted together under
+    `'<customizations>'`.
+    """
+
+    peak: int
+    render_peak: int
+    sections: Mapping[str, int]
+    functions: Mapping[str, int]
+
+    def summary(self, *, limit: int = 10) -> str:
+        """Format the report as text, keeping the largest `limit` sections and functions.
+
+        Args:
+            limit: The number of rows kept per breakdown. Defaults to 10.
+
+        Returns:
+            The report.
+        """
+        lines = [f'peak: {self.peak} bytes', f'render peak: {self.render_peak} bytes']
+        for title, sizes in (
+            ('sections', self.sections),
+            ('functions', self.functions),
+        ):
+            lines.append(f'{title}:')
+            lines.extend(
+                f'  {size:>12}  {key}' for key, size in list(sizes.items())[:limit]
+            )
+        return '\n'.join(lines)
+
+
+_FACTORY_MADE = '<customizations>'
+"""Name charged with the allocations of functions built by the `customizations` factories."""
+
+
+def _registered_lines() -> dict[tuple[str, int], str]:
+    """Map each source line of a registered function to its typst name.
+
+    Functions built by the `customizations` factories share the `__call__` of
+    their class, and allocations only record file names and line numbers, so
+    their lines are charged to `'<customizations>'` instead of a typst name.
+    """
+    lines = {}
+    for func, implement in list(Implement.permanent.items()):
+        code = getattr(func, '__code__', None)
+        name = implement.original_name
+        if code is None:
+            code = getattr(type(func).__call__, '__code__', None)
+            name = _FACTORY_MADE
+            if code is None:
+                continue
+        for _, _, line in code.co_lines():
+            if line is not None:
+                lines.setdefault((code.co_filename, line), name)
+    return lines
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    """Take a snapshot without the allocations of `tracemalloc` itself, such as earlier snapshots."""
+    return tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, tracemalloc.__file__)]
+    )
+
+
+def _largest_first(sizes: Counter[str]) -> dict[str, int]:
+    return dict(sorted(sizes.items(), key=lambda item: (-item[1], item[0])))
+
+
+@final
+class MemoryTracker:
+    """Opt-in allocation tracking around batches of `Document.add_content` and around rendering.
+
+    The tracker starts `tracemalloc` when the first batch or render begins,
+    unless it is already tracing, and stops it again on `close`. Tracing started
+    elsewhere with fewer than `frames` frames per allocation may not reach the
+    registered functions, so the tracker warns and `MemoryReport.functions` can
+    come back incomplete. Create it with `Document.track_memory`.
+
+    Examples:
+        >>> from typstpy import Document
+        >>> from typstpy.std import par
+        >>> document = Document()
+        >>> with document.track_memory() as tracker:
+        ...     with tracker.batch('body'):
+        ...         for i in range(100):
+        ...             document.add_content(par(f'[Paragraph {i}]'))
+        ...     source = tracker.render()
+        >>> report = tracker.report()
+        >>> list(report.sections), next(iter(report.functions))
+        (['body'], 'par')
+    """
+
+    def __init__(self, document: 'Document', /, *, frames: int = 16) -> None:
+        """Create a tracker for a document.
+
+        Args:
+            document: The document whose build is measured.
+            frames: The number of frames stored per allocation, which must reach the registered function calling the protocols. Defaults to 16.
+        """
+        self._document = document
+        self._frames = frames
+        self._started = False
+        self._checked = False
+        self._peak = 0
+        self._render_peak = 0
+        self._sections: Counter[str] = Counter()
+        self._functions: Counter[str] = Counter()
+
+    def _start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self._frames)
+            self._started = True
+        elif not self._checked and tracemalloc.get_traceback_limit() < self._frames:
+            warnings.warn(
+                f'tracemalloc is already tracing with {tracemalloc.get_traceback_limit()} '
+                f'frame(s) per allocation, fewer than frames={self._frames}; '
+                'allocations may not be attributed to functions. '
+                'Start tracemalloc with more frames or let the tracker start it.',
+                RuntimeWarning,
+                stacklevel=3,
+            )
+        self._checked = True
+
+    def _begin(self) -> int:
+        """Reset the peak, returning the traced memory it is measured from."""
+        tracemalloc.reset_peak()
+        return tracemalloc.get_traced_memory()[0]
+
+    def _end(self, baseline: int) -> int:
+        """Record the peak since `_begin` and return it."""
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        self._peak = max(self._peak, peak)
+        return peak
+
+    @contextmanager
+    def batch(self, label: str = 'contents', /) -> Iterator[None]:
+        """Measure the allocations made inside this scope, typically a loop of `Document.add_content`.
+
+        Args:
+            label: The section the retained bytes are counted under. Defaults to 'contents'.
+        """
+        self._start()
+        before = _take_snapshot()
+        baseline = self._begin()
+        try:
+            yield
+        finally:
+            self._record(label, before, baseline)
+
+    def _record(self, label: str, before: tracemalloc.Snapshot, baseline: int) -> None:
+        """Record the peak of a batch and the bytes it retained, even if the batch raised."""
+        self._end(baseline)
+        after = _take_snapshot()
+        lines = _registered_lines()
+        for stat in after.compare_to(before, 'traceback'):
+            if stat.size_diff <= 0:
+                continue
+            self._sections[label] += stat.size_diff
+            for frame in reversed(stat.traceback):
+                name = lines.get((frame.filename, frame.lineno))
+                if name is not None:
+                    self._functions[name] += stat.size_diff
+                    break
+
+    def render(self) -> str:
+        """Render the document with `str`, recording the peak memory used.
+
+        Returns:
+            The content of the document.
+        """
+        self._start()
+        baseline = self._begin()
+        source = str(self._document)
+        self._render_peak = max(self._render_peak, self._end(baseline))
+        return source
+
+    def report(self) -> MemoryReport:
+        """Return what was measured so far."""
+        return MemoryReport(
+            self._peak,
+            self._render_peak,
+            _largest_first(self._sections),
+            _largest_first(self._functions),
+        )
+
+    def close(self) -> None:
+        """Stop `tracemalloc` if this tracker started it."""
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+__all__ = ['MemoryReport', 'MemoryTracker']
@@ -0,0 +1,39 @@
+"""Pytest fixtures for asserting memory budgets of `Document` builds.
+
+Enable them with ``pytest_plugins = ['typstpy.pytest_plugin']`` in a root ``conftest.py``.
+"""
+
+from collections.abc import Callable, Iterator
+
+try:
+    import pytest
+except ImportError as e:  # pragma: no cover - pytest is a development dependency
+    raise ImportError(
+        'typstpy.pytest_plugin requires pytest, install it with `pip install pytest`'
+    ) from e
+
+from typstpy.document import Document
+from typstpy.memory import MemoryTracker
+
+
+@pytest.fixture
+def document_memory() -> Iterator[Callable[[Document], MemoryTracker]]:
+    """Provide a function creating a `MemoryTracker` for a document, closed after the test.
+
+    A test builds its document inside `MemoryTracker.batch` scopes, renders it
+    with `MemoryTracker.render` and asserts on `MemoryTracker.report`, for
+    instance ``assert tracker.report().peak < 50 * 2**20``.
+    """
+    trackers: list[MemoryTracker] = []
+
+    def track(document: Document, /) -> MemoryTracker:
+        tracker = document.track_memory()
+        trackers.append(tracker)
+        return tracker
+
+    yield track
+    for tracker in reversed(trackers):
+        tracker.close()
+
+
+__all__ = ['document_memory']
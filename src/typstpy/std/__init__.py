@@ -2,24 +2,146 @@
 Implement functions from the typst standard library.
 Current support version: 0.14.2.
 Libraries that won't be realized: `Foundations`, `Math`, `Symbols`, `Introspection`, `Data Loading`.
+
+Submodules are imported on first attribute access (PEP 562), so importing this
+package does not run their decorators until a function is used.
 """
 
-# ruff: noqa: F403
+import importlib
+import sys
+from types import ModuleType
+from typing import Any
 
 from typstpy._core import import_, set_, show_
-from typstpy.std import layout as _layout
-from typstpy.std import model as _model
-from typstpy.std import text as _text
-from typstpy.std import visualize as _visualize
-from typstpy.std.layout import *
-from typstpy.std.model import *
-from typstpy.std.text import *
-from typstpy.std.visualize import *
-
-__all__ = (
-    ['import_', 'set_', 'show_']
-    + _layout.__all__
-    + _model.__all__
-    + _text.__all__
-    + _visualize.__all__
-)
+
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    'layout': (
+        'align',
+        'block',
+        'box',
+        'colbreak',
+        'columns',
+        'grid',
+        'hide',
+        'layout',
+        'measure',
+        'move',
+        'pad',
+        'page',
+        'pagebreak',
+        'place',
+        'repeat',
+        'rotate',
+        'scale',
+        'skew',
+        'hspace',
+        'vspace',
+        'stack',
+    ),
+    'model': (
+        'bibliography',
+        'bullet_list',
+        'cite',
+        'document',
+        'emph',
+        'figure',
+        'footnote',
+        'heading',
+        'link',
+        'numbered_list',
+        'numbering',
+        'outline',
+        'par',
+        'parbreak',
+        'quote',
+        'ref',
+        'strong',
+        'table',
+        'title',
+        'terms',
+    ),
+    'text': (
+        'highlight',
+        'linebreak',
+        'lorem',
+        'lower',
+        'overline',
+        'raw',
+        'smallcaps',
+        'smartquote',
+        'strike',
+        'subscript',
+        'superscript',
+        'text',
+        'underline',
+        'upper',
+    ),
+    'visualize': (
+        'circle',
+        'luma',
+        'oklab',
+        'oklch',
+        'rgb',
+        'cmyk',
+        'color',
+        'curve',
+        'ellipse',
+        'gradient',
+        'image',
+        'line',
+        'path',
+        'pattern',
+        'polygon',
+        'rect',
+        'square',
+        'tiling',
+    ),
+}
+"""The `__all__` of every submodule, mirrored here so it is known without importing them."""
+
+_OWNERS = {name: module for module, names in _EXPORTS.items() for name in names}
+
+
+class _StdModule(ModuleType):
+    """Keep the functions named after their submodule (`layout` and `text`) bound on this package.
+
+    The import system binds every imported submodule on its parent package,
+    which would otherwise replace those functions with their modules.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if isinstance(value, ModuleType) and _OWNERS.get(name) == name:
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+def _load(submodule: str) -> ModuleType:
+    """Import a submodule and bind its exports on this package."""
+    module = importlib.import_module(f'{__name__}.{submodule}')
+    globals().update((name, getattr(module, name)) for name in _EXPORTS[submodule])
+    return module
+
+
+def _load_all() -> None:
+    """Import every submodule, registering all their functions."""
+    for submodule in _EXPORTS:
+        _load(submodule)
+
+
+def __getattr__(name: str) -> Any:
+    owner = _OWNERS.get(name)
+    if owner is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    _load(owner)
+    return globals()[name]
+
+
+def __dir__() -> list[str]:
+    return sorted(globals().keys() | _OWNERS.keys())
+
+
+__all__ = ['import_', 'set_', 'show_'] + [
+    name for names in _EXPORTS.values() for name in names
+]
+
+sys.modules[__name__].__class__ = _StdModule
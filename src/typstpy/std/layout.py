@@ -1,11 +1,19 @@
-from typstpy._constants import VALID_PAPER_SIZES
+from typstpy._constants import (
+    VALID_HLINE_POSITIONS,
+    VALID_PAGE_BINDINGS,
+    VALID_PAGEBREAK_TARGETS,
+    VALID_PAPER_SIZES,
+    VALID_SCOPES,
+    VALID_STACK_DIRECTIONS,
+    VALID_VLINE_POSITIONS,
+)
 from typstpy._core import (
     attach_func,
     call_,
     implement,
     normal,
     post_series,
-    validate_value,
+    render_columns,
 )
 from typstpy.std.text import lorem  # noqa
 from typstpy.std.visualize import rect  # noqa
@@ -289,6 +297,7 @@ def _grid_cell(
     'grid.hline',
     hyperlink='https://typst.app/docs/reference/layout/grid/#definitions-hline',
     version='0.14.2',
+    choices={'position': VALID_HLINE_POSITIONS},
 )
 def _grid_hline(
     *,
@@ -313,8 +322,6 @@ def _grid_hline(
     Returns:
         Executable typst code.
     """
-    validate_value(_grid_hline, 'position', position, {'top', 'bottom'})
-
     return normal(
         _grid_hline, y=y, start=start, end=end, stroke=stroke, position=position
     )
@@ -325,6 +332,7 @@ def _grid_hline(
     'grid.vline',
     hyperlink='https://typst.app/docs/reference/layout/grid/#definitions-vline',
     version='0.14.2',
+    choices={'position': VALID_VLINE_POSITIONS},
 )
 def _grid_vline(
     *,
@@ -349,8 +357,6 @@ def _grid_vline(
     Returns:
         Executable typst code.
     """
-    validate_value(_grid_vline, 'position', position, {'start', 'end', 'left', 'right'})
-
     return normal(
         _grid_vline, x=x, start=start, end=end, stroke=stroke, position=position
     )
@@ -393,12 +399,39 @@ def _grid_footer(*children, repeat=True):
     return post_series(_grid_footer, *children, repeat=repeat)
 
 
+def _grid_from_columns(data, /, *, formatters=None, header=True, **kwargs):
+    """Build a `grid` from columnar data, rendering the header and all cells in one pass.
+
+    Args:
+        data: Mapping of column name to column values. Values may be sequences, buffers or objects implementing `__array__`, such as pandas, polars or NumPy columns.
+        formatters: Mapping of column name to a function returning the typst source of one cell. Defaults to None, which renders values as content blocks with markup characters of strings escaped.
+        header: Whether to emit the column names as a `grid.header`. Defaults to True.
+        **kwargs: Keyword arguments forwarded to `grid`. `columns` defaults to the number of columns.
+
+    Raises:
+        ValueError: If the columns are empty, have different lengths or a formatter names an unknown column.
+
+    Returns:
+        Executable typst code.
+
+    Examples:
+        >>> grid.from_columns({'name': ['a', 'b'], 'qty': [1, 2]}, gutter='1em')
+        '#grid(columns: 2, gutter: 1em, grid.header([name], [qty]), [a], [1], [b], [2])'
+    """
+    names, cells = render_columns(data, formatters)
+    kwargs.setdefault('columns', len(names))
+    if header:
+        return grid(_grid_header(*names), *cells, **kwargs)
+    return grid(*cells, **kwargs)
+
+
 # * Typst docs verified on 2026-05-23: https://typst.app/docs/reference/layout/grid/; parameters match; stroke default updated to dict() per official docs.
 @attach_func(_grid_cell, 'cell')
 @attach_func(_grid_hline, 'hline')
 @attach_func(_grid_vline, 'vline')
 @attach_func(_grid_header, 'header')
 @attach_func(_grid_footer, 'footer')
+@attach_func(_grid_from_columns, 'from_columns')
 @implement(
     'grid',
     hyperlink='https://typst.app/docs/reference/layout/grid/',
@@ -612,6 +645,7 @@ def pad(
     'page',
     hyperlink='https://typst.app/docs/reference/layout/page/',
     version='0.14.2',
+    choices={'paper': VALID_PAPER_SIZES, 'binding': VALID_PAGE_BINDINGS},
 )
 def page(
     body='',
@@ -678,10 +712,6 @@ def page(
         fields = ', '.join(sorted(kwargs))
         raise TypeError(f'page does not accept field(s): {fields}')
 
-    validate_value(page, 'paper', paper, VALID_PAPER_SIZES)
-    if binding != 'auto':
-        validate_value(page, 'binding', binding, {'left', 'right'})
-
     return normal(
         page,
         body,
@@ -710,6 +740,7 @@ def page(
     'pagebreak',
     hyperlink='https://typst.app/docs/reference/layout/pagebreak/',
     version='0.14.2',
+    choices={'to': VALID_PAGEBREAK_TARGETS},
 )
 def pagebreak(*, weak=False, to=None):
     """Interface of `pagebreak` in typst. See [the documentation](https://typst.app/docs/reference/layout/pagebreak/) for more information.
@@ -732,9 +763,6 @@ def pagebreak(*, weak=False, to=None):
         >>> pagebreak(to='"even"')
         '#pagebreak(to: "even")'
     """
-    if to is not None:
-        validate_value(pagebreak, 'to', to, {'"even"', '"odd"'})
-
     return normal(pagebreak, weak=weak, to=to)
 
 
@@ -763,6 +791,7 @@ def _place_flush():
     'place',
     hyperlink='https://typst.app/docs/reference/layout/place/',
     version='0.14.2',
+    choices={'scope': VALID_SCOPES},
 )
 def place(
     body,
@@ -798,8 +827,6 @@ def place(
         >>> place(lorem(20), 'top')
         '#place(top, lorem(20))'
     """
-    validate_value(place, 'scope', scope, {'"column"', '"parent"'})
-
     if alignment == 'start':
         return normal(
             place,
@@ -1014,6 +1041,7 @@ def vspace(amount, /, *, weak=False):
     hyperlink='https://typst.app/docs/reference/layout/stack/',
     version='0.14.2',
     spread_single=True,
+    choices={'dir': VALID_STACK_DIRECTIONS},
 )
 def stack(
     *children,
@@ -1044,8 +1072,6 @@ def stack(
         ... )
         '#stack(dir: btt, ..(rect(width: 40pt), rect(width: 120pt), rect(width: 90pt)))'
     """
-    validate_value(stack, 'dir', dir, {'ltr', 'rtl', 'ttb', 'btt'})
-
     return post_series(stack, *children, dir=dir, spacing=spacing)
 
 
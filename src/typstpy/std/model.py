@@ -1,5 +1,14 @@
 from types import MappingProxyType
 
+from typstpy._constants import (
+    VALID_CITATION_FORMS,
+    VALID_HLINE_POSITIONS,
+    VALID_LINEBREAKS,
+    VALID_NUMBERING_SCOPES,
+    VALID_REF_FORMS,
+    VALID_SCOPES,
+    VALID_VLINE_POSITIONS,
+)
 from typstpy._core import (
     attach_func,
     call_,
@@ -8,7 +17,7 @@ from typstpy._core import (
     normal,
     positional,
     post_series,
-    validate_value,
+    render_columns,
 )
 from typstpy.std.layout import hspace, repeat
 from typstpy.std.text import lorem  # noqa
@@ -133,6 +142,7 @@ def bullet_list(
     'cite',
     hyperlink='https://typst.app/docs/reference/model/cite/',
     version='0.14.2',
+    choices={'form': VALID_CITATION_FORMS},
 )
 def cite(
     key,
@@ -166,13 +176,6 @@ def cite(
         >>> cite('<label>', style='"annual-reviews"')
         '#cite(<label>, style: "annual-reviews")'
     """
-    if form is not None:
-        validate_value(
-            cite,
-            'form',
-            form,
-            {'none', '"normal"', '"prose"', '"full"', '"author"', '"year"'},
-        )
     return normal(
         cite,
         key,
@@ -280,6 +283,7 @@ def _figure_caption(
     'figure',
     hyperlink='https://typst.app/docs/reference/model/figure/',
     version='0.14.2',
+    choices={'scope': VALID_SCOPES},
 )
 def figure(
     body,
@@ -321,8 +325,6 @@ def figure(
         >>> figure(image('"image.png"'), caption='[Hello, World!]')
         '#figure(image("image.png"), caption: [Hello, World!])'
     """
-    validate_value(figure, 'scope', scope, {'"column"', '"parent"'})
-
     return normal(
         figure,
         body,
@@ -763,6 +765,7 @@ def outline(
     'par.line',
     hyperlink='https://typst.app/docs/reference/model/par/#definitions-line',
     version='0.14.2',
+    choices={'numbering_scope': VALID_NUMBERING_SCOPES},
 )
 def _par_line(
     *,
@@ -787,10 +790,6 @@ def _par_line(
     Returns:
         Executable typst code.
     """
-    validate_value(
-        _par_line, 'numbering_scope', numbering_scope, {'"document"', '"page"'}
-    )
-
     return normal(
         _par_line,
         numbering=numbering,
@@ -804,7 +803,10 @@ def _par_line(
 @attach_func(_par_line, 'line')
 # * Typst docs verified on 2026-05-23: https://typst.app/docs/reference/model/par/; parameters match.
 @implement(
-    'par', hyperlink='https://typst.app/docs/reference/model/par/', version='0.14.2'
+    'par',
+    hyperlink='https://typst.app/docs/reference/model/par/',
+    version='0.14.2',
+    choices={'linebreaks': VALID_LINEBREAKS},
 )
 def par(
     body,
@@ -852,9 +854,6 @@ def par(
         ... )
         '#par([Hello, World!], leading: 0.1em, spacing: 0.5em, justify: true, linebreaks: "simple", first-line-indent: 0.2em, hanging-indent: 0.3em)'
     """
-    if linebreaks != 'auto':
-        validate_value(par, 'linebreaks', linebreaks, {'"simple"', '"optimized"'})
-
     return normal(
         par,
         body,
@@ -930,6 +929,7 @@ def quote(
     'ref',
     hyperlink='https://typst.app/docs/reference/model/ref/',
     version='0.14.2',
+    choices={'form': VALID_REF_FORMS},
 )
 def ref(
     target,
@@ -957,8 +957,6 @@ def ref(
         >>> ref('<label>', supplement='[Hello, World!]')
         '#ref(<label>, supplement: [Hello, World!])'
     """
-    validate_value(ref, 'form', form, {'"normal"', '"page"'})
-
     return normal(ref, target, supplement=supplement, form=form)
 
 
@@ -1044,6 +1042,7 @@ def _table_cell(
     'table.hline',
     hyperlink='https://typst.app/docs/reference/model/table/#definitions-hline',
     version='0.14.2',
+    choices={'position': VALID_HLINE_POSITIONS},
 )
 def _table_hline(
     *,
@@ -1068,8 +1067,6 @@ def _table_hline(
     Returns:
         Executable typst code.
     """
-    validate_value(_table_hline, 'position', position, {'top', 'bottom'})
-
     return normal(
         _table_hline, y=y, start=start, end=end, stroke=stroke, position=position
     )
@@ -1080,6 +1077,7 @@ def _table_hline(
     'table.vline',
     hyperlink='https://typst.app/docs/reference/model/table/#definitions-vline',
     version='0.14.2',
+    choices={'position': VALID_VLINE_POSITIONS},
 )
 def _table_vline(
     *,
@@ -1104,10 +1102,6 @@ def _table_vline(
     Returns:
         Executable typst code.
     """
-    validate_value(
-        _table_vline, 'position', position, {'start', 'end', 'left', 'right'}
-    )
-
     return normal(
         _table_vline, x=x, start=start, end=end, stroke=stroke, position=position
     )
@@ -1150,11 +1144,45 @@ def _table_footer(*children, repeat=True):
     return post_series(_table_footer, *children, repeat=repeat)
 
 
+def _table_from_columns(data, /, *, formatters=None, header=True, **kwargs):
+    """Build a `table` from columnar data, rendering the header and all cells in one pass.
+
+    Args:
+        data: Mapping of column name to column values. Values may be sequences, buffers or objects implementing `__array__`, such as pandas, polars or NumPy columns.
+        formatters: Mapping of column name to a function returning the typst source of one cell. Defaults to None, which renders values as content blocks with markup characters of strings escaped.
+        header: Whether to emit the column names as a `table.header`. Defaults to True.
+        **kwargs: Keyword arguments forwarded to `table`. `columns` defaults to the number of columns.
+
+    Raises:
+        ValueError: If the columns are empty, have different lengths or a formatter names an unknown column.
+
+    Returns:
+        Executable typst code.
+
+    Examples:
+        >>> table.from_columns({'name': ['a', 'b'], 'qty': [1, 2]})
+        '#table(columns: 2, table.header([name], [qty]), [a], [1], [b], [2])'
+        >>> table.from_columns(
+        ...     {'qty': [1.5, 2.0]},
+        ...     formatters={'qty': lambda value: f'[{value:.2f}]'},
+        ...     header=False,
+        ...     align='right',
+        ... )
+        '#table(columns: 1, align: right, [1.50], [2.00])'
+    """
+    names, cells = render_columns(data, formatters)
+    kwargs.setdefault('columns', len(names))
+    if header:
+        return table(_table_header(*names), *cells, **kwargs)
+    return table(*cells, **kwargs)
+
+
 @attach_func(_table_cell, 'cell')
 @attach_func(_table_hline, 'hline')
 @attach_func(_table_vline, 'vline')
 @attach_func(_table_header, 'header')
 @attach_func(_table_footer, 'footer')
+@attach_func(_table_from_columns, 'from_columns')
 # * Typst docs verified on 2026-05-23: https://typst.app/docs/reference/model/table/; parameters match.
 @implement(
     'table',
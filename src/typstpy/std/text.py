@@ -1,6 +1,23 @@
 from types import MappingProxyType
 
-from typstpy._core import attach_func, implement, normal, positional, validate_value
+from typstpy._constants import (
+    VALID_BOTTOM_EDGES,
+    VALID_CJK_LATIN_SPACINGS,
+    VALID_FONT_WEIGHTS,
+    VALID_NUMBER_TYPES,
+    VALID_NUMBER_WIDTHS,
+    VALID_TEXT_DIRECTIONS,
+    VALID_TEXT_STYLES,
+    VALID_TOP_EDGES,
+)
+from typstpy._core import (
+    attach_func,
+    implement,
+    is_checked,
+    normal,
+    positional,
+    validate_value,
+)
 from typstpy.std.visualize import luma, rgb
 
 _DEFAULT_TEXT_COSTS = MappingProxyType(
@@ -14,6 +31,7 @@ _EMPTY_MAPPING = MappingProxyType({})
     'highlight',
     hyperlink='https://typst.app/docs/reference/text/highlight/',
     version='0.14.2',
+    choices={'top_edge': VALID_TOP_EDGES, 'bottom_edge': VALID_BOTTOM_EDGES},
 )
 def highlight(
     body,
@@ -57,19 +75,6 @@ def highlight(
         ... )
         '#highlight("Hello, world!", fill: rgb("#ffffff"), stroke: rgb("#000000"), top-edge: "bounds", bottom-edge: "bounds")'
     """
-    validate_value(
-        highlight,
-        'top_edge',
-        top_edge,
-        {'"ascender"', '"cap-height"', '"x-height"', '"baseline"', '"bounds"'},
-    )
-    validate_value(
-        highlight,
-        'bottom_edge',
-        bottom_edge,
-        {'"baseline"', '"descender"', '"bounds"'},
-    )
-
     return normal(
         highlight,
         body,
@@ -498,6 +503,15 @@ def superscript(
     'text',
     hyperlink='https://typst.app/docs/reference/text/text/',
     version='0.14.2',
+    choices={
+        'style': VALID_TEXT_STYLES,
+        'top_edge': VALID_TOP_EDGES,
+        'bottom_edge': VALID_BOTTOM_EDGES,
+        'number_type': VALID_NUMBER_TYPES,
+        'number_width': VALID_NUMBER_WIDTHS,
+        'cjk_latin_spacing': VALID_CJK_LATIN_SPACINGS,
+        'dir': VALID_TEXT_DIRECTIONS,
+    },
 )
 def text(
     body,
@@ -587,63 +601,25 @@ def text(
         >>> text('[Hello, World!]', font='"Times New Roman"')
         '#text([Hello, World!], font: "Times New Roman")'
     """
-    validate_value(text, 'style', style, {'"normal"', '"italic"', '"oblique"'})
-    if not isinstance(weight, int):
-        validate_value(
-            text,
-            'weight',
-            weight,
-            {
-                '"thin"',
-                '"extralight"',
-                '"light"',
-                '"regular"',
-                '"medium"',
-                '"semibold"',
-                '"bold"',
-                '"extrabold"',
-                '"black"',
-            },
-        )
-    elif not 100 <= weight <= 900:
-        raise ValueError(
-            'text got invalid weight; expected an integer between 100 and 900'
-        )
-    validate_value(
-        text,
-        'top_edge',
-        top_edge,
-        {'"ascender"', '"cap-height"', '"x-height"', '"baseline"', '"bounds"'},
-    )
-    validate_value(
-        text,
-        'bottom_edge',
-        bottom_edge,
-        {'"baseline"', '"descender"', '"bounds"'},
-    )
-    if number_type != 'auto':
-        validate_value(text, 'number_type', number_type, {'"lining"', '"old-style"'})
-    if number_width != 'auto':
-        validate_value(
-            text,
-            'number_width',
-            number_width,
-            {'"proportional"', '"tabular"'},
-        )
-    if cjk_latin_spacing is not None and cjk_latin_spacing != 'auto':
-        validate_value(text, 'cjk_latin_spacing', cjk_latin_spacing, {'none'})
-    if dir != 'auto':
-        validate_value(text, 'dir', dir, {'ltr', 'rtl'})
-    if stylistic_set is not None:
-        values = (
-            stylistic_set
-            if isinstance(stylistic_set, tuple | list)
-            else (stylistic_set,)
-        )
-        if any(not isinstance(value, int) or not 1 <= value <= 20 for value in values):
+    if is_checked():
+        if not isinstance(weight, int):
+            validate_value(text, 'weight', weight, VALID_FONT_WEIGHTS)
+        elif not 100 <= weight <= 900:
             raise ValueError(
-                'text got invalid stylistic_set; expected int(s) between 1 and 20'
+                'text got invalid weight; expected an integer between 100 and 900'
+            )
+        if stylistic_set is not None:
+            values = (
+                stylistic_set
+                if isinstance(stylistic_set, tuple | list)
+                else (stylistic_set,)
             )
+            if any(
+                not isinstance(value, int) or not 1 <= value <= 20 for value in values
+            ):
+                raise ValueError(
+                    'text got invalid stylistic_set; expected int(s) between 1 and 20'
+                )
 
     return normal(
         text,
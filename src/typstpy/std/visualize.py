@@ -2,10 +2,20 @@ from typing import overload
 
 from deprecated import deprecated
 
+from typstpy._constants import (
+    VALID_COLOR_MAPS,
+    VALID_CURVE_CLOSE_MODES,
+    VALID_FILL_RULES,
+    VALID_IMAGE_FITS,
+    VALID_IMAGE_FORMATS,
+    VALID_IMAGE_SCALINGS,
+    VALID_RELATIVE_TO,
+)
 from typstpy._core import (
     attach_func,
     implement,
     instance,
+    is_checked,
     normal,
     positional,
     post_series,
@@ -57,7 +67,7 @@ def circle(
         >>> circle('[Hello, world!]', width='100%')
         '#circle([Hello, world!], width: 100%)'
     """
-    if (
+    if is_checked() and (
         sum(
             value != default
             for value, default in ((radius, '0pt'), (width, 'auto'), (height, 'auto'))
@@ -103,27 +113,7 @@ def _color_map(name, /):
         >>> color.map('turbo')
         '#color.map.turbo'
     """
-    validate_value(
-        _color_map,
-        'name',
-        name,
-        {
-            'turbo',
-            'cividis',
-            'rainbow',
-            'spectral',
-            'viridis',
-            'inferno',
-            'magma',
-            'plasma',
-            'rocket',
-            'mako',
-            'vlag',
-            'icefire',
-            'flare',
-            'crest',
-        },
-    )
+    validate_value(_color_map, 'name', name, VALID_COLOR_MAPS)
     return f'#color.map.{name}'
 
 
@@ -856,6 +846,7 @@ def _curve_cubic(
     'curve.close',
     hyperlink='https://typst.app/docs/reference/visualize/curve/#definitions-close',
     version='0.14.2',
+    choices={'mode': VALID_CURVE_CLOSE_MODES},
 )
 def _curve_close(*, mode='"smooth"'):
     """Interface of `curve.close` in typst. See [the documentation](https://typst.app/docs/reference/visualize/curve/#definitions-close) for more information.
@@ -875,8 +866,6 @@ def _curve_close(*, mode='"smooth"'):
         >>> curve.close(mode='"straight"')
         '#curve.close(mode: "straight")'
     """
-    validate_value(_curve_close, 'mode', mode, {'"smooth"', '"straight"'})
-
     return normal(_curve_close, '', mode=mode)
 
 
@@ -890,6 +879,7 @@ def _curve_close(*, mode='"smooth"'):
     'curve',
     hyperlink='https://typst.app/docs/reference/visualize/curve/',
     version='0.14.2',
+    choices={'fill_rule': VALID_FILL_RULES},
 )
 def curve(
     *components,
@@ -920,8 +910,6 @@ def curve(
         ... )
         '#curve(stroke: blue, curve.move((0pt, 50pt)), curve.line((100pt, 50pt)), curve.cubic(none, (90pt, 0pt), (50pt, 0pt)), curve.close())'
     """
-    validate_value(curve, 'fill_rule', fill_rule, {'"non-zero"', '"even-odd"'})
-
     return post_series(
         curve, *components, fill=fill, fill_rule=fill_rule, stroke=stroke
     )
@@ -982,6 +970,7 @@ def ellipse(
     hyperlink='https://typst.app/docs/reference/visualize/gradient/#definitions-linear',
     version='0.14.2',
     spread_single=True,
+    choices={'relative': VALID_RELATIVE_TO},
 )
 def _gradient_linear(
     *stops,
@@ -1008,9 +997,6 @@ def _gradient_linear(
         >>> gradient.linear(rgb(255, 255, 255), rgb(0, 0, 0))
         '#gradient.linear(rgb(255, 255, 255), rgb(0, 0, 0))'
     """
-    if relative != 'auto':
-        validate_value(_gradient_linear, 'relative', relative, {'"self"', '"parent"'})
-
     return pre_series(
         _gradient_linear,
         *stops,
@@ -1027,6 +1013,7 @@ def _gradient_linear(
     hyperlink='https://typst.app/docs/reference/visualize/gradient/#definitions-radial',
     version='0.14.2',
     spread_single=True,
+    choices={'relative': VALID_RELATIVE_TO},
 )
 def _gradient_radial(
     *stops,
@@ -1059,9 +1046,6 @@ def _gradient_radial(
         ... )
         '#gradient.radial(..color.map.viridis, focal-center: (10%, 40%), focal-radius: 5%)'
     """
-    if relative != 'auto':
-        validate_value(_gradient_radial, 'relative', relative, {'"self"', '"parent"'})
-
     return pre_series(
         _gradient_radial,
         *stops,
@@ -1080,6 +1064,7 @@ def _gradient_radial(
     hyperlink='https://typst.app/docs/reference/visualize/gradient/#definitions-conic',
     version='0.14.2',
     spread_single=True,
+    choices={'relative': VALID_RELATIVE_TO},
 )
 def _gradient_conic(
     *stops,
@@ -1106,9 +1091,6 @@ def _gradient_conic(
         >>> gradient.conic(color.map('viridis'), angle='90deg', center=('10%', '40%'))
         '#gradient.conic(..color.map.viridis, angle: 90deg, center: (10%, 40%))'
     """
-    if relative != 'auto':
-        validate_value(_gradient_conic, 'relative', relative, {'"self"', '"parent"'})
-
     return pre_series(
         _gradient_conic,
         *stops,
@@ -1446,6 +1428,7 @@ def gradient():
     'image.decode',
     hyperlink='https://typst.app/docs/reference/visualize/image/#definitions-decode',
     version='0.14.2',
+    choices={'fit': VALID_IMAGE_FITS, 'scaling': VALID_IMAGE_SCALINGS},
 )
 def _image_decode(
     data,
@@ -1476,15 +1459,7 @@ def _image_decode(
         Executable typst code.
     """
     if isinstance(format, str) and format != 'auto':
-        validate_value(
-            _image_decode,
-            'format',
-            format,
-            {'"png"', '"jpg"', '"gif"', '"svg"', '"pdf"', '"webp"'},
-        )
-    validate_value(_image_decode, 'fit', fit, {'"cover"', '"contain"', '"stretch"'})
-    if scaling != 'auto':
-        validate_value(_image_decode, 'scaling', scaling, {'"smooth"', '"pixelated"'})
+        validate_value(_image_decode, 'format', format, VALID_IMAGE_FORMATS)
 
     return normal(
         _image_decode,
@@ -1504,6 +1479,7 @@ def _image_decode(
     'image',
     hyperlink='https://typst.app/docs/reference/visualize/image/',
     version='0.14.2',
+    choices={'fit': VALID_IMAGE_FITS, 'scaling': VALID_IMAGE_SCALINGS},
 )
 def image(
     source,
@@ -1545,15 +1521,7 @@ def image(
         '#image("image.png", fit: "contain")'
     """
     if isinstance(format, str) and format != 'auto':
-        validate_value(
-            image,
-            'format',
-            format,
-            {'"png"', '"jpg"', '"gif"', '"svg"', '"pdf"', '"webp"'},
-        )
-    validate_value(image, 'fit', fit, {'"cover"', '"contain"', '"stretch"'})
-    if scaling != 'auto':
-        validate_value(image, 'scaling', scaling, {'"smooth"', '"pixelated"'})
+        validate_value(image, 'format', format, VALID_IMAGE_FORMATS)
 
     return normal(
         image,
@@ -1616,6 +1584,7 @@ def line(
     'path',
     hyperlink='https://typst.app/docs/reference/visualize/path/',
     version='0.14.2',
+    choices={'fill_rule': VALID_FILL_RULES},
 )
 def path(
     *vertices,
@@ -1659,8 +1628,6 @@ def path(
         ... )
         '#path(fill: red, stroke: blue, (0%, 0%), (100%, 0%), (100%, 100%), (0%, 100%))'
     """
-    validate_value(path, 'fill_rule', fill_rule, {'"non-zero"', '"even-odd"'})
-
     return post_series(
         path, *vertices, fill=fill, fill_rule=fill_rule, stroke=stroke, closed=closed
     )
@@ -1675,6 +1642,7 @@ def path(
     'pattern',
     hyperlink='https://typst.app/docs/reference/visualize/tiling/#compatibility',
     version='0.14.2',
+    choices={'relative': VALID_RELATIVE_TO},
 )
 def pattern(
     body,
@@ -1698,9 +1666,6 @@ def pattern(
     Returns:
         A repeating pattern fill.
     """
-    if relative != 'auto':
-        validate_value(pattern, 'relative', relative, {'"self"', '"parent"'})
-
     return normal(pattern, body, size=size, spacing=spacing, relative=relative)
 
 
@@ -1739,6 +1704,7 @@ def _polygon_regular(
     'polygon',
     hyperlink='https://typst.app/docs/reference/visualize/polygon/',
     version='0.14.2',
+    choices={'fill_rule': VALID_FILL_RULES},
 )
 def polygon(
     *vertices,
@@ -1759,8 +1725,6 @@ def polygon(
     Returns:
         Executable typst code.
     """
-    validate_value(polygon, 'fill_rule', fill_rule, {'"non-zero"', '"even-odd"'})
-
     return post_series(
         polygon, *vertices, fill=fill, fill_rule=fill_rule, stroke=stroke
     )
@@ -1850,7 +1814,7 @@ def square(
     Returns:
         Executable typst code.
     """
-    if sum(value != 'auto' for value in (size, width, height)) > 1:
+    if is_checked() and sum(value != 'auto' for value in (size, width, height)) > 1:
         raise ValueError(
             'square requires only one of size, width, and height to be set'
         )
@@ -1874,6 +1838,7 @@ def square(
     'tiling',
     hyperlink='https://typst.app/docs/reference/visualize/tiling/',
     version='0.14.2',
+    choices={'relative': VALID_RELATIVE_TO},
 )
 def tiling(
     body,
@@ -1905,9 +1870,6 @@ def tiling(
         ... )
         '#tiling([#place(line(start: (0%, 0%), end: (100%, 100%))), #place(line(start: (0%, 100%), end: (100%, 0%)))], size: (30pt, 30pt))'
     """
-    if relative != 'auto':
-        validate_value(tiling, 'relative', relative, {'"self"', '"parent"'})
-
     return normal(tiling, body, size=size, spacing=spacing, relative=relative)
 
 
@@ -14,6 +14,12 @@ from typstpy.std.layout import (
 )
 
 
+def test_grid_from_columns_renders_header_and_row_major_cells():
+    assert grid.from_columns({'a': ['x', 'y'], 'b': [1, 2]}) == (
+        '#grid(columns: 2, grid.header([a], [b]), [x], [1], [y], [2])'
+    )
+
+
 def test_layout_attached_functions_render_typst_calls():
     assert grid.cell('[Hi]', x=1) == '#grid.cell([Hi], x: 1)'
     assert grid.hline(y=2) == '#grid.hline(y: 2)'
@@ -66,3 +66,73 @@ def test_terms_keeps_single_term_pair_as_one_child():
 def test_model_functions_reject_invalid_arguments(call):
     with pytest.raises(ValueError):
         call()
+
+
+def test_series_functions_accept_iterator_of_children():
+    cells = ['[a]', '[b]']
+
+    assert table(iter(cells), columns=2) == table(*cells, columns=2)
+    assert bullet_list(item for item in cells) == bullet_list(*cells)
+    assert numbered_list(map(str.upper, cells)) == numbered_list('[A]', '[B]')
+
+
+def test_table_from_columns_matches_manual_table():
+    data = {'name': ['a', 'b'], 'qty': [1, 2.5], 'ok': [True, None]}
+
+    assert table.from_columns(data, stroke='none') == table(
+        table.header('[name]', '[qty]', '[ok]'),
+        '[a]',
+        '[1]',
+        '[true]',
+        '[b]',
+        '[2.5]',
+        '[none]',
+        columns=3,
+        stroke='none',
+    )
+
+
+def test_table_from_columns_accepts_buffers_and_arrays():
+    from array import array
+
+    assert table.from_columns({'x': array('i', [1, 2])}, header=False) == (
+        '#table(columns: 1, [1], [2])'
+    )
+    assert table.from_columns({'x': memoryview(b'\x01\x02')}, header=False) == (
+        '#table(columns: 1, [1], [2])'
+    )
+
+    np = pytest.importorskip('numpy')
+    data = {'i': np.arange(2), 'f': np.array([0.5, 1.0]), 'b': np.array([True, False])}
+    assert table.from_columns(data, columns=('1fr', '1fr', '1fr')) == (
+        '#table(columns: (1fr, 1fr, 1fr), table.header([i], [f], [b]), '
+        '[0], [0.5], [true], [1], [1.0], [false])'
+    )
+
+
+def test_table_from_columns_applies_formatters_per_column():
+    result = table.from_columns(
+        {'price': [1.234, 5.0], 'name': ['a', 'b']},
+        formatters={'price': lambda value: f'[{value:.1f}]'},
+        header=False,
+    )
+
+    assert result == '#table(columns: 2, [1.2], [a], [5.0], [b])'
+
+
+@pytest.mark.parametrize(
+    'call',
+    [
+        lambda: table.from_columns({}),
+        lambda: table.from_columns({'a': [1], 'b': [1, 2]}),
+        lambda: table.from_columns({'a': [1]}, formatters={'b': str}),
+    ],
+)
+def test_table_from_columns_rejects_invalid_columns(call):
+    with pytest.raises(ValueError):
+        call()
+
+
+def test_table_from_columns_reuses_table_keyword_validation():
+    with pytest.raises(TypeError):
+        table.from_columns({'a': [1]}, colums=2)
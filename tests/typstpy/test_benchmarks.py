@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+
+from benchmarks import keywords
+from benchmarks.macro import SCENARIOS, run_isolated, run_scenario
+from benchmarks.micro import (
+    CASES,
+    Measurement,
+    build_cases,
+    compare,
+    from_json,
+    main,
+    run,
+    to_json,
+)
+from typstpy._docs import function_qualname, iter_registered_functions
+from typstpy.std import circle, text
+
+
+def test_every_registered_function_has_runnable_cases() -> None:
+    for func in iter_registered_functions():
+        cases = build_cases(func)
+        assert tuple(cases) == CASES
+        for name, (args, kwargs) in cases.items():
+            assert isinstance(func(*args, **kwargs), str), (
+                function_qualname(func),
+                name,
+            )
+
+
+def test_worst_case_sets_every_compatible_keyword() -> None:
+    worst = build_cases(text)['worst'].kwargs
+    assert set(worst) <= set(text.__kwdefaults__)
+    assert all(value != text.__kwdefaults__[key] for key, value in worst.items())
+    assert 'fill' in worst
+
+    # radius and width exclude each other, so only one of them is kept.
+    circle_worst = build_cases(circle)['worst'].kwargs
+    assert not {'radius', 'width'} <= circle_worst.keys()
+
+
+def test_results_round_trip_through_json() -> None:
+    results = run([text], min_time=0.0001, repeat=1)
+    assert from_json(to_json(results)) == results
+    assert set(results['std.text']) == set(CASES)
+
+
+def test_compare_reports_cases_beyond_the_threshold() -> None:
+    baseline = {'std.text': {'defaults': Measurement(100.0, 1000)}}
+    assert (
+        compare(baseline, {'std.text': {'defaults': Measurement(120.0, 1000)}}, 0.25)
+        == []
+    )
+    assert (
+        compare(baseline, {'std.page': {'defaults': Measurement(900.0, 1)}}, 0.25) == []
+    )
+
+    regressions = compare(
+        baseline, {'std.text': {'defaults': Measurement(200.0, 1500)}}, 0.25
+    )
+    assert [r.split(':')[0] for r in regressions] == [
+        'std.text [defaults] ns',
+        'std.text [defaults] bytes',
+    ]
+
+
+def test_main_fails_on_regression(tmp_path, capsys) -> None:
+    path = tmp_path / 'baseline.json'
+    argv = ['--filter', 'std.strong', '--min-time', '0.0001', '--repeat', '1']
+    assert main([*argv, '--save', str(path)]) == 0
+    assert main([*argv, '--compare', str(path), '--threshold', '1000']) == 0
+
+    baseline = from_json(json.loads(path.read_text()))
+    shrunk = {
+        qualname: {name: Measurement(m.ns / 1e6, m.bytes) for name, m in cases.items()}
+        for qualname, cases in baseline.items()
+    }
+    path.write_text(json.dumps(to_json(shrunk)))
+    assert main([*argv, '--compare', str(path)]) == 1
+    assert 'REGRESSION std.strong' in capsys.readouterr().out
+
+
+def test_macro_scenarios_render_at_small_scale() -> None:
+    for name in SCENARIOS:
+        result = run_scenario(name, 0.001)
+        assert result.units >= 1
+        assert result.output_bytes > 0
+        assert result.peak_rss > 0
+
+
+def test_macro_scenario_runs_in_a_fresh_interpreter() -> None:
+    isolated = run_isolated('nesting', 0.01)
+    local = run_scenario('nesting', 0.01)
+    assert (isolated.units, isolated.output_bytes) == (local.units, local.output_bytes)
+
+
+def test_keywords_benchmark_runs(capsys) -> None:
+    for func, kwargs in keywords.build_workloads().values():
+        assert keywords.compiled_keywords(func, kwargs)
+
+    assert keywords.main(['--number', '1', '--repeat', '1']) == 0
+    assert len(capsys.readouterr().out.splitlines()) == 5
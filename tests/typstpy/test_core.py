@@ -1,21 +1,56 @@
+import sys
 import warnings
+import weakref
+from io import StringIO
+from types import MappingProxyType, ModuleType
 
 import pytest
 
 from typstpy._core import (
+    Content,
+    Implement,
+    NumberFormat,
     attach_func,
+    deferred,
+    escape_markup,
+    escape_markup_many,
+    escaped,
     implement,
     import_,
     instance,
+    is_checked,
     normal,
+    number_format,
     positional,
     post_series,
     pre_series,
+    profile,
     set_,
+    set_unchecked,
     show_,
+    temporary,
+    unchecked,
+)
+from typstpy._core.markup import MARKUP_SPECIALS
+from typstpy._core.render import (
+    RenderCache,
+    _to_expr,
+    render_cache,
+    render_content,
+    render_value,
+    set_render_cache,
+)
+from typstpy.std import (
+    block,
+    figure,
+    heading,
+    outline,
+    pad,
+    pagebreak,
+    stack,
+    table,
+    text,
 )
-from typstpy._core.render import render_value
-from typstpy.std import heading, outline, text
 
 
 @implement('demo')
@@ -124,6 +159,647 @@ def test_post_series_protocol_does_not_spread_single_sequence_by_default():
     assert demo_post(('[a]', '[b]')) == '#demo.post(([a], [b]))'
 
 
+def test_implement_compiles_defaults_and_keyword_prefixes():
+    compiled = Implement.permanent[text].compiled
+
+    assert compiled is not None
+    assert compiled.head == '#text('
+    assert compiled.prefixes['cjk_latin_spacing'] == 'cjk-latin-spacing: '
+    assert compiled.defaults == text.__kwdefaults__
+    assert compiled.keywords['cjk_latin_spacing'][:2] == (
+        'cjk-latin-spacing: ',
+        text.__kwdefaults__['cjk_latin_spacing'],
+    )
+
+
+def test_compiled_defaults_use_identity_and_typed_comparisons():
+    compiled = Implement.permanent[text].compiled
+    defaults = dict(text.__kwdefaults__)
+
+    assert compiled._all_defaults(defaults)
+    assert not compiled._all_defaults(dict(reversed(defaults.items())))
+    assert compiled.render_keywords(defaults) == []
+
+    class NoEquality:
+        def __eq__(self, other):
+            raise AssertionError('compared against a str default')
+
+        def __str__(self):
+            return 'red'
+
+    assert text('[a]', fill=NoEquality()) == '#text([a], fill: red)'
+    assert text('[a]', size='11pt') == '#text([a])'
+
+    @implement('counted')
+    def counted(*, count=1, flag=True):
+        return normal(counted, count=count, flag=flag)
+
+    assert counted(count=1.0) == '#counted()'
+    assert counted(count=2, flag=1) == '#counted(count: 2, flag: 1)'
+
+
+def test_default_elision_requires_matching_kind():
+    class Name(str):
+        pass
+
+    @implement('kinds')
+    def kinds(*, count=1, ratio=0.0, flag=True, name='a'):
+        return normal(kinds, count=count, ratio=ratio, flag=flag, name=name)
+
+    # int and float defaults elide equal numbers of either type.
+    assert kinds(count=1.0, ratio=0) == '#kinds()'
+    # bool and numbers render differently in typst, so they are never elided for each other.
+    assert kinds(count=True) == '#kinds(count: true)'
+    assert kinds(flag=1) == '#kinds(flag: 1)'
+    assert kinds(ratio=False) == '#kinds(ratio: false)'
+    # Subclasses, such as NumPy scalars, are rendered even when equal to the default.
+    assert kinds(name=Name('a')) == '#kinds(name: a)'
+
+
+def test_declared_choices_are_compiled_to_frozensets_and_checked():
+    @implement('chosen', choices={'mode': ['"a"', '"b"']})
+    def chosen(*, mode='"a"'):
+        return normal(chosen, mode=mode)
+
+    assert Implement.permanent[chosen].choices == {'mode': frozenset({'"a"', '"b"'})}
+    assert chosen(mode='"b"') == '#chosen(mode: "b")'
+    with pytest.raises(ValueError, match='chosen got invalid mode=\'"c"\''):
+        chosen(mode='"c"')
+    with pytest.raises(ValueError):
+        set_(chosen, mode='"c"')
+
+
+def test_rules_and_selectors_check_declared_choices():
+    @implement('ruled', choices={'mode': ['"a"', '"b"']})
+    def ruled(*, mode='"a"'):
+        return normal(ruled, mode=mode)
+
+    assert set_(ruled, mode='"b"') == '#set ruled(mode: "b")'
+    with pytest.raises(ValueError, match='ruled got invalid mode'):
+        set_(ruled, mode='"c"')
+    with pytest.raises(ValueError, match='ruled got invalid mode'):
+        ruled.where(mode='"c"')
+    with pytest.raises(ValueError, match='ruled got invalid mode'):
+        ruled.with_(mode='"c"')
+    with unchecked():
+        assert set_(ruled, mode='"c"') == '#set ruled(mode: "c")'
+        assert ruled.where(mode='"c"') == '#ruled.where(mode: "c")'
+
+
+def test_declared_choices_must_match_signature():
+    with pytest.raises(ValueError, match='unknown field\\(s\\): mood'):
+
+        @implement('typo', choices={'mood': ['a']})
+        def typo(*, mode='a'):
+            pass
+
+    with pytest.raises(ValueError, match="default mode='a'"):
+
+        @implement('outside', choices={'mode': ['b']})
+        def outside(*, mode='a'):
+            pass
+
+
+class TestUnchecked:
+    def test_scope_skips_field_and_value_checks(self):
+        with unchecked():
+            assert not is_checked()
+            assert normal(demo, '[a]', bad=1) == '#demo([a], bad: 1)'
+            assert stack('[a]', dir='diagonal') == '#stack(dir: diagonal, [a])'
+            assert text('[a]', weight=1) == '#text([a], weight: 1)'
+            with unchecked(False):
+                with pytest.raises(ValueError):
+                    stack('[a]', dir='diagonal')
+        assert is_checked()
+        with pytest.raises(TypeError):
+            normal(demo, '[a]', bad=1)
+
+    def test_process_wide_switch_yields_to_scopes(self):
+        previous = set_unchecked(True)
+        try:
+            assert previous is False
+            assert pagebreak(to='"middle"') == '#pagebreak(to: "middle")'
+            with unchecked(False), pytest.raises(ValueError):
+                pagebreak(to='"middle"')
+        finally:
+            set_unchecked(previous)
+        with pytest.raises(ValueError):
+            pagebreak(to='"middle"')
+
+    def test_scope_does_not_leak_into_threads_or_tasks(self):
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        async def checked_in_task():
+            return is_checked()
+
+        with unchecked():
+            with ThreadPoolExecutor(1) as pool:
+                assert pool.submit(is_checked).result()
+
+        async def main():
+            with unchecked():
+                task = asyncio.create_task(checked_in_task())
+            other = asyncio.create_task(checked_in_task())
+            return await task, await other
+
+        assert asyncio.run(main()) == (False, True)
+
+
+def test_rules_and_selectors_keep_defaults_with_compiled_prefixes():
+    assert set_(text, top_edge='"ascender"') == '#set text(top-edge: "ascender")'
+    assert text.where(top_edge='"ascender"', fill='red') == (
+        '#text.where(top-edge: "ascender", fill: red)'
+    )
+    assert text.with_('[a]', top_edge='"ascender"') == (
+        '#text.with([a], top-edge: "ascender")'
+    )
+
+
+def test_compiled_call_rejects_unknown_fields_with_function_label():
+    with pytest.raises(
+        TypeError, match='demo does not accept field\\(s\\): bad, worse'
+    ):
+        normal(demo, '[Hello]', worse=1, bad=2)
+
+
+class TestProfile:
+    def test_counts_calls_bytes_and_self_time(self):
+        @implement('wrapped')
+        def wrapped(body, /):
+            return demo(body, fill='red')
+
+        with profile() as stats:
+            for _ in range(3):
+                wrapped('[a]')
+            demo('[b]')
+        assert stats.functions.keys() == {'wrapped', 'demo'}
+        outer, inner = stats.functions['wrapped'], stats.functions['demo']
+        assert (outer.calls, inner.calls) == (3, 4)
+        assert inner.output_bytes == 3 * len('#demo([a], fill: red)') + len(
+            '#demo([b])'
+        )
+        assert outer.self_time < outer.cumulative
+        assert 0 < inner.self_time == pytest.approx(inner.cumulative)
+
+    def test_scope_restores_previous_profiler(self):
+        previous = sys.getprofile()
+        with profile() as stats:
+            assert sys.getprofile() is not previous
+        assert sys.getprofile() is previous
+        demo('[a]')
+        assert stats.functions == {}
+
+    def test_exports_json_and_sorted_table(self):
+        with profile() as stats:
+            demo('[a]')
+            demo('[a]')
+            heading('[b]')
+        assert stats.to_json()['demo'] == {
+            'calls': 2,
+            'cumulative': stats.functions['demo'].cumulative,
+            'self_time': stats.functions['demo'].self_time,
+            'output_bytes': 2 * len('#demo([a])'),
+        }
+        lines = stats.table(sort_by='calls').splitlines()
+        assert lines[0].split() == [
+            'function',
+            'calls',
+            'cumulative',
+            'ms',
+            'self',
+            'ms',
+            'bytes',
+        ]
+        assert [line.split()[:2] for line in lines[1:]] == [
+            ['demo', '2'],
+            ['heading', '1'],
+        ]
+        with pytest.raises(ValueError, match='sort_by'):
+            stats.table(sort_by='name')  # type: ignore[arg-type]
+
+
+class TestRegistry:
+    def test_collected_functions_leave_the_registry(self):
+        import gc
+
+        @implement('short_lived')
+        def short_lived():
+            return '#short_lived()'
+
+        key = weakref.ref(short_lived)
+        assert short_lived in Implement.permanent
+        del short_lived
+        gc.collect()
+        assert key() is None
+        assert all(func.__name__ != 'short_lived' for func in Implement.permanent)
+        assert Implement.permanent._dead
+        assert len(Implement.permanent) == sum(1 for _ in Implement.permanent)
+        assert not Implement.permanent._dead
+
+        @implement('replacement')
+        def replacement():
+            return '#replacement()'
+
+        assert not any(ref() is None for ref in Implement.permanent._entries)
+
+    def test_records_are_attached_to_functions(self, monkeypatch):
+        from typstpy._core.registry import (
+            FunctionRegistry,
+            FunctionSet,
+            implementation,
+            is_temporary,
+        )
+        from typstpy.customizations import normal as normal_factory
+
+        made = normal_factory('made')
+        assert implementation(text) is Implement.permanent[text]
+        assert implementation(made) is Implement.permanent[made]
+        assert is_temporary(made) and not is_temporary(text)
+        assert implementation(len) is None
+
+        def fail(self, func):
+            raise AssertionError('weak registry used on the hot path')
+
+        monkeypatch.setattr(FunctionRegistry, '_lookup', fail)
+        monkeypatch.setattr(FunctionSet, '_lookup', fail)
+        assert text('[a]', fill='red') == '#text([a], fill: red)'
+        assert made('[a]', bad=1) == '#made([a], bad: 1)'
+        assert set_(text, fill='red') == '#set text(fill: red)'
+        assert table(text) == '#table(text)'
+
+    def test_wrappers_do_not_inherit_registration(self):
+        import functools
+
+        from typstpy._core.registry import implementation, is_temporary
+        from typstpy.customizations import normal as normal_factory
+        from typstpy.std import image
+
+        made = normal_factory('wrapped_made')
+
+        @functools.wraps(text)
+        def wrapped_text(*args, **kwargs):
+            return text(*args, **kwargs)
+
+        @functools.wraps(made)
+        def wrapped_made(*args, **kwargs):
+            return made(*args, **kwargs)
+
+        assert implementation(wrapped_text) is None
+        assert not is_temporary(wrapped_made) and is_temporary(made)
+        with pytest.warns(UserWarning, match='not been registered'):
+            render_value(wrapped_text)
+        # `deprecated` wraps `image.decode` in a proxy comparing equal to it.
+        assert implementation(image.decode) is Implement.permanent[image.decode]
+
+    def test_concurrent_registration_while_rendering(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def register(index):
+            functions = []
+            for i in range(50):
+
+                @temporary
+                @implement(f'f{index}_{i}')
+                def func():
+                    return ''
+
+                functions.append(func)
+            return functions
+
+        def render(_):
+            for _ in range(50):
+                assert len(list(Implement.permanent.items())) > 0
+                assert text('[a]', fill='red') == '#text([a], fill: red)'
+            return []
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(lambda i: (register if i % 2 else render)(i), range(16))
+            )
+        registered = [func for functions in results for func in functions]
+        assert len(registered) == 8 * 50
+        assert all(func in Implement.permanent for func in registered)
+        assert all(func in Implement.temporary for func in registered)
+        assert Implement.permanent[registered[0]].original_name == 'f1_0'
+
+
+class TestContent:
+    def test_deferred_calls_match_eager_strings(self):
+        def build():
+            cells = [f'[{i}]' for i in range(4)]
+            return pad(block(figure(table(*cells, columns=2))), x='1em')
+
+        eager = build()
+        with deferred():
+            lazy = build()
+
+        assert isinstance(lazy, Content)
+        assert lazy == eager
+        assert str(lazy) == eager
+
+    def test_deferred_keeps_protocol_variants_equal(self):
+        calls = [
+            lambda: demo('[a]', fill=pad('[b]')),
+            lambda: demo_pos(1, demo_pos(2)),
+            lambda: demo_method(demo_pos(1), '50%', tone='warm'),
+            lambda: demo_pre('[a]', demo('[b]'), gap='1em'),
+            lambda: demo_post(('[a]', '[b]')),
+        ]
+        for call in calls:
+            eager = call()
+            with deferred():
+                assert call() == eager
+
+    def test_concatenation_with_strings(self):
+        content = Content('#pad(', Content('[a]'), ')')
+
+        assert '#set text(fill: red)\n' + content == ('#set text(fill: red)\n#pad([a])')
+        assert str(content + '\n') == '#pad([a])\n'
+        assert render_value(content) == 'pad([a])'
+
+    def test_deep_nesting_flattens_without_recursion(self):
+        with deferred():
+            content = '[x]'
+            for _ in range(5000):
+                content = block(content)
+
+        source = str(content)
+        assert source.startswith('#block(block(')
+        assert source.endswith('[x]' + ')' * 5000)
+
+    def test_render_into_streams_large_series_without_flattening(self):
+        cells = [f'[{i}]' for i in range(1000)]
+        eager = table(*cells, columns=('1fr', '2fr'), inset={'x': '1em'})
+        with deferred():
+            lazy = table(*cells, columns=('1fr', '2fr'), inset={'x': '1em'})
+
+        pieces = []
+
+        class Writer:
+            def write(self, s):
+                pieces.append(s)
+
+        lazy.render_into(Writer())
+        assert ''.join(pieces) == eager
+        assert max(map(len, pieces)) < 20
+
+    def test_iterator_children_are_consumed_while_writing(self):
+        produced = []
+
+        def rows():
+            for i in range(3):
+                produced.append(i)
+                yield f'[{i}]'
+
+        with deferred():
+            lazy = table(rows(), columns=2)
+        assert produced == []
+
+        pieces = []
+
+        class Writer:
+            def write(self, s):
+                pieces.append((s, len(produced)))
+
+        lazy.render_into(Writer())
+        assert ''.join(s for s, _ in pieces) == '#table(columns: 2, [0], [1], [2])'
+        assert ('[2]', 3) in pieces and ('[0]', 1) in pieces
+        with pytest.raises(RuntimeError, match='buffer=True'):
+            str(lazy)
+
+    def test_iterator_children_are_kept_by_buffered_writes(self):
+        expected = '#table(columns: 2, [0], [1], [2])'
+        with deferred():
+            compared = table(iter(['[0]', '[1]', '[2]']), columns=2)
+            printed = table(iter(['[0]', '[1]', '[2]']), columns=2)
+            mismatched = table(iter(['[0]', '[1]', '[2]']), columns=2)
+
+        assert compared == expected
+        assert hash(compared) == hash(expected)
+        assert str(compared) == expected
+        assert str(printed) == str(printed) == expected
+        assert repr(printed) == f'Content({expected!r})'
+        assert mismatched != '#table(columns: 2, [9])'
+        with StringIO() as stream:
+            mismatched.render_into(stream)
+            assert stream.getvalue() == expected
+
+    def test_iterator_children_separators(self):
+        @implement('demo', spread_single=True)
+        def demo(*children, gap='0pt'):
+            return pre_series(demo, *children, gap=gap)
+
+        for children, expected in [
+            (['1', '2'], '#demo(1, 2, gap: 1em)'),
+            ([], '#demo(gap: 1em)'),
+        ]:
+            assert demo(iter(children), gap='1em') == expected
+            with deferred():
+                assert demo(iter(children), gap='1em') == expected
+        with deferred():
+            assert table(iter([]), columns=2) == '#table(columns: 2)'
+            assert table(iter([])) == '#table()'
+
+    def test_empty_content_is_falsy(self):
+        assert not Content()
+        assert not Content('', Content(''))
+        assert Content('', 'a')
+
+
+class TestRenderCache:
+    def test_hits_and_misses_are_counted(self):
+        with render_cache() as cache:
+            assert render_value(('1fr', '2fr')) == '(1fr, 2fr)'
+            assert render_value(('1fr', '2fr')) == '(1fr, 2fr)'
+            assert render_content(('1fr', '2fr')) == '1fr, 2fr'
+
+        info = cache.info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+    def test_keys_distinguish_equal_values_of_different_types(self):
+        with render_cache():
+            assert render_value((1, 0.0)) == '(1, 0.0)'
+            assert render_value((True, -0.0)) == '(true, -0.0)'
+            assert render_value((1.0, 0)) == '(1.0, 0)'
+
+    def test_mapping_proxy_defaults_are_cached(self):
+        value = MappingProxyType({'amount': '0pt', 'all': False})
+        with render_cache() as cache:
+            render_value(value)
+            assert render_value(value) == '(amount: 0pt, all: false)'
+
+        assert cache.info().hits == 1
+
+    def test_unhashable_values_bypass_the_cache(self):
+        with render_cache() as cache:
+            render_value((['1fr'], {'x': '1em'}))
+
+        assert cache.info() == (0, 0, 1024, 0)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = RenderCache(maxsize=2)
+        with render_cache(cache):
+            render_value(('a',))
+            render_value(('b',))
+            render_value(('a',))
+            render_value(('c',))
+            render_value(('b',))
+
+        assert cache.info() == (1, 4, 2, 2)
+
+    def test_process_wide_cache_is_used_outside_scopes(self):
+        cache = RenderCache()
+        previous = set_render_cache(cache)
+        try:
+            render_value(('a',))
+            render_value(('a',))
+        finally:
+            set_render_cache(previous)
+
+        assert cache.info().hits == 1
+        cache.clear()
+        assert cache.info() == (0, 0, 1024, 0)
+
+    def test_maxsize_must_be_positive(self):
+        with pytest.raises(ValueError):
+            RenderCache(maxsize=0)
+
+
+class TestNumpy:
+    @pytest.fixture
+    def np(self):
+        return pytest.importorskip('numpy')
+
+    def test_scalars_render_like_python_scalars(self, np):
+        assert render_value(np.float64(1.5)) == '1.5'
+        assert render_value(np.float32(0.1)) == '0.1'
+        assert render_value(np.int64(3)) == '3'
+        assert render_value(np.bool_(True)) == 'true'
+        assert render_value((np.uint8(1), np.bool_(False))) == '(1, false)'
+
+    def test_arrays_render_as_nested_sequences(self, np):
+        assert render_value(np.arange(3)) == '(0, 1, 2)'
+        assert render_value(np.arange(6).reshape(2, 3)) == '((0, 1, 2), (3, 4, 5))'
+        assert render_content(np.array([True, False])) == 'true, false'
+        assert render_value(np.array([0.5, -0.0])) == '(0.5, -0.0)'
+        assert render_value(np.array(['#a', 'b'])) == '(a, b)'
+        assert render_value(np.array(2.5)) == '2.5'
+
+    def test_empty_arrays_render_as_empty_sequences(self, np):
+        assert render_value(np.array([])) == '()'
+        assert render_value(np.zeros((2, 0))) == '((), ())'
+
+    def test_float_arrays_match_tuple_rendering(self, np):
+        values = np.linspace(0, 1, 101)
+        assert render_value(values) == render_value(tuple(values.tolist()))
+
+    def test_array_keywords_are_rendered_instead_of_compared(self, np):
+        assert demo(fill=np.arange(2)) == '#demo(fill: (0, 1))'
+        assert demo(outlined=np.bool_(False)) == '#demo(outlined: false)'
+
+    def test_single_array_child_is_spread(self, np):
+        assert table(np.array(['[a]', '[b]'])) == '#table(..([a], [b]))'
+        assert table(*np.arange(2)) == '#table(0, 1)'
+
+
+class TestNumberFormat:
+    @pytest.mark.parametrize(
+        ('policy', 'value', 'expected'),
+        [
+            (NumberFormat(decimals=2), 0.1 + 0.2, '0.30'),
+            (NumberFormat(decimals=0), 2.5, '2'),
+            (NumberFormat(decimals=0), 3.0, '3'),
+            (NumberFormat(significant=2), 123456.0, '1.2e5'),
+            (NumberFormat(significant=2), 10.0, '10.0'),
+            (NumberFormat(significant=2, notation='fixed'), 1.5e-7, '0.00000015'),
+            (NumberFormat(notation='fixed'), 1e20, '100000000000000000000.0'),
+            (NumberFormat(notation='scientific'), 1234.5, '1.2345e3'),
+            (NumberFormat(decimals=1, notation='scientific'), 0.00012, '1.2e-4'),
+            (NumberFormat(decimals=2), float('nan'), 'nan'),
+        ],
+    )
+    def test_format_renders_typst_floats(self, policy, value, expected):
+        assert policy.format(value) == expected
+
+    def test_grouping_applies_to_markup_only(self):
+        policy = NumberFormat(decimals=1, grouping="'")
+
+        assert policy.format(-1234567.89) == '-1234567.9'
+        assert policy.format(-1234567.89, markup=True) == "-1'234'567.9"
+        assert policy.format_many([1234.0, -0.25], markup=True) == ["1'234.0", '-0.2']
+
+    def test_format_many_matches_format(self):
+        values = [0.1 + 0.2, 1e-9, -3.0, 12345.678, float('inf')]
+        for policy in [
+            NumberFormat(decimals=3),
+            NumberFormat(decimals=0),
+            NumberFormat(significant=4),
+            NumberFormat(notation='scientific'),
+        ]:
+            assert policy.format_many(values) == [policy.format(v) for v in values]
+
+    def test_invalid_options_raise(self):
+        with pytest.raises(ValueError):
+            NumberFormat(decimals=1, significant=1)
+        with pytest.raises(ValueError):
+            NumberFormat(notation='engineering')  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            with number_format(NumberFormat(), decimals=1):
+                pass
+
+    def test_scope_applies_to_calls_and_cached_values(self):
+        values = (0.1 + 0.2, 2.0)
+        with render_cache():
+            with number_format(decimals=2):
+                assert table(*values, columns=values) == (
+                    '#table(columns: (0.30, 2.00), 0.30, 2.00)'
+                )
+            assert render_value(values) == '(0.30000000000000004, 2.0)'
+
+    def test_numpy_arrays_and_columns_follow_policy(self):
+        np = pytest.importorskip('numpy')
+        with number_format(decimals=1, grouping=','):
+            assert render_value(np.array([1234.56, 2.0])) == '(1234.6, 2.0)'
+            assert render_value(np.float32(0.25)) == '0.2'
+            assert (
+                table.from_columns(
+                    {'x': np.array([1234.56]), 'y': [1234.56]}, header=False
+                )
+                == '#table(columns: 2, [1,234.6], [1,234.6])'
+            )
+
+
+class TestMarkup:
+    def test_escape_markup_escapes_every_special_character(self):
+        assert escape_markup(MARKUP_SPECIALS) == ''.join(
+            f'\\{char}' for char in MARKUP_SPECIALS
+        )
+        assert escape_markup('plain text, 50%') == 'plain text, 50%'
+        assert escape_markup('say "hi", don\'t') == 'say \\"hi\\", don\'t'
+
+    def test_escape_markup_many_matches_escape_markup(self):
+        texts = ['a#b', '', '[x]', 'back\\slash', 'nul\x00byte']
+        assert escape_markup_many(texts) == [escape_markup(text) for text in texts]
+        assert escape_markup_many(texts[:4]) == [escape_markup(t) for t in texts[:4]]
+        assert escape_markup_many([]) == []
+
+    def test_escaped_wraps_escaped_text(self):
+        assert escaped('*not bold*') == '[\\*not bold\\*]'
+        assert text(escaped('#strong')) == '#text([\\#strong])'
+
+    def test_core_submodules_are_not_shadowed(self):
+        import typstpy._core as core
+
+        for name in ['content', 'formatting', 'markup', 'profiling', 'registry']:
+            assert isinstance(getattr(core, name), ModuleType), name
+
+    def test_from_columns_escapes_strings(self):
+        assert table.from_columns({'a_b': ['#x', '1'], 'n': ['y]', 2]}) == (
+            '#table(columns: 2, table.header([a\\_b], [n]), [\\#x], [y\\]], [1], [2])'
+        )
+
+
 class TestRenderValue:
     def test_bool_renders_lowercase(self):
         assert render_value(True) == 'true'
@@ -185,6 +861,52 @@ class TestRenderValue:
             assert len(w) == 1
             assert 'not been registered' in str(w[0].message)
 
+    @pytest.mark.parametrize(
+        'value',
+        [
+            'hello',
+            None,
+            ['1fr', ('2fr', {'x': '1em'})],
+            {},
+            {'fill': 'red', 'column_gutter': ('1em', True)},
+        ],
+    )
+    def test_render_into_matches_render_value(self, value):
+        with StringIO() as stream:
+            _to_expr(value).render_into(stream)
+            assert stream.getvalue() == render_value(value)
+        with StringIO() as stream:
+            _to_expr(value).render_content_into(stream)
+            assert stream.getvalue() == render_content(value)
+
+    @pytest.mark.parametrize(
+        'value',
+        [
+            0,
+            -1.5,
+            float('inf'),
+            True,
+            None,
+            '#red',
+            (1, 2.5, '#a', None, False),
+            ['1fr', ('2fr', {'x_y': '1em'})],
+            {'fill': 'red', 'column_gutter': ['1em']},
+            MappingProxyType({'amount': '0pt', 'all': False}),
+            MappingProxyType({}),
+        ],
+    )
+    def test_exact_type_fast_path_matches_ir(self, value):
+        assert render_value(value) == _to_expr(value).render()
+        assert render_content(value) == _to_expr(value).render_content()
+
+    def test_subclasses_fall_back_to_singledispatch(self):
+        class Flag(int):
+            def __str__(self):
+                return 'flag'
+
+        assert render_value(Flag(1)) == 'flag'
+        assert render_value((Flag(1),)) == '(flag)'
+
     def test_placeholder_object_renders_str(self):
         assert render_value(42) == '42'
         assert render_value(3.14) == '3.14'
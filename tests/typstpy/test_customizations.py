@@ -1,11 +1,22 @@
+import inspect
+import multiprocessing
+import operator
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from typstpy._core import Implement, unchecked
 from typstpy.customizations import (
     call_,
+    declare,
     instance,
     normal,
     positional,
     post_series,
     pre_series,
 )
+from typstpy.std import text
 
 
 def test_call_factory_renders_positional_args_and_keywords():
@@ -89,3 +100,122 @@ def test_post_series_factory_spreads_single_sequence_for_custom_label():
     demo_series = post_series('demo.series')
 
     assert demo_series(('[a]', '[b]')) == '#demo.series(..([a], [b]))'
+
+
+def test_factories_return_interned_functions():
+    pad = normal('interned_pad')
+    registered = len(Implement.temporary)
+
+    assert all(normal('interned_pad') is pad for _ in range(100))
+    assert len(Implement.temporary) == registered
+    assert positional('interned_pad') is not pad
+    assert pre_series('interned_pad') is not post_series('interned_pad')
+    assert instance('lighten') is instance('lighten')
+    assert normal.__name__ == 'normal' and 'Function factory' in normal.__doc__
+
+
+def test_factories_intern_across_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        functions = list(pool.map(lambda _: call_('threaded_call'), range(64)))
+
+    assert all(func is functions[0] for func in functions)
+
+
+def test_factory_functions_pickle_as_factory_calls():
+    pad = normal('pickled_pad')
+    grid = pre_series('subpar.grid')
+
+    assert pickle.loads(pickle.dumps(pad)) is pad
+    assert pickle.loads(pickle.dumps(grid)) is grid
+    assert repr(grid) == "pre_series('subpar.grid')"
+    assert grid.__doc__ == (
+        "Interface of `subpar.grid` in typst, made by `pre_series('subpar.grid')`."
+    )
+    assert str(inspect.signature(positional('rgb'))).startswith('(*args')
+
+
+def test_factory_and_std_functions_render_in_spawned_workers():
+    context = multiprocessing.get_context('spawn')
+    tasks = [
+        (normal('worker_pad'), ('[a]',), {'x': '1em'}),
+        (post_series('worker_table'), (['[a]', '[b]'],), {'columns': 2}),
+        (text, ('[a]',), {'fill': 'red'}),
+    ]
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        results = [
+            pool.submit(operator.call, func, *args, **kwargs).result()
+            for func, args, kwargs in tasks
+        ]
+
+    assert results == [func(*args, **kwargs) for func, args, kwargs in tasks]
+
+
+def test_declare_elides_defaults_and_rejects_unknown_fields():
+    mitex = declare('declared_mitex', {'block': True, 'numbering': None})
+
+    assert mitex('`x`') == '#declared_mitex(`x`)'
+    assert mitex('`x`', block=True) == '#declared_mitex(`x`)'
+    assert (
+        mitex('`x`', numbering='"(1)"', block=False)
+        == '#declared_mitex(`x`, block: false, numbering: "(1)")'
+    )
+    with pytest.raises(TypeError, match='size'):
+        mitex('`x`', size='2em')
+    assert [
+        (parameter.name, parameter.default)
+        for parameter in inspect.signature(mitex).parameters.values()
+        if parameter.kind is parameter.KEYWORD_ONLY
+    ] == [('block', True), ('numbering', None)]
+
+
+def test_declare_checks_choices():
+    badge = declare(
+        'declared_badge', {'tone': '"info"'}, choices={'tone': ('"info"', '"warn"')}
+    )
+
+    assert badge('[a]', tone='"warn"') == '#declared_badge([a], tone: "warn")'
+    with pytest.raises(ValueError, match='tone'):
+        badge('[a]', tone='"error"')
+    with unchecked():
+        assert badge('[a]', tone='"error"') == '#declared_badge([a], tone: "error")'
+    assert Implement.permanent[badge].choices == {'tone': {'"info"', '"warn"'}}
+    with pytest.raises(ValueError, match='not one of its choices'):
+        declare('declared_badge', {'tone': '"none"'}, choices={'tone': ('"info"',)})
+
+
+def test_declare_supports_protocols():
+    grid = declare('declared_grid', {'columns': 1}, protocol='pre_series')
+
+    assert grid('[a]', '[b]', columns=2) == '#declared_grid([a], [b], columns: 2)'
+    assert grid(['[a]', '[b]']) == '#declared_grid(..([a], [b]))'
+    assert (
+        declare('lighten', {'amount': '0%'}, protocol='instance')('red', amount='10%')
+        == 'red.lighten(amount: 10%)'
+    )
+    with pytest.raises(ValueError, match='protocol'):
+        declare('declared_grid', {}, protocol='unknown')
+    with pytest.raises(ValueError, match='keyword'):
+        declare('declared_grid', {'not-valid': 1})
+
+
+def test_declared_functions_are_interned_permanent_and_picklable():
+    keywords = {'fill': None, 'inset': {}}
+    card = declare('declared_card', keywords)
+    registered = len(Implement.temporary)
+
+    assert declare('declared_card', dict(keywords)) is card
+    assert declare('declared_card', {'fill': None}) is not card
+    assert len(Implement.temporary) == registered
+    assert card in Implement.permanent and card not in Implement.temporary
+    assert pickle.loads(pickle.dumps(card)) is card
+    assert repr(card) == "declare('declared_card', {'fill': None, 'inset': {}})"
+    assert '`declare(' in card.__doc__
+    badge = declare(
+        'declared_tag', {'tone': 1}, protocol='instance', choices={'tone': [1, 2]}
+    )
+    assert repr(badge) == (
+        "declare('declared_tag', {'tone': 1}, protocol='instance', "
+        "choices={'tone': [1, 2]})"
+    )
@@ -10,7 +10,12 @@ from scripts.generate_readme import (
     render_implement_table,
     replace_generated_section,
 )
-from typstpy._docs import ExampleBlock, ImplementRecord, extract_examples
+from typstpy._docs import (
+    ExampleBlock,
+    ImplementRecord,
+    collect_choice_schemas,
+    extract_examples,
+)
 
 
 def test_extract_examples_stops_at_next_top_level_section() -> None:
@@ -70,6 +75,14 @@ def test_extract_examples_returns_none_without_examples_section() -> None:
     assert extract_examples(sample) is None
 
 
+def test_choice_schemas_are_exported_from_implement_records() -> None:
+    schemas = collect_choice_schemas()
+
+    assert schemas['std.stack'] == {'dir': ['btt', 'ltr', 'rtl', 'ttb']}
+    assert schemas['std.text']['cjk_latin_spacing'] == ['auto', 'none', None]
+    assert 'std.block' not in schemas
+
+
 def test_readme_renderers_use_structured_docs_data() -> None:
     table = render_implement_table(
         [ImplementRecord('std.demo', 'demo', 'https://example.test/demo', '0.x')]
@@ -1,6 +1,7 @@
+import sys
 from textwrap import dedent
 
-from typstpy import Document
+from typstpy import Document, NumberFormat, deferred
 from typstpy.std import (
     emph,
     figure,
@@ -10,6 +11,7 @@ from typstpy.std import (
     par,
     set_,
     show_,
+    table,
     text,
 )
 
@@ -83,3 +85,134 @@ def test_document_renders_complete_typst_source():
     ).strip()
 
     assert str(doc) == expected
+
+
+def test_document_writes_deferred_content_once():
+    doc = Document()
+    with deferred():
+        doc.add_content(heading(lorem(20)))
+        doc.add_content(par(emph('[Body]')))
+
+    assert str(doc) == '#heading(lorem(20))\n\n#par(emph([Body]))'
+
+
+def test_document_render_into_writes_the_same_source(tmp_path):
+    doc = Document()
+    doc.add_import(import_('"module.typ"', 'foo'))
+    doc.add_set_rule(set_(heading, outlined=True))
+    with deferred():
+        doc.add_content(heading(lorem(20)))
+    path = tmp_path / 'main.typ'
+
+    with path.open('w', encoding='utf-8') as file:
+        doc.render_into(file)
+
+    assert path.read_text(encoding='utf-8') == str(doc)
+
+
+def test_size_report_attributes_every_byte_to_a_section():
+    doc = Document()
+    doc.add_import(import_('"module.typ"', 'foo'))
+    doc.add_import(import_('"other.typ"'))
+    doc.add_set_rule(set_(text, fill='red'))
+    doc.add_show_rule(show_(heading, 'it => it'))
+    doc.add_content(heading('[Über]'))
+    doc.add_content('[Body]')
+
+    report = doc.size_report()
+
+    assert report.total == len(str(doc).encode())
+    assert sum(report.sections.values()) == report.total
+    assert report.functions == {
+        'import': len('#import "module.typ": foo') + len('#import "other.typ"'),
+        'heading': len('#show heading: it => it') + len('#heading([Über])'.encode()),
+        'text': len('#set text(fill: red)'),
+        '<markup>': len('[Body]'),
+    }
+    assert report.sites == {'<untracked>': sum(report.functions.values())}
+
+
+def test_size_report_tracks_call_sites_and_deferred_content():
+    doc = Document(track_sources=True)
+    with deferred():
+        body = figure(emph(lorem(20)), caption='[Caption]')
+    line = sys._getframe().f_lineno
+    doc.add_content(body)
+    doc.add_content(par('[Text]'))
+
+    report = doc.size_report()
+
+    size = len(str(body))
+    first, second = (f'{__file__}:{line + offset}' for offset in (1, 2))
+    assert report.functions == {
+        'figure': len('#figure(, caption: [Caption])'),
+        'lorem': len('lorem(20)'),
+        'emph': len('emph()'),
+        'par': len('#par([Text])'),
+    }
+    assert report.sites == {first: size, second: len('#par([Text])')}
+    assert report.to_json()['total'] == report.total == len(str(doc))
+    assert report.summary(limit=1).splitlines() == [
+        f'total: {report.total} bytes',
+        'sections:',
+        f'  {report.total:>12} {1:>7.1%}  contents',
+        'functions:',
+        f'  {29:>12} {29 / report.total:>7.1%}  figure',
+        'call sites:',
+        f'  {size:>12} {size / report.total:>7.1%}  {first}',
+    ]
+
+
+def test_document_with_iterator_children_renders_twice():
+    doc = Document()
+    with deferred():
+        doc.add_content(table(iter(['[a]', '[b]']), columns=2))
+
+    assert str(doc) == str(doc) == '#table(columns: 2, [a], [b])'
+
+
+def test_document_number_format_applies_while_rendering():
+    doc = Document(number_format=NumberFormat(decimals=1))
+    with deferred():
+        doc.add_content(table(iter([1 / 3, 2.0])))
+    with doc.formatting():
+        doc.add_content(table(1 / 3))
+
+    assert str(doc) == '#table(0.3, 2.0)\n\n#table(0.3)'
+
+
+def test_size_report_charges_nested_calls_and_keeps_streams():
+    doc = Document()
+    with deferred():
+        cells = table(iter(['"a(b"', '`)`', '[x\\]]', 'strong([y])']), columns=2)
+        doc.add_content(figure(cells, caption='[(]'))
+    doc.add_content('Total: #text(fill: red)[*1*] done')
+
+    report = doc.size_report()
+
+    source = str(doc)
+    assert report.total == len(source)
+    assert report.functions == {
+        'figure': len('#figure(, caption: [(])'),
+        'table': len('table(columns: 2, "a(b", `)`, [x\\]], )'),
+        'strong': len('strong([y])'),
+        'text': len('#text(fill: red)'),
+        '<markup>': len('Total: [*1*] done'),
+    }
+
+
+def test_size_report_renders_with_the_document_number_format():
+    def build():
+        doc = Document(number_format=NumberFormat(decimals=2))
+        with deferred():
+            doc.add_content(table(iter([1 / 3, 2 / 3])))
+        return doc
+
+    rendered_first = build()
+    source = str(rendered_first)
+    reported_first = build()
+    report = reported_first.size_report()
+
+    assert source == '#table(0.33, 0.67)'
+    assert str(reported_first) == source
+    assert report.total == rendered_first.size_report().total == len(source)
@@ -0,0 +1,105 @@
+import tracemalloc
+
+import pytest
+
+from typstpy import Document, deferred
+from typstpy.pytest_plugin import document_memory  # noqa: F401
+from typstpy.std import heading, par, set_, table, text
+
+
+def test_batches_report_retained_bytes_per_section_and_function(document_memory):  # noqa: F811
+    document = Document()
+    tracker = document_memory(document)
+    with tracker.batch('rules'):
+        document.add_set_rule(set_(text, size='9pt'))
+    with tracker.batch('body'):
+        for i in range(200):
+            document.add_content(heading(f'[Section {i}]'))
+            document.add_content(par(f'[Paragraph {i} ' + 'x' * 200 + ']'))
+    with tracker.batch('body'):
+        document.add_content(table(*(f'[{i}]' for i in range(50)), columns=5))
+
+    report = tracker.report()
+
+    assert list(report.sections) == ['body', 'rules']
+    assert report.sections['body'] > 200 * 200
+    assert list(report.functions)[:2] == ['par', 'heading']
+    assert report.functions['par'] > 200 * 200
+    assert report.peak >= report.sections['body'] // 2
+    assert report.render_peak == 0
+
+
+def test_render_records_peak_and_returns_source(document_memory):  # noqa: F811
+    document = Document()
+    with deferred():
+        for i in range(100):
+            document.add_content(par(f'[Paragraph {i}]'))
+    tracker = document_memory(document)
+
+    source = tracker.render()
+
+    assert source == str(document)
+    report = tracker.report()
+    assert report.render_peak >= len(source)
+    assert report.peak == report.render_peak
+    assert report.summary().splitlines()[:3] == [
+        f'peak: {report.peak} bytes',
+        f'render peak: {report.render_peak} bytes',
+        'sections:',
+    ]
+
+
+def test_tracker_only_stops_tracing_it_started():
+    document = Document()
+    with document.track_memory() as tracker:
+        tracker.render()
+        assert tracemalloc.is_tracing()
+    assert not tracemalloc.is_tracing()
+
+    tracemalloc.start(16)
+    try:
+        with document.track_memory() as tracker:
+            tracker.render()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_batch_records_even_when_it_raises(document_memory):  # noqa: F811
+    document = Document()
+    tracker = document_memory(document)
+    with pytest.raises(ZeroDivisionError):
+        with tracker.batch('broken'):
+            document.add_content(par('[x]' * 1000))
+            1 / 0
+    with tracker.batch('body'):
+        document.add_content(par('[y]'))
+
+    assert set(tracker.report().sections) == {'broken', 'body'}
+    assert tracker.report().sections['broken'] > 3000
+
+
+def test_tracker_warns_about_shallow_tracing():
+    tracemalloc.start(1)
+    try:
+        with Document().track_memory() as tracker:
+            with pytest.warns(RuntimeWarning, match='1 frame'):
+                tracker.render()
+            tracker.render()
+    finally:
+        tracemalloc.stop()
+
+
+def test_factory_made_functions_are_counted_together(document_memory):  # noqa: F811
+    from typstpy.customizations import declare, normal
+
+    badge = declare('memory_badge', {'tone': None})
+    card = normal('memory_card')
+    document = Document()
+    tracker = document_memory(document)
+    with tracker.batch('body'):
+        for i in range(200):
+            document.add_content(badge(f'[Badge {i} ' + 'x' * 200 + ']', tone=i))
+            document.add_content(card(f'[Card {i} ' + 'y' * 200 + ']'))
+
+    assert tracker.report().functions['<customizations>'] > 2 * 200 * 200
@@ -1,10 +1,29 @@
+import importlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 import typstpy
 from typstpy import std, subpar
 from typstpy.document import Document
 
+SRC_ROOT = Path(__file__).resolve().parents[2] / 'src'
+
 
 def test_top_level_package_exports_document_and_modules():
-    assert typstpy.__all__ == ['std', 'subpar', 'Document']
+    assert typstpy.__all__ == [
+        'std',
+        'subpar',
+        'Content',
+        'Document',
+        'NumberFormat',
+        'deferred',
+        'number_format',
+        'profile',
+        'set_unchecked',
+        'unchecked',
+    ]
     assert typstpy.Document is Document
     assert typstpy.std is std
     assert typstpy.subpar is subpar
@@ -22,3 +41,68 @@ def test_attached_functions_are_available_from_std_exports():
     assert std.table.cell('[Hi]') == '#table.cell([Hi])'
     assert std.color.rgb(255, 255, 255) == '#rgb(255, 255, 255)'
     assert std.color.luma('50%') == '#luma(50%)'
+
+
+IMPORT_TIME_BUDGET_US = 400_000
+"""Generous ceiling on the cumulative `-X importtime` of `import typstpy`, to catch eager imports creeping back."""
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, 'PYTHONPATH': str(SRC_ROOT)},
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix('import time:').split('|')
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+def test_import_typstpy_stays_lazy_and_within_budget():
+    times = _import_times('import typstpy')
+    eager = sorted(
+        name
+        for name in times
+        if name.startswith(('typstpy.std.', 'typstpy.subpar', 'deprecated'))
+    )
+    assert eager == []
+    assert times['typstpy'] < IMPORT_TIME_BUDGET_US
+
+
+def test_std_submodules_load_on_first_access():
+    result = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            'import sys, typstpy.std as std; std.pad; '
+            'print(sorted(m for m in sys.modules if m.startswith("typstpy.std.")))',
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, 'PYTHONPATH': str(SRC_ROOT)},
+    )
+    # layout imports text and visualize itself, but model is never needed.
+    assert result.stdout.strip() == str(
+        ['typstpy.std.layout', 'typstpy.std.text', 'typstpy.std.visualize']
+    )
+
+
+def test_std_mirrors_submodule_exports():
+    for submodule, names in std._EXPORTS.items():
+        module = importlib.import_module(f'typstpy.std.{submodule}')
+        assert tuple(module.__all__) == names
+
+
+def test_std_keeps_functions_named_after_submodules():
+    # The import system binds a submodule on its package like this once it is loaded.
+    std.text = sys.modules['typstpy.std.text']
+    std.layout = sys.modules['typstpy.std.layout']
+    assert std.text is sys.modules['typstpy.std.text'].text
+    assert std.layout is sys.modules['typstpy.std.layout'].layout
+    assert set(dir(std)) >= set(std.__all__)